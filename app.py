@@ -5,7 +5,7 @@ from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 import requests
-from bs4 import BeautifulSoup
+import codecs
 import os
 import re 
 import traceback
@@ -16,13 +16,32 @@ import json
 import base64
 import io
 import tempfile
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
 from functools import wraps
+from urllib.parse import urlparse
 import firebase_admin
 from firebase_admin import credentials, auth as firebase_auth
-from challenge7_backend import RealWorldOSINTHandler
+from challenge7_backend import RealWorldOSINTHandler, AnnotatedResults
+from risk_rules import RISK_RULES, CompiledRiskRules, RiskRulesError
+from timestamps import normalize_timestamps, latest_activity, days_since
+from breach_catalog import BREACH_CATALOG
+from breach_lookup import BREACH_LOOKUP, BREACH_JOBS, BreachJob, start_breach_job, BULK_MAX_ACCOUNTS
+from entity_index import ENTITY_INDEX, CONSOLIDATED_KINDS
+from http_client import HTTP, HttpClient, run_parallel, time_left
+from dns_cache import DNS_CACHE, install as install_dns_cache
+from pagination import PageStream, deep_caps
+from body_scan import probe_page, probe_regex, MarkerScanner, body_encoding, CHUNK_SIZE
+from html_articles import ArticleExtractor
+from platform_catalog import PLATFORM_CATALOG, CompiledPlatformCatalog, SiteRule
+from deadline import RequestDeadline, call_timeout, parse_deadline_seconds
+from collector_registry import register_collector, select_collectors, run_collectors, CollectionContext
+from sweep import (SWEEP_JOBS, SweepJob, start_sweep, SWEEP_DEFAULT_CANDIDATES, SWEEP_MAX_CANDIDATES,
+                   SWEEP_MAX_ACTIVE, CONFIDENCE_RANK)
 
 load_dotenv()
 from visual import visual_bp
@@ -123,6 +142,30 @@ HUGGINGFACE_API_KEY = os.environ.get('HUGGINGFACE_API_KEY', '')
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN', '')
 HIBP_API_KEY = os.environ.get('HIBP_API_KEY', '')
 
+# Hosts outside the platform catalog that collectors and AI providers call
+API_HOSTS = (
+    'api.github.com', 'gitlab.com', 'www.reddit.com', 'x.com', 'haveibeenpwned.com', 'api.pwnedpasswords.com',
+    'api.groq.com', 'generativelanguage.googleapis.com', 'api.anthropic.com', 'api-inference.huggingface.co',
+)
+DNS_PREWARM = os.environ.get('DNS_PREWARM', '1') == '1'
+
+# Wall-clock budget for one collector's sub-requests
+COLLECTOR_BUDGET = float(os.environ.get('COLLECTOR_BUDGET_SECONDS', '15'))
+# Same, for collectors paging through full inventories in deep mode
+DEEP_COLLECTOR_BUDGET = float(os.environ.get('DEEP_COLLECTOR_BUDGET_SECONDS', '60'))
+COLLECTION_MODES = ('fast', 'deep')
+# Whole username sweep, however many catalog sites are probed
+ENUMERATION_BUDGET = float(os.environ.get('ENUMERATION_BUDGET_SECONDS', '12'))
+# Seconds of the request deadline kept back from collection for processing and AI
+AI_RESERVE = float(os.environ.get('ANALYZE_AI_RESERVE_SECONDS', '10'))
+# An AI call with less time than this left is skipped rather than started
+AI_MIN_SECONDS = 3.0
+
+
+def is_timeout_error(error: Exception) -> bool:
+    """requests timeouts and provider SDK ones (e.g. anthropic.APITimeoutError)"""
+    return isinstance(error, requests.Timeout) or 'Timeout' in type(error).__name__
+
 # Determine which AI service to use
 AI_SERVICE = None
 if GROQ_API_KEY:
@@ -137,60 +180,6 @@ elif HUGGINGFACE_API_KEY:
     
 
 
-# ==================== PLATFORM DETECTION RULES ====================
-
-PLATFORM_RULES = {
-    "github": {
-        "url": "https://github.com/{}",
-        "success_codes": [200],
-        "confidence": "HIGH"
-    },
-    "reddit": {
-        "url": "https://www.reddit.com/user/{}/about.json",
-        "success_codes": [200],
-        "confidence": "HIGH",
-        "json_key": "name"
-    },
-    "gitlab": {
-        "url": "https://gitlab.com/{}",
-        "success_codes": [200],
-        "confidence": "HIGH"
-    },
-    "instagram": {
-    "url": "https://www.instagram.com/{}/",
-    "success_codes": [200],
-    "confidence": "LOW",
-    "must_not_contain": "Sorry, this page isn't available"
-    },
-    "youtube": {
-    "url": "https://www.youtube.com/@{}",
-    "success_codes": [200],
-    "confidence": "LOW",
-    "must_not_contain": "This channel does not exist"
-    },
-    "facebook": {
-    "url": "https://www.facebook.com/{}",
-    "success_codes": [200],
-    "confidence": "LOW",
-    "must_not_contain": "This content isn't available"
-    },
-    "linkedin": {
-    "url": "https://www.linkedin.com/in/{}/",
-    "success_codes": [200],
-    "confidence": "LOW",
-    "must_not_contain": "This page doesn't exist"
-    },
-   "twitter": {
-    "url": "https://x.com/{}",
-    "success_codes": [200],
-    "confidence": "LOW",
-    "must_not_contain": "This account doesn't exist"
-}
-
-}
-
-
-
 # ==================== RISK ASSESSMENT SYSTEM ====================
 
 class RiskLevel(Enum):
@@ -243,117 +232,19 @@ class RiskAssessment:
     risk_factors: List[str]
     timeline: Optional[str]
     summary: str
+    rules_version: str = ''
+    partial: bool = False  # AI pass skipped or timed out under the request deadline
 
 
 class RiskClassifier:
-    """Classify data into risk categories"""
-    
-    # Sensitivity weights for different data types
-    SENSITIVITY_WEIGHTS = {
-        # Credentials (Highest Risk)
-        'password': 10.0,
-        'password_hash': 9.0,
-        'api_key': 9.5,
-        'access_token': 9.0,
-        'private_key': 10.0,
-        'ssh_key': 9.5,
-        'credential': 9.0,
-        'breach': 9.5,
-        
-        # Personal Identifiers (High Risk)
-        'ssn': 9.5,
-        'social_security': 9.5,
-        'passport': 9.0,
-        'drivers_license': 8.5,
-        'national_id': 8.5,
-        'date_of_birth': 7.5,
-        'dob': 7.5,
-        'full_name': 6.5,
-        'maiden_name': 7.0,
-        
-        # Financial Information (High Risk)
-        'credit_card': 10.0,
-        'bank_account': 9.5,
-        'routing_number': 9.0,
-        'cvv': 10.0,
-        'bitcoin_address': 7.0,
-        
-        # Contact Details (Medium Risk)
-        'email': 5.0,
-        'phone': 6.0,
-        'address': 7.0,
-        'home_address': 7.5,
-        'work_address': 6.0,
-        
-        # Location Data (Medium Risk)
-        'gps_coordinates': 6.5,
-        'location': 5.5,
-        'check_in': 5.0,
-        'geolocation': 6.0,
-        
-        # Behavioral Patterns (Low-Medium Risk)
-        'username': 3.0,
-        'profile': 3.5,
-        'bio': 2.5,
-        'interests': 2.0,
-        'hobby': 2.0,
-        'activity_pattern': 4.0,
-        'browsing_history': 5.5,
-        
-        # Organizational Links (Medium Risk)
-        'employer': 5.0,
-        'company': 4.5,
-        'job_title': 4.0,
-        'work_email': 6.0,
-        'colleagues': 4.0,
-        
-        # Social Connections (Low Risk)
-        'friend': 2.5,
-        'follower': 2.0,
-        'connection': 2.5,
-        'network': 3.0,
-    }
+    """Classify data into risk categories using the active risk rules file"""
     
     @staticmethod
-    def classify_data(data_type: str, value: str, platform: str) -> Dict[str, Any]:
+    def classify_data(data_type: str, value: str, platform: str,
+                      rules: Optional[CompiledRiskRules] = None) -> Dict[str, Any]:
         """Classify data and assign category"""
-        data_lower = data_type.lower()
-        value_lower = str(value).lower()
-        
-        # Determine category
-        category = DataCategory.BEHAVIORAL_PATTERNS.value  # Default
-        base_score = 3.0
-        
-        # Check for credentials
-        if any(term in data_lower for term in ['password', 'credential', 'token', 'key', 'breach']):
-            category = DataCategory.CREDENTIALS.value
-            base_score = 9.0
-        
-        # Check for personal identifiers
-        elif any(term in data_lower for term in ['ssn', 'passport', 'id', 'birth', 'name']):
-            category = DataCategory.PERSONAL_IDENTIFIERS.value
-            base_score = 7.0
-        
-        # Check for contact details
-        elif any(term in data_lower for term in ['email', 'phone', 'address']):
-            category = DataCategory.CONTACT_DETAILS.value
-            base_score = 5.5
-        
-        # Check for location data
-        elif any(term in data_lower for term in ['location', 'gps', 'coordinates', 'geolocation']):
-            category = DataCategory.LOCATION_DATA.value
-            base_score = 6.0
-        
-        # Check for organizational links
-        elif any(term in data_lower for term in ['company', 'employer', 'job', 'work']):
-            category = DataCategory.ORGANIZATIONAL_LINKS.value
-            base_score = 5.0
-        
-        # Get specific weight if available
-        for key, weight in RiskClassifier.SENSITIVITY_WEIGHTS.items():
-            if key in data_lower or key in value_lower:
-                base_score = max(base_score, weight)
-                break
+        rules = rules or RISK_RULES.current()
+        category, base_score = rules.classify(data_type, value)
         
         return {
             'category': category,
@@ -403,32 +294,17 @@ class RiskScorer:
         return min(round(score, 1), 10.0)
     
     @staticmethod
-    def determine_risk_level(score: float) -> RiskLevel:
+    def determine_risk_level(score: float, rules: Optional[CompiledRiskRules] = None) -> RiskLevel:
         """Determine risk level from score"""
-        if score >= 8.5:
-            return RiskLevel.CRITICAL
-        elif score >= 6.5:
-            return RiskLevel.HIGH
-        elif score >= 4.0:
-            return RiskLevel.MEDIUM
-        elif score >= 2.0:
-            return RiskLevel.LOW
-        else:
-            return RiskLevel.MINIMAL
+        rules = rules or RISK_RULES.current()
+        return RiskLevel(rules.risk_level(score))
     
     @staticmethod
-    def assess_exploitability(category: str, platforms: List[str], score: float) -> str:
+    def assess_exploitability(category: str, platforms: List[str], score: float,
+                              rules: Optional[CompiledRiskRules] = None) -> str:
         """Assess how exploitable this data is"""
-        if score >= 8.5:
-            return "Immediate exploitation risk - attackers can use this for account takeover, identity theft, or targeted attacks"
-        elif score >= 6.5:
-            return "High exploitation potential - can be used for social engineering, phishing, or credential stuffing"
-        elif score >= 4.0:
-            return "Moderate exploitation risk - useful for profiling and targeted reconnaissance"
-        elif score >= 2.0:
-            return "Low exploitation potential - primarily useful for social engineering context"
-        else:
-            return "Minimal direct exploitation risk - general public information"
+        rules = rules or RISK_RULES.current()
+        return rules.exploitability[rules.risk_level(score)]
 
 
 class AIRiskAnalyzer:
@@ -437,7 +313,7 @@ class AIRiskAnalyzer:
     def __init__(self, ai_service: str):
         self.service = ai_service
     
-    def analyze_risks(self, collected_data: Dict[str, Any], target: str) -> Dict[str, Any]:
+    def analyze_risks(self, collected_data: Dict[str, Any], target: str, timeout: float = 60) -> Dict[str, Any]:
         """Use AI to analyze OSINT data and provide intelligent risk assessment"""
         
         if not self.service:
@@ -530,7 +406,7 @@ Return your analysis in this JSON format:
 Be thorough but concise. Focus on actionable insights and real security implications."""
 
             # Call appropriate AI service
-            response_text = self._call_ai_service(prompt)
+            response_text = self._call_ai_service(prompt, timeout)
             
             # Parse response
             try:
@@ -547,6 +423,7 @@ Be thorough but concise. Focus on actionable insights and real security implicat
         except Exception as e:
             return {
                 'error': str(e),
+                'timed_out': is_timeout_error(e),
                 'risk_items': [],
                 'overall_assessment': {
                     'score': 0,
@@ -559,20 +436,20 @@ Be thorough but concise. Focus on actionable insights and real security implicat
                 'timeline': 'UNKNOWN'
             }
     
-    def _call_ai_service(self, prompt: str) -> str:
+    def _call_ai_service(self, prompt: str, timeout: float = 60) -> str:
         """Call the appropriate AI service"""
         if self.service == 'groq':
-            return self._call_groq(prompt)
+            return self._call_groq(prompt, timeout)
         elif self.service == 'gemini':
-            return self._call_gemini(prompt)
+            return self._call_gemini(prompt, timeout)
         elif self.service == 'anthropic':
-            return self._call_anthropic(prompt)
+            return self._call_anthropic(prompt, timeout)
         elif self.service == 'huggingface':
-            return self._call_huggingface(prompt)
+            return self._call_huggingface(prompt, timeout)
         else:
             raise Exception(f"Unknown AI service: {self.service}")
     
-    def _call_groq(self, prompt: str) -> str:
+    def _call_groq(self, prompt: str, timeout: float = 60) -> str:
         """Call Groq API"""
         url = "https://api.groq.com/openai/v1/chat/completions"
         headers = {
@@ -585,20 +462,20 @@ Be thorough but concise. Focus on actionable insights and real security implicat
             "temperature": 0.3,
             "max_tokens": 4000
         }
-        response = requests.post(url, headers=headers, json=data, timeout=60)
+        response = HTTP.post(url, headers=headers, json=data, timeout=timeout)
         response.raise_for_status()
         return response.json()['choices'][0]['message']['content']
     
-    def _call_gemini(self, prompt: str) -> str:
+    def _call_gemini(self, prompt: str, timeout: float = 60) -> str:
         """Call Gemini API"""
         url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY}"
         headers = {"Content-Type": "application/json"}
         data = {"contents": [{"parts": [{"text": prompt}]}]}
-        response = requests.post(url, headers=headers, json=data, timeout=60)
+        response = HTTP.post(url, headers=headers, json=data, timeout=timeout)
         response.raise_for_status()
         return response.json()['candidates'][0]['content']['parts'][0]['text']
     
-    def _call_anthropic(self, prompt: str) -> str:
+    def _call_anthropic(self, prompt: str, timeout: float = 60) -> str:
         """Call Claude API"""
         import anthropic
         client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
@@ -606,16 +483,17 @@ Be thorough but concise. Focus on actionable insights and real security implicat
             model="claude-sonnet-4-20250514",
             max_tokens=4000,
             temperature=0.3,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
+            timeout=timeout
         )
         return message.content[0].text
     
-    def _call_huggingface(self, prompt: str) -> str:
+    def _call_huggingface(self, prompt: str, timeout: float = 60) -> str:
         """Call Hugging Face API"""
         url = "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.2"
         headers = {"Authorization": f"Bearer {HUGGINGFACE_API_KEY}"}
         data = {"inputs": prompt}
-        response = requests.post(url, headers=headers, json=data, timeout=60)
+        response = HTTP.post(url, headers=headers, json=data, timeout=timeout)
         response.raise_for_status()
         result = response.json()
         return result[0]['generated_text'] if isinstance(result, list) else result.get('generated_text', '')
@@ -723,6 +601,86 @@ def extract_content_findings(canonical_profiles, results):
     return findings
 
 
+class PlatformRiskCache:
+    """
+    LRU cache of per-platform risk partials.
+    Keyed by a content hash of the fields the scorer reads, so re-scans of a
+    monitored target only recompute the platforms whose data changed.
+    """
+    
+    # Only these fields (plus latest activity) feed _assess_platform
+    HASHED_FIELDS = ('found', 'profile', 'breach_count', 'breaches')
+    
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple, Tuple[Tuple, ...]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @classmethod
+    def key_for(cls, platform: str, platform_data: Dict[str, Any], rules_version: str,
+                stamps: Dict[str, float], catalog_version: Tuple[float, int] = (0.0, 0)) -> Tuple:
+        # Latest activity stands in for the repo/project/commit lists it was derived from
+        last_active = latest_activity(stamps)
+        content = json.dumps(
+            [platform_data.get(field) for field in cls.HASHED_FIELDS],
+            sort_keys=True,
+            default=str
+        )
+        digest = hashlib.sha1(content.encode()).hexdigest()
+        # Breach recency is measured in days, so partials expire at midnight;
+        # catalog breach items also go stale when the breach catalog reloads
+        return (platform, rules_version, catalog_version, datetime.now().date().toordinal(), last_active, digest)
+    
+    def get(self, key: Tuple) -> Optional[List[RiskItem]]:
+        with self._lock:
+            partial = self._entries.get(key)
+            if partial is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._thaw(partial)
+    
+    def put(self, key: Tuple, partial: List[RiskItem]) -> None:
+        stored = self._freeze(partial)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    # Entries are immutable field tuples; callers get fresh RiskItems, so nothing
+    # they do to a returned list or item reaches the cached entry
+    @staticmethod
+    def _freeze(partial: List[RiskItem]) -> Tuple[Tuple, ...]:
+        return tuple(
+            (i.category, i.item, i.risk_level, i.score, tuple(i.platforms),
+             i.recency, i.action, i.exploitability, i.details)
+            for i in partial
+        )
+    
+    @staticmethod
+    def _thaw(frozen: Tuple[Tuple, ...]) -> List[RiskItem]:
+        return [
+            RiskItem(category, item, risk_level, score, list(platforms), recency, action, exploitability, details)
+            for category, item, risk_level, score, platforms, recency, action, exploitability, details in frozen
+        ]
+    
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0
+        }
+
+
+PLATFORM_RISK_CACHE = PlatformRiskCache(int(os.environ.get('RISK_PARTIAL_CACHE_SIZE', '4096')))
+
+
 class RiskAssessmentEngine:
     """Main risk assessment engine combining all components"""
     
@@ -731,81 +689,35 @@ class RiskAssessmentEngine:
         self.scorer = RiskScorer()
         self.ai_analyzer = AIRiskAnalyzer(ai_service) if ai_service else None
     
-    def assess_risks(self, collected_data: Dict[str, Any], target: str) -> RiskAssessment:
-        """Perform complete risk assessment on collected OSINT data"""
+    def assess_risks(self, collected_data: Dict[str, Any], target: str,
+                     annotations: Optional[AnnotatedResults] = None,
+                     deadline: Optional[RequestDeadline] = None) -> RiskAssessment:
+        """
+        Perform complete risk assessment on collected OSINT data.
+        Pass the robustness handler's AnnotatedResults to reuse its parsed timestamps.
+        With a deadline, the AI pass is skipped or cut short when time runs out
+        and the assessment is marked partial; rule-based items are always kept.
+        """
+        # One rules snapshot per assessment so a reload mid-run can't mix versions
+        rules = RISK_RULES.current()
         risk_items = []
         
-        # First pass: Basic classification and scoring
+        # First pass: per-platform partials, reused when a platform's data is unchanged
         for platform, platform_data in collected_data.items():
             if not platform_data.get('found'):
                 continue
             
-            # Process profile data
-            profile = platform_data.get('profile', {})
-            for key, value in profile.items():
-                if value and value != 'Unknown' and value != '':
-                    classification = self.classifier.classify_data(key, str(value), platform)
-                    
-                    score = self.scorer.calculate_score(
-                        base_score=classification['base_score'],
-                        platforms=[platform],
-                        is_public=True
-                    )
-                    
-                    risk_level = self.scorer.determine_risk_level(score)
-                    exploitability = self.scorer.assess_exploitability(
-                        classification['category'],
-                        [platform],
-                        score
-                    )
-                    
-                    risk_items.append(RiskItem(
-                        category=classification['category'],
-                        item=f"{key}: {str(value)[:50]}",
-                        risk_level=risk_level.value,
-                        score=score,
-                        platforms=[platform],
-                        recency=None,
-                        action=self._generate_action(classification['category'], risk_level),
-                        exploitability=exploitability,
-                        details=f"Found on {platform}"
-                    ))
-            
-            # Process breaches with special handling
-            if platform == 'haveibeenpwned' and platform_data.get('breach_count', 0) > 0:
-                breaches = platform_data.get('breaches', [])
-                for breach in breaches:
-                    breach_date_str = breach.get('breach_date', breach.get('BreachDate'))
-                    recency_days = None
-                    if breach_date_str:
-                        try:
-                            breach_date = datetime.strptime(breach_date_str, '%Y-%m-%d')
-                            recency_days = (datetime.now() - breach_date).days
-                        except:
-                            pass
-                    
-                    score = self.scorer.calculate_score(
-                        base_score=9.0,
-                        platforms=['HaveIBeenPwned'],
-                        recency_days=recency_days,
-                        has_breach=True,
-                        is_public=True
-                    )
-                    
-                    risk_level = self.scorer.determine_risk_level(score)
-                    data_classes = breach.get('data_classes', breach.get('DataClasses', []))
-                    
-                    risk_items.append(RiskItem(
-                        category=DataCategory.CREDENTIALS.value,
-                        item=f"Data breach: {breach.get('name', breach.get('Name', 'Unknown'))}",
-                        risk_level=risk_level.value,
-                        score=score,
-                        platforms=['HaveIBeenPwned'],
-                        recency=f"{recency_days} days ago" if recency_days else None,
-                        action="Change password immediately and enable 2FA",
-                        exploitability=f"Compromised data includes: {', '.join(data_classes[:5])}",
-                        details=breach.get('description', breach.get('Description', ''))[:200]
-                    ))
+            if annotations is not None:
+                stamps = annotations.timestamps(platform)
+            else:
+                stamps = normalize_timestamps(platform_data)
+            cache_key = PlatformRiskCache.key_for(platform, platform_data, rules.version, stamps,
+                                                  (BREACH_CATALOG.refreshed_at, BREACH_CATALOG.version))
+            partial = PLATFORM_RISK_CACHE.get(cache_key)
+            if partial is None:
+                partial = self._assess_platform(platform, platform_data, rules, stamps)
+                PLATFORM_RISK_CACHE.put(cache_key, partial)
+            risk_items.extend(partial)
         
         # Use AI for enhanced analysis if available
         ai_recommendations = []
@@ -813,9 +725,17 @@ class RiskAssessmentEngine:
         ai_overall_score = None
         ai_summary = ""
         ai_timeline = None
-        
-        if self.ai_analyzer:
-            ai_analysis = self.ai_analyzer.analyze_risks(collected_data, target)
+        partial = False
+        
+        if self.ai_analyzer and deadline is not None and deadline.remaining() < AI_MIN_SECONDS:
+            deadline.truncate('risk_ai', 'skipped')
+            partial = True
+        elif self.ai_analyzer:
+            ai_analysis = self.ai_analyzer.analyze_risks(collected_data, target, call_timeout(deadline, 60))
+            if ai_analysis.get('timed_out'):
+                partial = True
+                if deadline is not None:
+                    deadline.truncate('risk_ai', 'timeout')
             
             if not ai_analysis.get('error'):
                 # Extract AI-generated risk items
@@ -859,7 +779,7 @@ class RiskAssessmentEngine:
         else:
             overall_score = 0.0
         
-        overall_risk_level = self.scorer.determine_risk_level(overall_score).value
+        overall_risk_level = self.scorer.determine_risk_level(overall_score, rules).value
         
         # Generate recommendations if not from AI
         if not ai_recommendations:
@@ -885,43 +805,143 @@ class RiskAssessmentEngine:
             recommendations=ai_recommendations,
             risk_factors=ai_risk_factors,
             timeline=ai_timeline or self._determine_timeline(critical_count, high_count),
-            summary=ai_summary
+            summary=ai_summary,
+            rules_version=rules.version,
+            partial=partial
         )
     
-    def _generate_action(self, category: str, risk_level: RiskLevel) -> str:
-        """Generate recommended action based on category and risk level"""
-        actions = {
-            DataCategory.CREDENTIALS.value: {
-                RiskLevel.CRITICAL: "Change password immediately, enable 2FA, and monitor for unauthorized access",
-                RiskLevel.HIGH: "Change password and enable two-factor authentication",
-                RiskLevel.MEDIUM: "Consider changing password and reviewing security settings",
-                RiskLevel.LOW: "Monitor account for suspicious activity"
-            },
-            DataCategory.PERSONAL_IDENTIFIERS.value: {
-                RiskLevel.CRITICAL: "Place fraud alert with credit bureaus and monitor identity theft services",
-                RiskLevel.HIGH: "Review privacy settings and limit public exposure",
-                RiskLevel.MEDIUM: "Consider removing or restricting access to this information",
-                RiskLevel.LOW: "Monitor for misuse"
-            },
-            DataCategory.CONTACT_DETAILS.value: {
-                RiskLevel.CRITICAL: "Change contact information and enable spam filters",
-                RiskLevel.HIGH: "Review and restrict visibility of contact details",
-                RiskLevel.MEDIUM: "Enable privacy settings to limit exposure",
-                RiskLevel.LOW: "Monitor for spam or phishing attempts"
-            },
-            DataCategory.LOCATION_DATA.value: {
-                RiskLevel.CRITICAL: "Disable location sharing immediately",
-                RiskLevel.HIGH: "Review and restrict location sharing settings",
-                RiskLevel.MEDIUM: "Consider disabling location services for non-essential apps",
-                RiskLevel.LOW: "Be aware of location sharing preferences"
-            }
-        }
+    def _assess_platform(self, platform: str, platform_data: Dict[str, Any],
+                         rules: CompiledRiskRules, stamps: Dict[str, float]) -> List[RiskItem]:
+        """Classify and score one platform's data into its partial list of risk items"""
+        risk_items = []
+        now = time.time()
+        
+        # Recency of the account's latest activity applies to everything it exposes
+        last_active = latest_activity(stamps)
+        activity_days = days_since(last_active, now) if last_active is not None else None
+        activity_recency = f"{activity_days} days ago" if activity_days is not None and activity_days <= 365 else None
+        
+        # Process profile data
+        profile = platform_data.get('profile', {})
+        for key, value in profile.items():
+            if value and value != 'Unknown' and value != '':
+                classification = self.classifier.classify_data(key, str(value), platform, rules)
+                
+                score = self.scorer.calculate_score(
+                    base_score=classification['base_score'],
+                    platforms=[platform],
+                    recency_days=activity_days,
+                    is_public=True
+                )
+                
+                risk_level = self.scorer.determine_risk_level(score, rules)
+                exploitability = self.scorer.assess_exploitability(
+                    classification['category'],
+                    [platform],
+                    score,
+                    rules
+                )
+                
+                risk_items.append(RiskItem(
+                    category=classification['category'],
+                    item=f"{key}: {str(value)[:50]}",
+                    risk_level=risk_level.value,
+                    score=score,
+                    platforms=[platform],
+                    recency=activity_recency,
+                    action=self._generate_action(classification['category'], risk_level, rules),
+                    exploitability=exploitability,
+                    details=f"Found on {platform}"
+                ))
+        
+        # Process breaches with special handling
+        if platform == 'haveibeenpwned' and platform_data.get('breach_count', 0) > 0:
+            breaches = platform_data.get('breaches', [])
+            for i, breach in enumerate(breaches):
+                name = breach.get('name', breach.get('Name', 'Unknown'))
+                
+                # Catalog breaches score from memory; records carrying their own text take the slow path
+                info = BREACH_CATALOG.get(name)
+                if info is not None and 'description' not in breach and 'Description' not in breach:
+                    risk_items.append(self._catalog_breach_item(info, rules, now))
+                    continue
+                
+                breach_epoch = stamps.get(f'breaches[{i}].breach_date', stamps.get(f'breaches[{i}].BreachDate'))
+                risk_items.append(self._breach_item(
+                    name,
+                    breach.get('data_classes', breach.get('DataClasses', [])),
+                    breach_epoch,
+                    (breach.get('description', breach.get('Description', '')) or '')[:200],
+                    rules,
+                    now
+                ))
+        
+        return risk_items
+    
+    def _breach_item(self, name: str, data_classes: List[str], breach_epoch: Optional[float],
+                     details: str, rules: CompiledRiskRules, now: float) -> RiskItem:
+        """Score a single breach"""
+        recency_days = days_since(breach_epoch, now) if breach_epoch is not None else None
+        
+        score = self.scorer.calculate_score(
+            base_score=9.0,
+            platforms=['HaveIBeenPwned'],
+            recency_days=recency_days,
+            has_breach=True,
+            is_public=True
+        )
         
-        return actions.get(category, {}).get(
-            risk_level,
-            "Review and assess security implications"
+        risk_level = self.scorer.determine_risk_level(score, rules)
+        
+        return RiskItem(
+            category=DataCategory.CREDENTIALS.value,
+            item=f"Data breach: {name}",
+            risk_level=risk_level.value,
+            score=score,
+            platforms=['HaveIBeenPwned'],
+            recency=f"{recency_days} days ago" if recency_days is not None else None,
+            action="Change password immediately and enable 2FA",
+            exploitability=f"Compromised data includes: {', '.join(data_classes[:5])}",
+            details=details
         )
     
+    # Catalog breach items per (rules version, catalog version, day); every email sharing a breach reuses it
+    _catalog_items: Dict[str, RiskItem] = {}
+    _catalog_items_key: Optional[Tuple] = None
+    _catalog_items_lock = threading.Lock()
+    
+    def _catalog_breach_item(self, info: Dict[str, Any], rules: CompiledRiskRules, now: float) -> RiskItem:
+        """Risk item for a breach known to the local catalog, memoized by name; returns a copy"""
+        memo_key = (rules.version, BREACH_CATALOG.refreshed_at, BREACH_CATALOG.version, int(now // 86400))
+        with RiskAssessmentEngine._catalog_items_lock:
+            if RiskAssessmentEngine._catalog_items_key != memo_key:
+                RiskAssessmentEngine._catalog_items = {}
+                RiskAssessmentEngine._catalog_items_key = memo_key
+            item = RiskAssessmentEngine._catalog_items.get(info['name'])
+        
+        if item is None:
+            details = f"{info['pwn_count']:,} accounts affected" if info.get('pwn_count') else ''
+            if info.get('domain'):
+                details = f"{details} ({info['domain']})" if details else info['domain']
+            item = self._breach_item(
+                info['name'],
+                info.get('data_classes', []),
+                info.get('breach_epoch'),
+                details,
+                rules,
+                now
+            )
+            with RiskAssessmentEngine._catalog_items_lock:
+                if RiskAssessmentEngine._catalog_items_key == memo_key:
+                    RiskAssessmentEngine._catalog_items[info['name']] = item
+        return replace(item, platforms=list(item.platforms))
+    
+    def _generate_action(self, category: str, risk_level: RiskLevel,
+                         rules: Optional[CompiledRiskRules] = None) -> str:
+        """Generate recommended action based on category and risk level"""
+        rules = rules or RISK_RULES.current()
+        return rules.action(category, risk_level.value)
+    
     def _generate_recommendations(self, risk_items: List[RiskItem], critical: int, high: int) -> List[str]:
         """Generate actionable recommendations"""
         recommendations = []
@@ -1029,154 +1049,500 @@ class RiskAssessmentEngine:
             ],
             'recommendations': assessment.recommendations,
             'summary': assessment.summary,
-            'timeline': assessment.timeline
+            'timeline': assessment.timeline,
+            'rules_version': assessment.rules_version,
+            'partial': assessment.partial
         }
 
 
 # ==================== DATA COLLECTORS ====================
 # ==================== USERNAME ENUMERATION ====================
 
+# A probe answering one of these settles that the account doesn't exist;
+# any other failure status (429, 403, 5xx) leaves the question open
+NOT_FOUND_STATUSES = (404, 410)
+
+
 class UniversalUsernameEnumerator:
     """
-    Checks if a username exists on supported platforms
+    Checks if a username exists on catalog platforms
     using HTTP validation (no API keys required).
+    Sites are probed concurrently, each under its own timeout,
+    and the whole sweep under ENUMERATION_BUDGET.
     """
 
-    def __init__(self, rules):
-        self.rules = rules
+    def __init__(self, catalog: Optional[CompiledPlatformCatalog] = None,
+                 http: HttpClient = HTTP, budget: float = ENUMERATION_BUDGET):
+        self.catalog = catalog or PLATFORM_CATALOG.current()
+        self.http = http
+        self.budget = budget
+
+    def check_username(self, username: str, platforms: Optional[List[str]] = None,
+                       request_deadline: Optional[RequestDeadline] = None) -> dict:
+        """
+        Probe the named platforms (all catalog sites when None). Every probed
+        site gets an entry; one whose answer doesn't settle existence (timeout,
+        error, throttling) is flagged timed_out / error / inconclusive.
+        """
+        sites = self.catalog.select(platforms)
+        deadline = collector_deadline(self.budget, request_deadline)
+        done = run_parallel({
+            site.name: (lambda site=site: self._probe(site, username, deadline))
+            for site in sites
+        }, deadline)
 
-    def check_username(self, username: str) -> dict:
         results = {}
+        for site in sites:
+            if site.name not in done:
+                results[site.name] = {"exists": False, "timed_out": True}
+            else:
+                results[site.name] = done[site.name]
+        timed_out = sum(1 for entry in results.values() if entry.get("timed_out"))
+        if timed_out and request_deadline is not None:
+            request_deadline.truncate('enumeration', f'{timed_out} site(s) timed out')
+        return results
 
-        for platform, rule in self.rules.items():
-            try:
-                url = rule["url"].format(username)
-
-                response = requests.get(
-                    url,
-                    headers={"User-Agent": "Mozilla/5.0"},
-                    timeout=8
+    def _probe(self, site: SiteRule, username: str, deadline: float) -> dict:
+        """Presence entry for one site, including misses"""
+        status, entry, _ = self.probe_site(site, username, time_left(deadline, site.timeout))
+        if entry is None:
+            entry = {"exists": False, "found": False}
+            if status not in NOT_FOUND_STATUSES:
+                entry["inconclusive"] = True
+        if status is not None:
+            entry["status"] = status
+        return entry
+
+    def probe_site(self, site: SiteRule, username: str,
+                   timeout: float) -> Tuple[Optional[int], Optional[dict], Dict[str, str]]:
+        """(status or None on error, presence entry or None, response headers) for one site"""
+        headers = {}
+        try:
+            url = site.probe_url(username)
+        except ValueError:
+            # A handle this site's URL can't safely hold can't exist there; nothing is fetched
+            return None, {"exists": False, "found": False, "invalid_username": True}, headers
+        try:
+            if site.method == 'HEAD':
+                response = self.http.session.head(
+                    url, headers={"User-Agent": "Mozilla/5.0"}, timeout=timeout, allow_redirects=True
                 )
-                exists = False
-                if response.status_code in rule.get("success_codes", []):
-                    content = response.text.lower()
-                    if "json_key" in rule:
-                       data = response.json()
-                       exists = rule["json_key"] in data.get("data", {})
-                    elif "must_contain" in rule:
-                       exists = rule["must_contain"].lower() in content
-                    elif "must_not_contain" in rule:
-                       exists = rule["must_not_contain"].lower() not in content
-                    else:
-                       exists = True  # fallback
-
-                    results[platform] = {
-                        "exists": exists,
-                        "found": exists,
-                        "profile_url": url if exists else None,
-                        "confidence": rule.get("confidence", "LOW")
-                    }
-               
-            except Exception:
-                results[platform] = {"exists": False}
+                status = response.status_code
+                headers.update(response.headers)
+                if status not in site.success_codes:
+                    return status, None, headers
+                exists = True
+            elif site.check == 'json':
+                response = self.http.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=timeout)
+                status = response.status_code
+                headers.update(response.headers)
+                if status not in site.success_codes:
+                    return status, None, headers
+                exists = site.json_exists(response.json())
+            elif site.check == 'regex':
+                status, verdict = probe_regex(
+                    self.http.session, url, site.regex, success_codes=site.success_codes,
+                    timeout=timeout, response_headers=headers
+                )
+                # A scan cut short by the byte cap settles nothing: inconclusive
+                if verdict is None or not verdict.complete:
+                    return status, None, headers
+                exists = verdict.exists
+            else:
+                # Marker rules stream the page and stop at the first decisive chunk;
+                # status-only rules never read the body
+                status, verdict = probe_page(
+                    self.http.session, url,
+                    must_contain=site.must_contain,
+                    must_not_contain=site.must_not_contain,
+                    success_codes=site.success_codes,
+                    timeout=timeout,
+                    response_headers=headers
+                )
+                if verdict is None or not verdict.complete:
+                    return status, None, headers
+                exists = verdict.exists
 
-        return results
+            return status, {
+                "exists": exists,
+                "found": exists,
+                "profile_url": site.profile_url_for(username) if exists else None,
+                "confidence": site.confidence
+            }, headers
+
+        except Exception:
+            return None, {"exists": False, "error": True}, headers
+
+    def sweep(self, seed: str, platforms: Optional[List[str]] = None,
+              max_candidates: int = SWEEP_DEFAULT_CANDIDATES, stop_on: Optional[str] = 'HIGH') -> Optional[SweepJob]:
+        """
+        Permutation mode: probe ranked handle variants of `seed` in the
+        background. Returns the registered job, or None when SWEEP_MAX_ACTIVE
+        sweeps are already running; poll SWEEP_JOBS for progress.
+        """
+        sites = self.catalog.select(platforms)
+        job = SWEEP_JOBS.admit(SweepJob(seed, [site.name for site in sites], max_candidates, stop_on), SWEEP_MAX_ACTIVE)
+        if job is None:
+            return None
+        start_sweep(job, sites, self.probe_site)
+        return job
+
+# Per-request collection depth: name -> (default, max). Smaller = faster, less complete
+COLLECTION_DEPTH_LIMITS = {
+    'repos': (10, 100),
+    'commit_repos': (3, 10),
+    'commits': (5, 100),
+    'projects': (10, 100),
+}
+
+
+def parse_collection_depth(raw: Any) -> Dict[str, int]:
+    """Clamp a request's 'depth' object to COLLECTION_DEPTH_LIMITS, filling defaults"""
+    raw = raw if isinstance(raw, dict) else {}
+    depth = {}
+    for name, (default, maximum) in COLLECTION_DEPTH_LIMITS.items():
+        try:
+            value = int(raw.get(name, default))
+        except (TypeError, ValueError):
+            value = default
+        depth[name] = max(0, min(value, maximum))
+    return depth
+
+
+def collector_deadline(budget: float, request_deadline: Optional[RequestDeadline]) -> float:
+    """Monotonic end time for one collector: its own budget, cut to the request deadline"""
+    if request_deadline is not None:
+        return request_deadline.within(budget)
+    return time.monotonic() + budget
 
+
+@register_collector(
+    'github', cost='expensive', rate_limit_group='github',
+    build=lambda ctx: GitHubCollector(
+        ctx.credentials.get('GITHUB_TOKEN'), repos=ctx.depth['repos'], commit_repos=ctx.depth['commit_repos'],
+        commits=ctx.depth['commits'], deadline=ctx.deadline, deep=ctx.deep
+    )
+)
 class GitHubCollector:
-    """Collect data from GitHub API"""
+    """
+    Collect data from GitHub.
+    With a token: user, top repos and recent commits in one GraphQL query.
+    Otherwise (or if GraphQL fails): REST, revalidated against the ETag store
+    so unchanged resources cost a 304 instead of quota. Independent REST calls
+    (user + repos, then per-repo commits) run concurrently under one deadline.
+    Deep mode pages through every public repo over REST, within deep_caps('github').
+    """
     
-    def __init__(self, token=None):
-        self.token = token
-        self.headers = {
-            'Authorization': f'token {token}' if token else '',
-            'Accept': 'application/vnd.github.v3+json'
+    GRAPHQL_URL = 'https://api.github.com/graphql'
+    GRAPHQL_QUERY = '''
+    query($login: String!, $repos: Int!, $commitRepos: Int!, $commits: Int!) {
+      user(login: $login) {
+        login name bio location email company websiteUrl twitterUsername
+        createdAt updatedAt
+        followers { totalCount }
+        following { totalCount }
+        repositories(first: $repos, privacy: PUBLIC, ownerAffiliations: OWNER,
+                     orderBy: {field: UPDATED_AT, direction: DESC}) {
+          totalCount
+          nodes {
+            name description stargazerCount forkCount updatedAt
+            primaryLanguage { name }
+          }
         }
+        commitRepos: repositories(first: $commitRepos, privacy: PUBLIC, ownerAffiliations: OWNER,
+                                  orderBy: {field: UPDATED_AT, direction: DESC}) {
+          nodes {
+            defaultBranchRef {
+              target {
+                ... on Commit {
+                  history(first: $commits) {
+                    nodes { message author { name date } }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+    '''
+    
+    def __init__(self, token=None, http: HttpClient = HTTP, repos: int = 10, commit_repos: int = 3,
+                 commits: int = 5, budget: float = COLLECTOR_BUDGET,
+                 deadline: Optional[RequestDeadline] = None, deep: bool = False):
+        self.token = token
+        self.http = http
+        self.repo_limit = repos
+        self.commit_repos = commit_repos
+        self.commits_per_repo = commits
+        self.budget = DEEP_COLLECTOR_BUDGET if deep else budget
+        self.request_deadline = deadline
+        self.deep = deep
+        self.headers = {'Accept': 'application/vnd.github.v3+json'}
+        if token:
+            self.headers['Authorization'] = f'token {token}'
     
     def collect(self, username: str) -> Dict[str, Any]:
         """Collect GitHub profile data"""
         try:
-            user_url = f'https://api.github.com/users/{username}'
-            user_response = requests.get(user_url, headers=self.headers, timeout=10)
-            
-            if user_response.status_code != 200:
-                return {'error': 'User not found', 'found': False}
-            
-            user_data = user_response.json()
-            
-            repos_url = f'https://api.github.com/users/{username}/repos'
-            repos_response = requests.get(repos_url, headers=self.headers, timeout=10)
-            repos_data = repos_response.json() if repos_response.status_code == 200 else []
-            
-            commits_data = []
-            for repo in repos_data[:3]:
-                commits_url = f"https://api.github.com/repos/{username}/{repo['name']}/commits"
-                commits_response = requests.get(commits_url, headers=self.headers, timeout=10)
-                if commits_response.status_code == 200:
-                    commits_data.extend(commits_response.json()[:5])
-            
-            return {
-                'found': True,
-                'verification': 'api_verified',
-                'platform': 'GitHub',
-                'profile': {
-                    'username': user_data.get('login'),
-                    'name': user_data.get('name'),
-                    'bio': user_data.get('bio'),
-                    'location': user_data.get('location'),
-                    'email': user_data.get('email'),
-                    'company': user_data.get('company'),
-                    'blog': user_data.get('blog'),
-                    'twitter': user_data.get('twitter_username'),
-                    'public_repos': user_data.get('public_repos'),
-                    'followers': user_data.get('followers'),
-                    'following': user_data.get('following'),
-                    'created_at': user_data.get('created_at'),
-                    'updated_at': user_data.get('updated_at')
-                },
-                'repositories': [
-                    {
-                        'name': repo.get('name'),
-                        'description': repo.get('description'),
-                        'language': repo.get('language'),
-                        'stars': repo.get('stargazers_count'),
-                        'forks': repo.get('forks_count'),
-                        'updated': repo.get('updated_at')
-                    }
-                    for repo in repos_data[:10]
-                ],
-                'recent_commits': [
-                    {
-                        'message': commit.get('commit', {}).get('message'),
-                        'date': commit.get('commit', {}).get('author', {}).get('date'),
-                        'author': commit.get('commit', {}).get('author', {}).get('name')
-                    }
-                    for commit in commits_data
-                ]
-            }
+            deadline = collector_deadline(self.budget, self.request_deadline)
+            if self.token and not self.deep:
+                result = self._collect_graphql(username, deadline)
+                if result is not None:
+                    return result
+            return self._collect_rest(username, deadline)
         except Exception as e:
             return {'error': str(e), 'found': False}
+    
+    def _collect_graphql(self, username: str, deadline: float) -> Optional[Dict[str, Any]]:
+        """One round trip; None means fall back to REST"""
+        try:
+            response = self.http.post(
+                self.GRAPHQL_URL,
+                headers={'Authorization': f'bearer {self.token}'},
+                json={
+                    'query': self.GRAPHQL_QUERY,
+                    'variables': {
+                        'login': username,
+                        'repos': self.repo_limit,
+                        'commitRepos': min(self.commit_repos, self.repo_limit),
+                        'commits': self.commits_per_repo
+                    }
+                },
+                timeout=time_left(deadline)
+            )
+            payload = response.json() if response.status_code == 200 else None
+        except (requests.RequestException, ValueError) as e:
+            print(f"⚠️ GitHub GraphQL failed, using REST: {e}")
+            return None
+        
+        if not payload:
+            return None
+        user = (payload.get('data') or {}).get('user')
+        if user is None:
+            if any(err.get('type') == 'NOT_FOUND' for err in payload.get('errors') or []):
+                return {'error': 'User not found', 'found': False}
+            return None
+        
+        repos = user.get('repositories') or {}
+        commits = []
+        for repo in (user.get('commitRepos') or {}).get('nodes') or []:
+            target = ((repo or {}).get('defaultBranchRef') or {}).get('target') or {}
+            for commit in (target.get('history') or {}).get('nodes') or []:
+                author = commit.get('author') or {}
+                commits.append({
+                    'message': commit.get('message'),
+                    'date': author.get('date'),
+                    'author': author.get('name')
+                })
+        
+        return self._build_record(
+            profile={
+                'username': user.get('login'),
+                'name': user.get('name'),
+                'bio': user.get('bio'),
+                'location': user.get('location'),
+                'email': user.get('email') or None,
+                'company': user.get('company'),
+                'blog': user.get('websiteUrl'),
+                'twitter': user.get('twitterUsername'),
+                'public_repos': repos.get('totalCount'),
+                'followers': (user.get('followers') or {}).get('totalCount'),
+                'following': (user.get('following') or {}).get('totalCount'),
+                'created_at': user.get('createdAt'),
+                'updated_at': user.get('updatedAt')
+            },
+            repositories=[
+                {
+                    'name': repo.get('name'),
+                    'description': repo.get('description'),
+                    'language': (repo.get('primaryLanguage') or {}).get('name'),
+                    'stars': repo.get('stargazerCount'),
+                    'forks': repo.get('forkCount'),
+                    'updated': repo.get('updatedAt')
+                }
+                for repo in repos.get('nodes') or [] if repo
+            ],
+            commits=commits,
+            mode='graphql'
+        )
+    
+    def _collect_rest(self, username: str, deadline: float) -> Dict[str, Any]:
+        # The repo list only needs the username, so it goes out alongside the user lookup
+        stream = PageStream(
+            self.http.session,
+            f'https://api.github.com/users/{username}/repos',
+            params={'sort': 'updated'},
+            headers=self.headers,
+            caps=deep_caps('github'),
+            deadline=deadline
+        ).start() if self.deep else None
+        first = run_parallel({
+            'user': lambda: self.http.get_json(
+                f'https://api.github.com/users/{username}',
+                headers=self.headers,
+                timeout=time_left(deadline)
+            ),
+            'repos': lambda: self.http.get_json(
+                f'https://api.github.com/users/{username}/repos',
+                headers=self.headers,
+                params={'sort': 'updated', 'per_page': self.repo_limit},
+                timeout=time_left(deadline)
+            ) if self.repo_limit and not self.deep else None
+        }, deadline)
+        
+        user_result = first.get('user')
+        if user_result is None:
+            return {'error': 'GitHub user lookup failed or timed out', 'found': False}
+        if user_result.status_code != 200 or not isinstance(user_result.data, dict):
+            return {'error': 'User not found', 'found': False}
+        
+        user_data = user_result.data
+        
+        if stream is not None:
+            # Each page is summarized as it arrives; raw pages aren't kept
+            repositories = []
+            for page in stream:
+                repositories.extend(self._repo_summary(repo) for repo in page)
+            partial = stream.truncated == 'deadline'
+        else:
+            repos_result = first.get('repos')
+            partial = self.repo_limit > 0 and 'repos' not in first
+            repos_data = repos_result.data if repos_result and repos_result.status_code == 200 and isinstance(repos_result.data, list) else []
+            repositories = [self._repo_summary(repo) for repo in repos_data[:self.repo_limit]]
+        
+        commit_repos = [repo['name'] for repo in repositories[:self.commit_repos]] if self.commits_per_repo else []
+        by_repo = run_parallel({
+            i: (lambda name=name: self.http.get_json(
+                f"https://api.github.com/repos/{username}/{name}/commits",
+                headers=self.headers,
+                params={'per_page': self.commits_per_repo},
+                timeout=time_left(deadline)
+            ))
+            for i, name in enumerate(commit_repos)
+        }, deadline)
+        partial = partial or len(by_repo) < len(commit_repos)
+        
+        # Repo order, not completion order
+        commits_data = []
+        for i in range(len(commit_repos)):
+            commits_result = by_repo.get(i)
+            if commits_result and commits_result.status_code == 200 and isinstance(commits_result.data, list):
+                commits_data.extend(commits_result.data[:self.commits_per_repo])
+        
+        record = self._build_record(
+            profile={
+                'username': user_data.get('login'),
+                'name': user_data.get('name'),
+                'bio': user_data.get('bio'),
+                'location': user_data.get('location'),
+                'email': user_data.get('email'),
+                'company': user_data.get('company'),
+                'blog': user_data.get('blog'),
+                'twitter': user_data.get('twitter_username'),
+                'public_repos': user_data.get('public_repos'),
+                'followers': user_data.get('followers'),
+                'following': user_data.get('following'),
+                'created_at': user_data.get('created_at'),
+                'updated_at': user_data.get('updated_at')
+            },
+            repositories=repositories,
+            commits=[
+                {
+                    'message': commit.get('commit', {}).get('message'),
+                    'date': commit.get('commit', {}).get('author', {}).get('date'),
+                    'author': commit.get('commit', {}).get('author', {}).get('name')
+                }
+                for commit in commits_data
+            ],
+            mode='rest'
+        )
+        if stream is not None:
+            record['collection_mode'] = 'deep'
+            record['pagination'] = stream.report()
+        if partial:
+            record['partial'] = True
+        return record
+    
+    @staticmethod
+    def _repo_summary(repo: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'name': repo.get('name'),
+            'description': repo.get('description'),
+            'language': repo.get('language'),
+            'stars': repo.get('stargazers_count'),
+            'forks': repo.get('forks_count'),
+            'updated': repo.get('updated_at')
+        }
+    
+    @staticmethod
+    def _build_record(profile: Dict[str, Any], repositories: List[Dict[str, Any]],
+                      commits: List[Dict[str, Any]], mode: str) -> Dict[str, Any]:
+        return {
+            'found': True,
+            'verification': 'api_verified',
+            'platform': 'GitHub',
+            'collection_mode': mode,
+            'profile': profile,
+            'repositories': repositories,
+            'recent_commits': commits
+        }
         
+@register_collector(
+    'gitlab', cost='expensive', rate_limit_group='gitlab',
+    build=lambda ctx: GitLabCollector(projects=ctx.depth['projects'], deadline=ctx.deadline, deep=ctx.deep)
+)
 class GitLabCollector:
-      """Collect data from GitLab (public API, no auth required)"""
+      """Collect data from GitLab (public API, no auth required); deep mode pages through every project"""
+
+      def __init__(self, http: HttpClient = HTTP, projects: int = 10, budget: float = COLLECTOR_BUDGET,
+                   deadline: Optional[RequestDeadline] = None, deep: bool = False):
+        self.http = http
+        self.project_limit = projects
+        self.budget = DEEP_COLLECTOR_BUDGET if deep else budget
+        self.request_deadline = deadline
+        self.deep = deep
 
       def collect(self, username: str) -> Dict[str, Any]:
         try:
-            # Search user
-            search_url = f"https://gitlab.com/api/v4/users?username={username}"
-            response = requests.get(search_url, timeout=10)
-
-            if response.status_code != 200 or not response.json():
+            deadline = collector_deadline(self.budget, self.request_deadline)
+
+            # User search and projects (addressable by username) go out together
+            stream = PageStream(
+                self.http.session,
+                f"https://gitlab.com/api/v4/users/{username}/projects",
+                caps=deep_caps('gitlab'),
+                deadline=deadline
+            ).start() if self.deep else None
+            fetched = run_parallel({
+                'user': lambda: self.http.get_json(
+                    "https://gitlab.com/api/v4/users",
+                    params={"username": username},
+                    timeout=time_left(deadline)
+                ),
+                'projects': lambda: self.http.get_json(
+                    f"https://gitlab.com/api/v4/users/{username}/projects",
+                    params={"per_page": self.project_limit},
+                    timeout=time_left(deadline)
+                ) if self.project_limit and not self.deep else None
+            }, deadline)
+
+            search = fetched.get('user')
+            if search is None:
+                return {"found": False, "error": "GitLab user lookup failed or timed out"}
+            if search.status_code != 200 or not search.data:
                 return {"found": False}
 
-            user = response.json()[0]
-            user_id = user.get("id")
+            user = search.data[0]
 
-            # Fetch projects
-            projects_url = f"https://gitlab.com/api/v4/users/{user_id}/projects"
-            projects_resp = requests.get(projects_url, timeout=10)
-            projects = projects_resp.json() if projects_resp.status_code == 200 else []
+            if stream is not None:
+                projects = [self._project_summary(p) for page in stream for p in page]
+            else:
+                projects_result = fetched.get('projects')
+                raw = projects_result.data if projects_result and projects_result.status_code == 200 and isinstance(projects_result.data, list) else []
+                projects = [self._project_summary(p) for p in raw[:self.project_limit]]
 
-            return {
+            record = {
                 "found": True,
                 "verification": "api_verified",
                 "platform": "GitLab",
@@ -1189,171 +1555,144 @@ class GitLabCollector:
                     "created_at": user.get("created_at"),
                     "profile_url": user.get("web_url")
                 },
-                "projects": [
-                    {
-                        "name": p.get("name"),
-                        "description": p.get("description"),
-                        "stars": p.get("star_count"),
-                        "last_activity": p.get("last_activity_at")
-                    }
-                    for p in projects[:10]
-                ]
+                "projects": projects
             }
+            if stream is not None:
+                record["collection_mode"] = "deep"
+                record["pagination"] = stream.report()
+                if stream.truncated == 'deadline':
+                    record["partial"] = True
+            elif self.project_limit and 'projects' not in fetched:
+                record["partial"] = True
+            return record
 
         except Exception as e:
             return {"found": False, "error": str(e)}
-        
-class InstagramCollector:
-    """Lightweight Instagram presence collector (heuristic only)"""
-
-    def collect(self, username: str) -> Dict[str, Any]:
-        try:
-            url = f"https://www.instagram.com/{username}/"
-            headers = {"User-Agent": "Mozilla/5.0"}
-            response = requests.get(url, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                return {"found": False}
-
-            if "Sorry, this page isn't available" in response.text:
-                return {"found": False}
 
-            return {
-                "found": True,
-                "verification": "weak_verified",
-                "platform": "Instagram",
-                "profile": {
-                    "username": username,
-                    "profile_url": url
-                }
-            }
-
-        except Exception as e:
-            return {"found": False, "error": str(e)}
+      @staticmethod
+      def _project_summary(p: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "name": p.get("name"),
+            "description": p.get("description"),
+            "stars": p.get("star_count"),
+            "last_activity": p.get("last_activity_at")
+        }
         
-class YouTubeCollector:
-    """Lightweight YouTube presence collector (heuristic only)"""
+class CatalogPageCollector:
+    """
+    Lightweight presence collector (heuristic only): the catalog site's page
+    must load and must not show its "not found" marker. Subclasses name the
+    catalog site and the display platform.
+    """
 
-    def collect(self, username: str) -> Dict[str, Any]:
-        try:
-            url = f"https://www.youtube.com/@{username}"
-            headers = {"User-Agent": "Mozilla/5.0"}
-            response = requests.get(url, headers=headers, timeout=10)
+    site_name = ''
+    platform = ''
 
-            if response.status_code != 200:
-                return {"found": False}
+    def __init__(self, deadline: Optional[RequestDeadline] = None):
+        self.deadline = deadline
 
-            if "This channel does not exist" in response.text:
-                return {"found": False}
-
-            return {
-                "found": True,
-                "verification": "weak_verified",
-                "platform": "YouTube",
-                "profile": {
-                    "username": username,
-                    "profile_url": url
-                }
+    @classmethod
+    def _record(cls, username: str, url: str) -> Dict[str, Any]:
+        return {
+            "found": True,
+            "verification": "weak_verified",
+            "platform": cls.platform,
+            "profile": {
+                "username": username,
+                "profile_url": url
             }
+        }
 
-        except Exception as e:
-            return {"found": False, "error": str(e)}
-        
-class FacebookCollector:
-    """Lightweight Facebook presence collector (heuristic only)"""
+    @classmethod
+    def from_presence(cls, username: str, presence: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Same record from the enumerator's probe of the same page, without fetching it again"""
+        if not (presence or {}).get("exists"):
+            return {"found": False}
+        site = PLATFORM_CATALOG.current().site(cls.site_name)
+        return cls._record(username, site.probe_url(username))
 
     def collect(self, username: str) -> Dict[str, Any]:
         try:
-            url = f"https://www.facebook.com/{username}"
-            headers = {"User-Agent": "Mozilla/5.0"}
-
-            response = requests.get(url, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                return {"found": False}
+            site = PLATFORM_CATALOG.current().site(self.site_name)
+            url = site.probe_url(username)
+            status, verdict = probe_page(
+                HTTP.session, url,
+                must_not_contain=site.must_not_contain,
+                timeout=call_timeout(self.deadline, 10)
+            )
 
-            if "This content isn't available" in response.text:
+            if status == 200 and not verdict.complete:
+                # The not-found marker may sit past the byte cap
+                return {"found": False, "inconclusive": True}
+            if status != 200 or not verdict.exists:
                 return {"found": False}
 
-            return {
-                "found": True,
-                "verification": "weak_verified",
-                "platform": "Facebook",
-                "profile": {
-                    "username": username,
-                    "profile_url": url
-                }
-            }
+            return self._record(username, url)
 
         except Exception as e:
             return {"found": False, "error": str(e)}
-        
-class LinkedInCollector:
-    """Lightweight LinkedIn presence collector (heuristic only)"""
 
-    def collect(self, username: str) -> Dict[str, Any]:
-        try:
-            url = f"https://www.linkedin.com/in/{username}/"
-            headers = {
-                "User-Agent": "Mozilla/5.0"
-            }
 
-            response = requests.get(url, headers=headers, timeout=10)
+@register_collector('instagram', cost='cheap', rate_limit_group='meta', shares_enumerator_fetch=True)
+class InstagramCollector(CatalogPageCollector):
+    site_name = 'instagram'
+    platform = 'Instagram'
 
-            if response.status_code != 200:
-                return {"found": False}
 
-            if "This page doesn’t exist" in response.text:
-                return {"found": False}
+@register_collector('youtube', cost='cheap', rate_limit_group='google', shares_enumerator_fetch=True)
+class YouTubeCollector(CatalogPageCollector):
+    site_name = 'youtube'
+    platform = 'YouTube'
 
-            return {
-                "found": True,
-                "verification": "weak_verified",
-                "platform": "LinkedIn",
-                "profile": {
-                    "username": username,
-                    "profile_url": url
-                }
-            }
 
-        except Exception as e:
-            return {"found": False, "error": str(e)}
+@register_collector('facebook', cost='cheap', rate_limit_group='meta', shares_enumerator_fetch=True)
+class FacebookCollector(CatalogPageCollector):
+    site_name = 'facebook'
+    platform = 'Facebook'
 
 
+@register_collector('linkedin', cost='cheap', rate_limit_group='linkedin', shares_enumerator_fetch=True)
+class LinkedInCollector(CatalogPageCollector):
+    site_name = 'linkedin'
+    platform = 'LinkedIn'
 
 
-        
+@register_collector('twitter', cost='moderate', rate_limit_group='x')
 class TwitterCollector:
     """Heuristic Twitter/X collector with recent posts"""
 
+    def __init__(self, deadline: Optional[RequestDeadline] = None):
+        self.deadline = deadline
+
     def collect(self, username: str) -> Dict[str, Any]:
         try:
             url = f"https://x.com/{username}"
             headers = {"User-Agent": "Mozilla/5.0"}
 
-            response = requests.get(url, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                return {"found": False}
-
-            if "This account doesn’t exist" in response.text:
-                return {"found": False}
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            tweets = []
-            for tweet in soup.find_all("article")[:5]:
-                text_blocks = tweet.find_all("div")
-                text = " ".join(
-                    t.get_text(strip=True)
-                    for t in text_blocks
-                    if t.get_text(strip=True)
-                )
-
-                if text:
-                    tweets.append(text[:280])
-
-            return {
+            marker = MarkerScanner([PLATFORM_CATALOG.current().site('twitter').must_not_contain])
+            partial = False
+            extractor = ArticleExtractor(limit=5, max_chars=280)
+
+            # Stream the page: stop at the not-found marker or once five articles are parsed
+            with HTTP.session.get(url, headers=headers, timeout=call_timeout(self.deadline, 10), stream=True) as response:
+                if response.status_code != 200:
+                    return {"found": False}
+
+                decoder = codecs.getincrementaldecoder(body_encoding(response))(errors='replace')
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    text = decoder.decode(chunk)
+                    if marker.feed(text):
+                        return {"found": False}
+                    extractor.feed(text)
+                    if extractor.done:
+                        break
+                    if self.deadline is not None and self.deadline.expired:
+                        partial = True
+                        break
+
+            tweets = extractor.close()
+
+            record = {
                 "found": True,
                 "verification": "weak_verified",
                 "platform": "Twitter",
@@ -1363,6 +1702,9 @@ class TwitterCollector:
                 },
                 "posts": tweets
             }
+            if partial:
+                record["partial"] = True
+            return record
 
         except Exception as e:
             return {"found": False, "error": str(e)}
@@ -1372,15 +1714,16 @@ class TwitterCollector:
 
 
 
+@register_collector(
+    'haveibeenpwned', cost='moderate', rate_limit_group='hibp', credentials=('HIBP_API_KEY',), target_kind='email',
+    build=lambda ctx: HaveIBeenPwnedCollector(ctx.credentials['HIBP_API_KEY'], ctx.deadline)
+)
 class HaveIBeenPwnedCollector:
     """Check for data breaches"""
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, deadline: Optional[RequestDeadline] = None):
         self.api_key = api_key
-        self.headers = {
-            'hibp-api-key': api_key if api_key else '',
-            'user-agent': 'OSINT-Dashboard'
-        }
+        self.deadline = deadline
     
     def collect(self, email: str) -> Dict[str, Any]:
         try:
@@ -1391,53 +1734,61 @@ class HaveIBeenPwnedCollector:
                     'breaches': []
                 }
             
-            url = f'https://haveibeenpwned.com/api/v3/breachedaccount/{email}'
-            response = requests.get(url, headers=self.headers, timeout=10)
-            
-            if response.status_code == 404:
+            # Names only (cached, rate-limited per key); metadata is joined from the local breach catalog
+            budget = call_timeout(self.deadline, 10)
+            lookup = BREACH_LOOKUP.account(email, self.api_key, timeout=budget, max_wait=budget)
+            names = lookup.get('breaches')
+
+            if names is None:
+                return {
+                    'found': False,
+                    'error': lookup.get('error', 'Lookup failed')
+                }
+            elif not names:
                 return {
                     'found': True,
                     'email': email,
                     'breaches': [],
+                    'cached': lookup['cached'],
                     'status': 'No breaches found'
                 }
-            elif response.status_code == 200:
-                breaches = response.json()
+            else:
                 return {
                     'found': True,
                     'email': email,
-                    'breach_count': len(breaches),
+                    'breach_count': len(names),
+                    'cached': lookup['cached'],
                     'breaches': [
                         {
-                            'name': breach.get('Name'),
-                            'title': breach.get('Title'),
-                            'domain': breach.get('Domain'),
-                            'breach_date': breach.get('BreachDate'),
-                            'added_date': breach.get('AddedDate'),
-                            'pwn_count': breach.get('PwnCount'),
-                            'description': breach.get('Description'),
-                            'data_classes': breach.get('DataClasses', [])
+                            'name': info.get('name'),
+                            'title': info.get('title'),
+                            'domain': info.get('domain'),
+                            'breach_date': info.get('breach_date'),
+                            'added_date': info.get('added_date'),
+                            'pwn_count': info.get('pwn_count'),
+                            'data_classes': info.get('data_classes', [])
                         }
-                        for breach in breaches
+                        for info in BREACH_CATALOG.join(names)
                     ],
-                    'status': 'Breaches found'
-                }
-            else:
-                return {
-                    'found': False,
-                    'error': f'API returned status code {response.status_code}'
+                    'status': 'Breaches found',
+                    # Still loading in the background: breach details are bare names this time
+                    **({'catalog': 'unavailable'} if not BREACH_CATALOG.available else {})
                 }
         except Exception as e:
             return {'error': str(e), 'found': False}
 
 
 
+@register_collector('reddit', cost='cheap', rate_limit_group='reddit')
 class RedditCollector:
+    def __init__(self, deadline: Optional[RequestDeadline] = None):
+        self.deadline = deadline
+
     def collect(self, username: str) -> Dict[str, Any]:
         try:
             headers = {'User-Agent': 'OSINT-Dashboard/1.0'}
             url = f'https://www.reddit.com/user/{username}/about.json'
-            response = requests.get(url, headers=headers, timeout=10)
+            response = HTTP.get(url, headers=headers, timeout=call_timeout(self.deadline, 10))
             
             if response.status_code != 200:
                 return {'error': 'User not found', 'found': False}
@@ -1473,7 +1824,23 @@ class AIAnalyzer:
     def __init__(self, service: str):
         self.service = service
 
-    def analyze_data(self, collected_data: Dict[str, Any], target: str) -> Dict[str, Any]:
+    def analyze_data(self, collected_data: Dict[str, Any], target: str,
+                     deadline: Optional[RequestDeadline] = None) -> Dict[str, Any]:
+        if deadline is not None and deadline.remaining() < AI_MIN_SECONDS:
+            deadline.truncate('ai_analysis', 'skipped')
+            return {
+                "summary": "AI analysis skipped: request deadline reached",
+                "partial": True,
+                "entities": {},
+                "patterns": [],
+                "correlations": [],
+                "risk_assessment": {
+                    "score": 0,
+                    "level": "UNKNOWN",
+                    "factors": []
+                }
+            }
+
         if not self.service:
             return {
                 "summary": "AI analysis unavailable",
@@ -1535,21 +1902,26 @@ Rules:
 """
 
 
+        timeout = call_timeout(deadline, 60)
         try:
             if self.service == "groq":
-                return self._call_groq(prompt)
+                return self._call_groq(prompt, timeout)
             elif self.service == "gemini":
-                return self._call_gemini(prompt)
+                return self._call_gemini(prompt, timeout)
             elif self.service == "anthropic":
-                return self._call_anthropic(prompt)
+                return self._call_anthropic(prompt, timeout)
             elif self.service == "huggingface":
-                return self._call_huggingface(prompt)
+                return self._call_huggingface(prompt, timeout)
             else:
                 return {"summary": "Unsupported AI service"}
 
         except Exception as e:
+            timed_out = is_timeout_error(e)
+            if timed_out and deadline is not None:
+                deadline.truncate('ai_analysis', 'timeout')
             return {
                 "summary": f"AI failed: {str(e)}",
+                "partial": timed_out,
                 "entities": {},
                 "patterns": [],
                 "correlations": [],
@@ -1562,8 +1934,8 @@ Rules:
 
     # ---------- PROVIDERS ----------
 
-    def _call_groq(self, prompt: str) -> Dict[str, Any]:
-        response = requests.post(
+    def _call_groq(self, prompt: str, timeout: float = 60) -> Dict[str, Any]:
+        response = HTTP.post(
             "https://api.groq.com/openai/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {GROQ_API_KEY}",
@@ -1575,39 +1947,40 @@ Rules:
                 "temperature": 0.3,
                 "max_tokens": 2000
             },
-            timeout=60
+            timeout=timeout
         )
         response.raise_for_status()
         return self._parse(response.json()["choices"][0]["message"]["content"])
 
-    def _call_gemini(self, prompt: str) -> Dict[str, Any]:
-        response = requests.post(
+    def _call_gemini(self, prompt: str, timeout: float = 60) -> Dict[str, Any]:
+        response = HTTP.post(
             f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY}",
             headers={"Content-Type": "application/json"},
             json={"contents": [{"parts": [{"text": prompt}]}]},
-            timeout=60
+            timeout=timeout
         )
         response.raise_for_status()
         return self._parse(
             response.json()["candidates"][0]["content"]["parts"][0]["text"]
         )
 
-    def _call_anthropic(self, prompt: str) -> Dict[str, Any]:
+    def _call_anthropic(self, prompt: str, timeout: float = 60) -> Dict[str, Any]:
         import anthropic
         client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
         msg = client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=2000,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
+            timeout=timeout
         )
         return self._parse(msg.content[0].text)
 
-    def _call_huggingface(self, prompt: str) -> Dict[str, Any]:
-        response = requests.post(
+    def _call_huggingface(self, prompt: str, timeout: float = 60) -> Dict[str, Any]:
+        response = HTTP.post(
             "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.2",
             headers={"Authorization": f"Bearer {HUGGINGFACE_API_KEY}"},
             json={"inputs": prompt},
-            timeout=60
+            timeout=timeout
         )
         response.raise_for_status()
         data = response.json()
@@ -1723,25 +2096,41 @@ def build_multi_modal_fusion(results, platform_presence):
         "key_findings": key_findings
     }
 
-def add_canonical(platform_key, data, profile_url, verification, exists):
+def add_canonical(site: SiteRule, target: str, data: Optional[Dict[str, Any]], presence: Dict[str, Any]):
     """
     Add platform to canonical profiles if username EXISTS,
     even if collector data is weak or partial
     """
+    if site.existence == 'collector':
+        exists = (data or {}).get("found", False)
+    else:
+        exists = presence.get("exists", False)
     if exists is not True:
         return None
 
     return {
-        "platform": platform_key.capitalize(),
-        "platform_key": platform_key,
+        "platform": site.name.capitalize(),
+        "platform_key": site.name,
         "username": data.get("profile", {}).get("username") if data else "",
-        "profile_url": profile_url,
-        "verification": verification,
+        "profile_url": site.profile_url_for(target),
+        "verification": (data or {}).get("verification", "weak_verified"),
         "exists": True
     }
 
 
-
+def presence_record(site: SiteRule, target: str, presence: Dict[str, Any]) -> Dict[str, Any]:
+    """Result record for a catalog site that has no dedicated collector"""
+    if presence.get("exists") is not True:
+        return {"found": False}
+    return {
+        "found": True,
+        "verification": "weak_verified",
+        "platform": site.name.capitalize(),
+        "profile": {
+            "username": target,
+            "profile_url": site.profile_url_for(target)
+        }
+    }
 
 
 # ==================== API ENDPOINTS ====================
@@ -1753,160 +2142,62 @@ def analyze():
         data = request.get_json()
         target = data.get('target', '')
         selected_platforms = set(data.get('platforms', []))
+        depth = parse_collection_depth(data.get('depth'))
+        collection_mode = data.get('collection_mode', 'fast')
+        # One end-to-end budget; collection stops early enough to leave room for AI
+        deadline = RequestDeadline(parse_deadline_seconds(data.get('deadline_seconds')))
+        collection = deadline.reserve(min(AI_RESERVE if AI_SERVICE else 1.0, deadline.budget * 0.4))
 
         if not target:
             return jsonify({'error': 'Target parameter required'}), 400
+        if collection_mode not in COLLECTION_MODES:
+            return jsonify({'error': f"collection_mode must be one of {', '.join(COLLECTION_MODES)}"}), 400
 
         robustness_handler = RealWorldOSINTHandler()
 
-        # 🔍 Username existence detection
-        enumerator = UniversalUsernameEnumerator(PLATFORM_RULES)
-        raw_presence = enumerator.check_username(target)
-
-        platform_presence = {
-            p: info for p, info in raw_presence.items()
-            if p in selected_platforms
-        }
-
-        # Initialize collectors
-        github_collector = GitHubCollector(GITHUB_TOKEN)
-        gitlab_collector = GitLabCollector()
-        reddit_collector = RedditCollector()
-        instagram_collector = InstagramCollector()
-        youtube_collector = YouTubeCollector()
-        facebook_collector = FacebookCollector()
-        linkedin_collector = LinkedInCollector()
-        twitter_collector = TwitterCollector()
-        hibp_collector = HaveIBeenPwnedCollector(HIBP_API_KEY)
+        # 🔍 Username existence detection (selected catalog sites only)
+        catalog = PLATFORM_CATALOG.current()
+        enumerator = UniversalUsernameEnumerator(catalog)
+        platform_presence = enumerator.check_username(target, sorted(selected_platforms), collection.share(0.4))
 
         results = {}
         canonical_profiles = {}
 
         # -------- COLLECTORS --------
-
-        if 'github' in selected_platforms:
-            gh_data = github_collector.collect(target)
-            results['github'] = gh_data
-            cp = add_canonical(
-                "github",
-                gh_data,
-                f"https://github.com/{target}",
-                gh_data.get("verification", "weak_verified"),
-                platform_presence.get("github", {}).get("exists", False)
-            )
-            if cp:
-                canonical_profiles["github"] = cp
-
-        if 'gitlab' in selected_platforms:
-            gl_data = gitlab_collector.collect(target)
-            results['gitlab'] = gl_data
-            cp = add_canonical(
-                "gitlab",
-                gl_data,
-                gl_data.get("profile", {}).get("profile_url"),
-                gl_data.get("verification", "weak_verified"),
-                platform_presence.get("gitlab", {}).get("exists", False)
-            )
-            if cp:
-                canonical_profiles["gitlab"] = cp
-
-        if 'reddit' in selected_platforms:
-            rd_data = reddit_collector.collect(target)
-            results['reddit'] = rd_data
-            cp = add_canonical(
-                "reddit",
-                rd_data,
-                f"https://www.reddit.com/user/{target}",
-                rd_data.get("verification", "weak_verified"),
-                rd_data.get("found", False)
-            )
-            if cp:
-                canonical_profiles["reddit"] = cp
-
-        if 'instagram' in selected_platforms:
-            ig_data = instagram_collector.collect(target)
-            results['instagram'] = ig_data
-
-            cp = add_canonical(
-                "instagram",
-                ig_data,
-                f"https://www.instagram.com/{target}/",
-                "weak_verified",
-                platform_presence.get("instagram", {}).get("exists", False)
-            )
-            if cp:
-               canonical_profiles["instagram"] = cp
-
-        if 'youtube' in selected_platforms:
-            yt_data = youtube_collector.collect(target)
-            results['youtube'] = yt_data
-
-            cp = add_canonical(
-                 "youtube",
-                 yt_data,
-                 f"https://www.youtube.com/@{target}",
-                 "weak_verified",
-                 platform_presence.get("youtube", {}).get("exists", False)
-           )
+        # Registry-driven: one lane per rate-limit group, costliest lanes first
+        context = CollectionContext(
+            target=target,
+            deadline=collection,
+            depth=depth,
+            credentials={'GITHUB_TOKEN': GITHUB_TOKEN, 'HIBP_API_KEY': HIBP_API_KEY},
+            # Sites marked "existence": "collector" don't trust the probe, so it can't gate them
+            presence={
+                name: entry for name, entry in platform_presence.items()
+                if catalog.site(name) is None or catalog.site(name).existence != 'collector'
+            },
+            deep=collection_mode == 'deep'
+        )
+        results.update(run_collectors(select_collectors(target, selected_platforms), context))
+
+        # Catalog-only sites get a presence record; canonical profiles follow catalog order
+        for site in catalog.select(selected_platforms):
+            presence = platform_presence.get(site.name, {})
+            if site.name not in results:
+                results[site.name] = presence_record(site, target, presence)
+            cp = add_canonical(site, target, results[site.name], presence)
             if cp:
-               canonical_profiles["youtube"] = cp
-
-        if 'facebook' in selected_platforms:
-            fb_data = facebook_collector.collect(target)
-            results['facebook'] = fb_data
-
-            cp = add_canonical(
-                "facebook",
-                 fb_data,
-                 f"https://www.facebook.com/{target}",
-                 "weak_verified",
-                  platform_presence.get("facebook", {}).get("exists", False)
-    )
-
-        if cp:
-           canonical_profiles["facebook"] = cp
-
-        if 'linkedin' in selected_platforms:
-            li_data = linkedin_collector.collect(target)
-            results['linkedin'] = li_data
-
-            cp = add_canonical(
-                "linkedin",
-                li_data,
-                f"https://www.linkedin.com/in/{target}/",
-                "weak_verified",
-                platform_presence.get("linkedin", {}).get("exists", False)
-            )
-
-        if cp:
-            canonical_profiles["linkedin"] = cp
-    
-
-
-
-
+                canonical_profiles[site.name] = cp
 
+        # Raw results stay untouched; derived attributes live in this overlay
+        challenge7_results = robustness_handler.process_results(results, target, deadline)
+        annotated = challenge7_results['processed_results']
 
-        if 'twitter' in selected_platforms:
-           tw_data = twitter_collector.collect(target)
-           results['twitter'] = tw_data
-
-           cp = add_canonical(
-           "twitter",
-           tw_data,
-            f"https://x.com/{target}",
-            "weak_verified",
-         platform_presence.get("twitter", {}).get("exists", False)
-    )
-
-        if cp:
-            canonical_profiles["twitter"] = cp
-
-        # Breach check
-        if '@' in target:
-            results['haveibeenpwned'] = hibp_collector.collect(target)
-        
-        challenge7_results = robustness_handler.process_results(results, target)
+        # -------- CROSS-TARGET ENTITY INDEX --------
+        # Cross-target matches are admin-only (/api/entities/*), never in this response
+        try:
+            ENTITY_INDEX.record_scan(target, challenge7_results['consolidated_intelligence'])
+        except Exception as e:
+            print(f"⚠️ Entity index update failed: {e}")
 
         # -------- RISK ASSESSMENT --------
         risk_engine = RiskAssessmentEngine(AI_SERVICE)
@@ -1916,7 +2207,9 @@ def analyze():
             if results.get(p, {}).get("found") is True
         }
 
-        risk_assessment = risk_engine.assess_risks(filtered_results, target)
+        # Two AI stages follow; the risk pass gets half of what is left when both run
+        risk_deadline = deadline.share(0.5) if AI_SERVICE else deadline
+        risk_assessment = risk_engine.assess_risks(filtered_results, target, annotated, risk_deadline)
         risk_report = risk_engine.to_frontend_format(risk_assessment)
 
         # -------- FUSION --------
@@ -1929,7 +2222,7 @@ def analyze():
         ai_analysis = {}
         if AI_SERVICE:
             analyzer = AIAnalyzer(AI_SERVICE)
-            ai_analysis = analyzer.analyze_data(results, target)
+            ai_analysis = analyzer.analyze_data(results, target, deadline)
 
      # ---- ENTITY SAFETY NET (DERIVED ENTITIES) ----
         entities = ai_analysis.get("entities", {})
@@ -1984,8 +2277,8 @@ def analyze():
                 "verification": v["verification"],
                 "exists": True,
                 # ✨ Challenge 7 additions
-                "data_completeness": results[k].get('profile', {}).get('data_completeness', 0),
-                "freshness": results[k].get('freshness', 'FRESH')
+                "data_completeness": annotated.annotation(k, 'data_completeness', 0),
+                "freshness": annotated.annotation(k, 'freshness', 'FRESH')
             }
             for k, v in canonical_profiles.items()
         ]
@@ -2004,15 +2297,176 @@ def analyze():
             "consolidated_intelligence": challenge7_results['consolidated_intelligence'],
             "behavioral_patterns": challenge7_results['behavioral_patterns'],
             "data_quality": challenge7_results['data_quality'],
-            "duplicates_removed": challenge7_results['duplicates_removed']
+            "duplicates_removed": challenge7_results['duplicates_removed'],
+            "deadline": deadline.report()
         }
 
+        if response["deadline"]["partial"]:
+            stages = ', '.join(t['stage'] for t in response["deadline"]["truncated_stages"])
+            print(f"⏱️ Partial analysis for {target} after {response['deadline']['elapsed_seconds']}s: {stages}")
+
         return jsonify(response), 200
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
     
 
+@app.route('/api/sweeps', methods=['POST'])
+@admin_required
+def start_username_sweep():
+    """Start a username permutation sweep; poll GET /api/sweeps/<job_id> for progress"""
+    data = request.get_json(silent=True) or {}
+    seed = str(data.get('seed', '')).strip()
+    if not seed:
+        return jsonify({'error': 'seed parameter required'}), 400
+
+    catalog = PLATFORM_CATALOG.current()
+    platforms = data.get('platforms')
+    if platforms is None:
+        # Default to the sites whose probes are reliable enough to stop on
+        platforms = [site.name for site in catalog.select() if site.confidence == 'HIGH']
+    if not isinstance(platforms, list) or not catalog.select(platforms):
+        return jsonify({'error': 'platforms must list at least one catalog site'}), 400
+
+    stop_on = data.get('stop_on', 'HIGH')
+    if stop_on is not None and stop_on not in CONFIDENCE_RANK:
+        return jsonify({'error': f"stop_on must be one of {', '.join(CONFIDENCE_RANK)} or null"}), 400
+
+    try:
+        max_candidates = int(data.get('max_candidates', SWEEP_DEFAULT_CANDIDATES))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'max_candidates must be an integer'}), 400
+    if not 1 <= max_candidates <= SWEEP_MAX_CANDIDATES:
+        return jsonify({'error': f'max_candidates must be between 1 and {SWEEP_MAX_CANDIDATES}'}), 400
+
+    job = UniversalUsernameEnumerator(catalog).sweep(seed, platforms, max_candidates, stop_on)
+    if job is None:
+        return jsonify({'error': f'{SWEEP_MAX_ACTIVE} sweeps already running; try again later'}), 429
+    print(f"🔀 Sweep {job.job_id} started: '{seed}' across {len(job.platforms)} platform(s)")
+    return jsonify({'job_id': job.job_id, 'status_url': f'/api/sweeps/{job.job_id}'}), 202
+
+
+@app.route('/api/sweeps/<job_id>', methods=['GET'])
+@admin_required
+def get_username_sweep(job_id):
+    """Progress and matches of a sweep"""
+    job = SWEEP_JOBS.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Sweep not found'}), 404
+    return jsonify(job.to_dict()), 200
+
+
+@app.route('/api/sweeps/<job_id>', methods=['DELETE'])
+@admin_required
+def cancel_username_sweep(job_id):
+    """Stop a running sweep; probes already in flight finish"""
+    job = SWEEP_JOBS.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Sweep not found'}), 404
+    job.stop('cancelled')
+    return jsonify(job.to_dict()), 200
+
+
+@app.route('/api/breaches/bulk', methods=['POST'])
+@admin_required
+def start_breach_audit():
+    """Check many addresses against HIBP in the background; poll GET /api/breaches/bulk/<job_id>"""
+    if not HIBP_API_KEY:
+        return jsonify({'error': 'HaveIBeenPwned API key required'}), 400
+    data = request.get_json(silent=True) or {}
+    emails = data.get('emails')
+    if not isinstance(emails, list) or not all(isinstance(email, str) for email in emails):
+        return jsonify({'error': 'emails must be a list of strings'}), 400
+
+    job = BreachJob(emails)
+    if not job.accounts:
+        return jsonify({'error': 'emails must contain at least one address'}), 400
+    if len(job.accounts) > BULK_MAX_ACCOUNTS:
+        return jsonify({'error': f'At most {BULK_MAX_ACCOUNTS} addresses per job'}), 400
+
+    BREACH_JOBS.add(job)
+    start_breach_job(job, HIBP_API_KEY)
+    print(f"🔓 Breach audit {job.job_id} started: {len(job.accounts)} address(es)")
+    return jsonify({'job_id': job.job_id, 'status_url': f'/api/breaches/bulk/{job.job_id}'}), 202
+
+
+@app.route('/api/breaches/bulk/<job_id>', methods=['GET'])
+@admin_required
+def get_breach_audit(job_id):
+    """Progress and findings of a bulk audit; ?accounts=0 returns the summary only"""
+    job = BREACH_JOBS.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Breach audit not found'}), 404
+    return jsonify(job.to_dict(include_accounts=request.args.get('accounts', '1') != '0')), 200
+
+
+@app.route('/api/breaches/bulk/<job_id>', methods=['DELETE'])
+@admin_required
+def cancel_breach_audit(job_id):
+    """Stop a running audit after the lookup in flight"""
+    job = BREACH_JOBS.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Breach audit not found'}), 404
+    job.stop('cancelled')
+    return jsonify(job.to_dict(include_accounts=False)), 200
+
+
+@app.route('/api/passwords/exposure', methods=['POST'])
+def password_exposure():
+    """
+    Breach count for a password via the k-anonymity range API. Passwords are
+    hashed client-side and never accepted here. Send {"prefix": "<5 hex>"} to
+    get the whole range back and match locally (this server never sees the
+    full hash), or {"sha1": "<hex digest>"} for the count directly.
+    """
+    data = request.get_json(silent=True) or {}
+    if 'password' in data:
+        return jsonify({'error': 'Send the SHA-1 digest or its 5-character prefix, not the password'}), 400
+    prefix, digest = data.get('prefix'), data.get('sha1')
+    if not isinstance(prefix, str) and not isinstance(digest, str):
+        return jsonify({'error': 'prefix or sha1 parameter required'}), 400
+
+    try:
+        if isinstance(prefix, str):
+            suffixes = BREACH_LOOKUP.password_range(prefix)
+            return jsonify({'prefix': prefix.upper(), 'suffixes': suffixes}), 200
+        count = BREACH_LOOKUP.password_exposure(digest)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except requests.RequestException as e:
+        return jsonify({'error': f'Pwned Passwords unavailable: {e}'}), 502
+    return jsonify({'pwned': count > 0, 'count': count}), 200
+
+
+@app.route('/api/entities/lookup', methods=['GET'])
+@admin_required
+def lookup_entity():
+    """Which scanned targets share this email/username/name/location/company/link"""
+    kind = request.args.get('kind', '')
+    value = request.args.get('value', '')
+    if kind not in CONSOLIDATED_KINDS.values():
+        return jsonify({'error': f"kind must be one of: {', '.join(CONSOLIDATED_KINDS.values())}"}), 400
+    if not value:
+        return jsonify({'error': 'value parameter required'}), 400
+
+    try:
+        limit = min(int(request.args.get('limit', 100)), 1000)
+        matches = ENTITY_INDEX.lookup(kind, value, exclude_target=request.args.get('exclude'), limit=limit)
+        return jsonify({'kind': kind, 'value': value, 'matches': matches}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/entities/shared/<target>', methods=['GET'])
+@admin_required
+def shared_entities(target):
+    """Other targets sharing any entity with a scanned target"""
+    try:
+        return jsonify({'target': target, 'related': ENTITY_INDEX.shared_with(target)}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check endpoint"""
@@ -2031,7 +2485,29 @@ def health():
             'video_processing': True,
             'image_geolocation': AI_SERVICE in ['groq', 'gemini', 'anthropic'] if AI_SERVICE else False,
             'risk_assessment': True
-        }
+        },
+        'risk_engine': {
+            'rules_version': RISK_RULES.current().version,
+            'partial_cache': PLATFORM_RISK_CACHE.stats(),
+            'breach_catalog': BREACH_CATALOG.stats(),
+            'breach_cache': BREACH_LOOKUP.stats()
+        },
+        'http_cache': HTTP.stats(),
+        'platform_catalog': {
+            'version': PLATFORM_CATALOG.current().version,
+            'sites': len(PLATFORM_CATALOG.current().sites)
+        },
+        'dns_cache': DNS_CACHE.stats()
+    }), 200
+
+
+@app.route('/api/platforms', methods=['GET'])
+def list_platforms():
+    """Catalog sites the analyze endpoint can probe"""
+    catalog = PLATFORM_CATALOG.current()
+    return jsonify({
+        'version': catalog.version,
+        'platforms': [site.to_dict() for site in catalog.select()]
     }), 200
 
 
@@ -2211,6 +2687,42 @@ def get_admin_stats():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/admin/risk-rules', methods=['GET'])
+@admin_required
+def get_risk_rules():
+    """Show the active risk rules version (Admin only)"""
+    rules = RISK_RULES.current()
+    return jsonify({
+        'version': rules.version,
+        'source': rules.source,
+        'last_error': RISK_RULES.last_error
+    }), 200
+
+@app.route('/api/admin/risk-rules/reload', methods=['POST'])
+@admin_required
+def reload_risk_rules():
+    """Reload risk rules from disk without restarting workers (Admin only)"""
+    try:
+        rules = RISK_RULES.reload(force=True)
+        if RISK_RULES.last_error:
+            return jsonify({
+                'error': f'Rules rejected: {RISK_RULES.last_error}',
+                'version': rules.version
+            }), 400
+        return jsonify({'success': True, 'version': rules.version}), 200
+    except RiskRulesError as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/admin/breach-catalog/refresh', methods=['POST'])
+@admin_required
+def refresh_breach_catalog():
+    """Bulk-refresh the local breach catalog from HaveIBeenPwned (Admin only)"""
+    try:
+        count = BREACH_CATALOG.refresh()
+        return jsonify({'success': True, 'breaches': count}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/uploads/<filename>')
 def serve_file(filename):
     """Serve uploaded files"""
@@ -2245,6 +2757,20 @@ def serve_file(filename):
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+def catalog_hosts() -> List[str]:
+    """Every host a scan may connect to: catalog probe/profile URLs plus API_HOSTS"""
+    hosts = set(API_HOSTS)
+    for site in PLATFORM_CATALOG.current().select():
+        hosts.update(urlparse(url.format('x')).hostname for url in (site.url, site.profile_url))
+    hosts.discard(None)
+    return sorted(hosts)
+
+
+# All requests-based traffic resolves through the in-process DNS cache
+install_dns_cache(DNS_CACHE)
+if DNS_PREWARM:
+    DNS_CACHE.prewarm_async(catalog_hosts())
+
 if __name__ == '__main__':
     print(f"🚀 CHAKRAVYUH 1.0 OSINT Backend Starting...")
     print(f"🔡 AI Service: {AI_SERVICE or 'None configured'}")
@@ -0,0 +1,411 @@
+"""
+Benchmark harness for the risk assessment pipeline and robustness handler
+Runs each stage against synthetic footprints and compares against a
+checked-in baseline so regressions show up in review.
+
+Usage:
+    python benchmark.py                      # run and compare to baseline
+    python benchmark.py --check              # exit 1 on regression
+    python benchmark.py --update-baseline    # rewrite benchmark_baseline.json
+    python benchmark.py --sizes huge --stages assess_risks_cold --ai stub
+"""
+
+import argparse
+import copy
+import json
+import os
+import platform as py_platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Any, Callable, Tuple
+
+from app import (
+    AIRiskAnalyzer,
+    RiskAssessmentEngine,
+    RiskClassifier,
+    RiskScorer,
+    PLATFORM_RISK_CACHE,
+)
+from challenge7_backend import RealWorldOSINTHandler, AnnotatedResults
+from risk_rules import RISK_RULES
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+# ==================== SYNTHETIC FOOTPRINTS ====================
+
+FOOTPRINTS = {
+    # platforms, repos per code host, commits, breaches
+    'small': {'platforms': ['github', 'reddit'], 'repos': 3, 'commits': 3, 'breaches': 0},
+    'typical': {
+        'platforms': ['github', 'gitlab', 'reddit', 'twitter', 'instagram', 'haveibeenpwned'],
+        'repos': 10, 'commits': 15, 'breaches': 4
+    },
+    'huge': {
+        'platforms': ['github', 'gitlab', 'reddit', 'twitter', 'instagram', 'youtube',
+                      'facebook', 'linkedin', 'haveibeenpwned'],
+        'repos': 500, 'commits': 100, 'breaches': 250
+    },
+}
+
+DATA_CLASSES = ['Email addresses', 'Passwords', 'Usernames', 'IP addresses', 'Names',
+                'Phone numbers', 'Dates of birth', 'Physical addresses', 'Password hints']
+
+
+def _iso(rng: random.Random, start_year: int = 2012) -> str:
+    """Random UTC timestamp between start_year and now, as the APIs format them"""
+    max_days = max((time.gmtime().tm_year - start_year) * 365, 1)
+    epoch = time.time() - rng.randint(0, max_days) * 86400 - rng.randint(0, 86399)
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(epoch))
+
+
+def generate_collected_data(size: str, seed: int = 7) -> Dict[str, Any]:
+    """Build a seeded collected_data dict shaped like the real collectors' output (dates relative to today)"""
+    spec = FOOTPRINTS[size]
+    rng = random.Random(seed)
+    username = 'bench_user'
+    data: Dict[str, Any] = {}
+
+    for platform in spec['platforms']:
+        if platform == 'github':
+            data['github'] = {
+                'found': True,
+                'verification': 'api_verified',
+                'platform': 'GitHub',
+                'profile': {
+                    'username': username, 'name': 'Bench User', 'bio': 'Builds things',
+                    'location': 'Bhubaneswar, India', 'email': f'{username}@example.com',
+                    'company': '@example-corp', 'blog': 'https://bench.example.com',
+                    'twitter': username, 'public_repos': spec['repos'], 'followers': rng.randint(0, 5000),
+                    'following': rng.randint(0, 500), 'created_at': _iso(rng, 2010), 'updated_at': _iso(rng, 2024)
+                },
+                'repositories': [
+                    {'name': f'repo-{i}', 'description': f'Synthetic repository {i}', 'language': 'Python',
+                     'stars': rng.randint(0, 900), 'forks': rng.randint(0, 90), 'updated': _iso(rng)}
+                    for i in range(spec['repos'])
+                ],
+                'recent_commits': [
+                    {'message': f'Commit {i}', 'date': _iso(rng, 2024), 'author': 'Bench User'}
+                    for i in range(spec['commits'])
+                ]
+            }
+        elif platform == 'gitlab':
+            data['gitlab'] = {
+                'found': True,
+                'verification': 'api_verified',
+                'platform': 'GitLab',
+                'profile': {
+                    'username': username, 'name': 'Bench User', 'bio': '', 'location': None,
+                    'website': 'https://bench.example.com', 'created_at': _iso(rng, 2015),
+                    'profile_url': f'https://gitlab.com/{username}'
+                },
+                'projects': [
+                    {'name': f'project-{i}', 'description': None, 'stars': rng.randint(0, 50),
+                     'last_activity': _iso(rng)}
+                    for i in range(spec['repos'])
+                ]
+            }
+        elif platform == 'reddit':
+            data['reddit'] = {
+                'found': True,
+                'verification': 'weak_verified',
+                'platform': 'Reddit',
+                'profile': {
+                    'username': username, 'created': _iso(rng, 2012).rstrip('Z'),
+                    'karma': {'post': rng.randint(0, 9000), 'comment': rng.randint(0, 9000), 'total': 0},
+                    'is_gold': False, 'is_mod': rng.random() < 0.5, 'verified': True
+                }
+            }
+        elif platform == 'haveibeenpwned':
+            breaches = [
+                {'name': f'Breach{i}', 'title': f'Breach {i}', 'domain': f'breach{i}.example',
+                 'breach_date': _iso(rng, 2008)[:10], 'added_date': _iso(rng, 2015),
+                 'pwn_count': rng.randint(1000, 10 ** 8),
+                 'description': '<p>' + 'Synthetic breach description. ' * 12 + '</p>',
+                 'data_classes': rng.sample(DATA_CLASSES, 4)}
+                for i in range(spec['breaches'])
+            ]
+            data['haveibeenpwned'] = {
+                'found': True, 'email': f'{username}@example.com', 'breach_count': len(breaches),
+                'breaches': breaches, 'status': 'Breaches found'
+            }
+        else:
+            data[platform] = {
+                'found': True,
+                'verification': 'weak_verified',
+                'platform': platform.capitalize(),
+                'profile': {'username': username, 'profile_url': f'https://{platform}.example/{username}'}
+            }
+
+    return data
+
+
+# ==================== AI STUB ====================
+
+class StubAIRiskAnalyzer(AIRiskAnalyzer):
+    """AIRiskAnalyzer that returns a canned response instead of calling a provider"""
+
+    CANNED = json.dumps({
+        'risk_items': [
+            {'category': 'Contact Details', 'item': 'Public email', 'risk_level': 'MEDIUM', 'score': 5.5,
+             'platforms': ['github'], 'recency': None, 'action': 'Hide email',
+             'exploitability': 'Phishing', 'details': 'Stub'}
+        ] * 5,
+        'overall_assessment': {'score': 6.0, 'level': 'MEDIUM', 'summary': 'Stubbed analysis'},
+        'recommendations': ['Enable 2FA'],
+        'attack_vectors': ['Phishing'],
+        'correlations': ['Same username everywhere'],
+        'timeline': 'MODERATE'
+    })
+
+    def __init__(self):
+        super().__init__('stub')
+
+    def _call_ai_service(self, prompt: str) -> str:
+        return self.CANNED
+
+
+def make_engine(ai_mode: str) -> RiskAssessmentEngine:
+    engine = RiskAssessmentEngine(None)
+    if ai_mode == 'stub':
+        engine.ai_analyzer = StubAIRiskAnalyzer()
+    return engine
+
+
+# ==================== STAGES ====================
+
+def _profile_fields(data: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    return [
+        (key, str(value), platform)
+        for platform, platform_data in data.items()
+        for key, value in platform_data.get('profile', {}).items()
+        if value and value != 'Unknown'
+    ]
+
+
+def stage_classify(data: Dict[str, Any], ai_mode: str) -> Callable[[], Any]:
+    fields = _profile_fields(data)
+    rules = RISK_RULES.current()
+    classify = RiskClassifier.classify_data
+
+    def run():
+        for key, value, platform in fields:
+            classify(key, value, platform, rules)
+    return run
+
+
+def stage_score(data: Dict[str, Any], ai_mode: str) -> Callable[[], Any]:
+    rules = RISK_RULES.current()
+    inputs = [(rules.classify(key, value)[1], platform) for key, value, platform in _profile_fields(data)]
+    inputs += [(9.0, 'HaveIBeenPwned')] * len(data.get('haveibeenpwned', {}).get('breaches', []))
+
+    def run():
+        for base_score, platform in inputs:
+            score = RiskScorer.calculate_score(base_score, [platform], recency_days=120, is_public=True)
+            RiskScorer.determine_risk_level(score, rules)
+    return run
+
+
+def stage_assess_risks_cold(data: Dict[str, Any], ai_mode: str) -> Callable[[], Any]:
+    engine = make_engine(ai_mode)
+
+    def run():
+        PLATFORM_RISK_CACHE._entries.clear()
+        engine.assess_risks(data, 'bench_user')
+    return run
+
+
+def stage_assess_risks_warm(data: Dict[str, Any], ai_mode: str) -> Callable[[], Any]:
+    engine = make_engine(ai_mode)
+    # As in analyze(): dates were already parsed into the handler's overlay
+    annotated = AnnotatedResults(data)
+    engine.assess_risks(data, 'bench_user', annotated)
+
+    def run():
+        engine.assess_risks(data, 'bench_user', annotated)
+    return run
+
+
+def stage_to_frontend_format(data: Dict[str, Any], ai_mode: str) -> Callable[[], Any]:
+    engine = make_engine(ai_mode)
+    assessment = engine.assess_risks(data, 'bench_user')
+
+    def run():
+        engine.to_frontend_format(assessment)
+    return run
+
+
+def multipass_process_results(handler: RealWorldOSINTHandler, results: Dict[str, Any]) -> Dict[str, Any]:
+    """The original multi-pass process_results, kept as the reference for the fused version"""
+    for platform_name, data in results.items():
+        if data.get('found'):
+            results[platform_name] = handler.handle_platform_restrictions(platform_name, data)
+            results[platform_name] = handler.detect_outdated_data(results[platform_name], platform_name)
+            if results[platform_name].get('profile'):
+                results[platform_name]['profile'] = handler.handle_incomplete_data(results[platform_name]['profile'])
+
+    all_findings = handler._extract_all_findings(results)
+    deduplicated_findings = handler.deduplicate_data(all_findings)
+    return {
+        'consolidated_intelligence': handler.consolidate_scattered_data(results),
+        'behavioral_patterns': handler.detect_unknown_patterns(results),
+        'data_quality': handler.calculate_data_quality_score(results),
+        'duplicates_removed': len(all_findings) - len(deduplicated_findings),
+        'processed_results': results
+    }
+
+
+def stage_process_results(data: Dict[str, Any], ai_mode: str) -> Callable[[], Any]:
+    handler = RealWorldOSINTHandler()
+    pristine = copy.deepcopy(data)
+    fused = handler.process_results(data, 'bench_user')
+    if data != pristine:
+        raise AssertionError('process_results modified its input')
+
+    reference = multipass_process_results(handler, copy.deepcopy(data))
+    annotated = fused.pop('processed_results')
+    mutated = reference.pop('processed_results')
+    if fused != reference:
+        raise AssertionError('fused process_results output differs from the multi-pass reference')
+    for platform, record in mutated.items():
+        if not record.get('found'):
+            continue
+        expected = (record.get('freshness'), (record.get('profile') or {}).get('data_completeness'))
+        got = (annotated.annotation(platform, 'freshness'), annotated.annotation(platform, 'data_completeness'))
+        if expected != got:
+            raise AssertionError(f'{platform} annotations differ from the multi-pass reference')
+
+    def run():
+        handler.process_results(data, 'bench_user')
+    return run
+
+
+def stage_process_results_multipass(data: Dict[str, Any], ai_mode: str) -> Callable[[], Any]:
+    handler = RealWorldOSINTHandler()
+
+    results = copy.deepcopy(data)
+
+    def run():
+        multipass_process_results(handler, results)
+    return run
+
+
+STAGES: Dict[str, Callable[[Dict[str, Any], str], Callable[[], Any]]] = {
+    'classify': stage_classify,
+    'score': stage_score,
+    'assess_risks_cold': stage_assess_risks_cold,
+    'assess_risks_warm': stage_assess_risks_warm,
+    'to_frontend_format': stage_to_frontend_format,
+    'process_results': stage_process_results,
+    'process_results_multipass': stage_process_results_multipass,
+}
+
+
+# ==================== RUNNER ====================
+
+def measure(run: Callable[[], Any], min_time: float) -> Dict[str, float]:
+    """ops/sec over at least min_time seconds, plus traced peak memory for one op"""
+    run()  # warm-up
+    iterations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        run()
+        iterations += 1
+        elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'ops_per_sec': round(iterations / elapsed, 2),
+        'peak_kb': round(peak / 1024, 1)
+    }
+
+
+def run_benchmarks(sizes: List[str], stages: List[str], ai_mode: str, min_time: float) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    for size in sizes:
+        data = generate_collected_data(size)
+        for stage in stages:
+            name = f'{stage}[{size}]'
+            results[name] = measure(STAGES[stage](data, ai_mode), min_time)
+            print(f"  {name:<34} {results[name]['ops_per_sec']:>12,.1f} ops/s {results[name]['peak_kb']:>10,.1f} KB peak")
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Names of benchmarks slower than baseline by more than tolerance (or using more memory)"""
+    regressions = []
+    base_results = baseline.get('results', {})
+    for name, current in results.items():
+        base = base_results.get(name)
+        if not base:
+            continue
+        speed_ratio = current['ops_per_sec'] / base['ops_per_sec'] if base['ops_per_sec'] else 1.0
+        mem_ratio = current['peak_kb'] / base['peak_kb'] if base['peak_kb'] else 1.0
+        marker = ''
+        if speed_ratio < 1 - tolerance:
+            marker = '❌ slower'
+            regressions.append(name)
+        elif mem_ratio > 1 + tolerance:
+            marker = '❌ more memory'
+            regressions.append(name)
+        print(f"  {name:<34} speed x{speed_ratio:.2f}  memory x{mem_ratio:.2f} {marker}")
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the risk assessment pipeline')
+    parser.add_argument('--sizes', default=','.join(FOOTPRINTS), help='comma-separated footprint sizes')
+    parser.add_argument('--stages', default=','.join(STAGES), help='comma-separated stage names')
+    parser.add_argument('--ai', choices=['off', 'stub'], default='off', help='AI analyzer mode')
+    parser.add_argument('--min-time', type=float, default=0.5, help='seconds per benchmark')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--check', action='store_true', help='exit 1 if any benchmark regressed')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative regression')
+    args = parser.parse_args(argv)
+
+    sizes = [s for s in args.sizes.split(',') if s]
+    stages = [s for s in args.stages.split(',') if s]
+    unknown = [s for s in sizes if s not in FOOTPRINTS] + [s for s in stages if s not in STAGES]
+    if unknown:
+        parser.error(f"unknown size/stage: {', '.join(unknown)}")
+
+    print(f"📊 Risk pipeline benchmark (AI: {args.ai}, rules {RISK_RULES.current().version})")
+    results = run_benchmarks(sizes, stages, args.ai, args.min_time)
+
+    if args.update_baseline:
+        baseline = {
+            'python': py_platform.python_version(),
+            'machine': py_platform.machine(),
+            'ai_mode': args.ai,
+            'results': results
+        }
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"✅ Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("⚠️ No baseline file; run with --update-baseline to create one")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    print(f"\n📈 Compared to baseline (python {baseline.get('python')}, tolerance {args.tolerance:.0%})")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1 if args.check else 0
+    print("✅ No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Streaming marker scan for HTML existence probes
+Reads a response body in chunks and looks for must_contain /
+must_not_contain markers as it goes (case-insensitive, ’ folded to ',
+overlap kept across chunk boundaries). Reading stops as soon as the
+verdict is certain or the byte cap is reached, so a "not found" marker
+near the top of a multi-megabyte page costs one chunk.
+
+Usage:
+    from body_scan import probe_page
+
+    status, verdict = probe_page(HTTP.session, url, must_not_contain="Sorry, this page isn't available")
+    if status == 200 and verdict.exists:
+        ...
+    verdict.bytes_read, verdict.complete
+"""
+
+import codecs
+import os
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Iterable, Tuple
+
+import requests
+
+BODY_SCAN_MAX_BYTES = int(os.environ.get('BODY_SCAN_MAX_BYTES', str(1024 * 1024)))
+CHUNK_SIZE = 16 * 1024
+# Regex matches may straddle chunks by up to this many characters
+REGEX_OVERLAP = 4096
+
+_FOLD = str.maketrans({'’': "'", '‘': "'"})
+
+
+def fold(text: str) -> str:
+    """Case and apostrophe folding shared by markers and page text"""
+    return text.lower().translate(_FOLD)
+
+
+@dataclass
+class ScanVerdict:
+    exists: bool
+    matched: Optional[str]
+    bytes_read: int
+    complete: bool  # False when the byte cap cut the scan short
+
+
+class MarkerScanner:
+    """Incremental search for several markers across chunk boundaries"""
+
+    def __init__(self, markers: Iterable[str]):
+        self.markers = [fold(marker) for marker in markers if marker]
+        self.overlap = max((len(marker) for marker in self.markers), default=1) - 1
+        self._tail = ''
+
+    def feed(self, text: str) -> List[str]:
+        """Markers present in the text seen so far that end in this chunk"""
+        window = self._tail + fold(text)
+        matched = [marker for marker in self.markers if marker in window]
+        self._tail = window[-self.overlap:] if self.overlap else ''
+        return matched
+
+
+def scan_markers(chunks: Iterable[bytes], encoding: str = 'utf-8', must_contain: Optional[str] = None,
+                 must_not_contain: Optional[str] = None, max_bytes: int = BODY_SCAN_MAX_BYTES) -> ScanVerdict:
+    """
+    Verdict: exists when must_contain (if any) is present and must_not_contain
+    (if any) is absent. Stops reading once that can't change.
+    """
+    want = fold(must_contain) if must_contain else None
+    reject = fold(must_not_contain) if must_not_contain else None
+    if want is None and reject is None:
+        # Status-only check: nothing in the body can change the verdict
+        return ScanVerdict(True, None, 0, True)
+    scanner = MarkerScanner([m for m in (must_contain, must_not_contain) if m])
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+
+    seen_want = False
+    bytes_read = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        bytes_read += len(chunk)
+        for marker in scanner.feed(decoder.decode(chunk)):
+            if marker == reject:
+                return ScanVerdict(False, must_not_contain, bytes_read, True)
+            if marker == want:
+                seen_want = True
+        if seen_want and reject is None:
+            return ScanVerdict(True, must_contain, bytes_read, True)
+        if bytes_read >= max_bytes:
+            return ScanVerdict(seen_want or want is None, must_contain if seen_want else None, bytes_read, False)
+
+    for marker in scanner.feed(decoder.decode(b'', final=True)):
+        if marker == reject:
+            return ScanVerdict(False, must_not_contain, bytes_read, True)
+        if marker == want:
+            seen_want = True
+    return ScanVerdict(seen_want or want is None, must_contain if seen_want else None, bytes_read, True)
+
+
+def scan_regex(chunks: Iterable[bytes], pattern: 're.Pattern', encoding: str = 'utf-8',
+               max_bytes: int = BODY_SCAN_MAX_BYTES) -> ScanVerdict:
+    """Verdict: exists when the pattern matches the (unfolded) body; stops at the first match"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    tail = ''
+    bytes_read = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        bytes_read += len(chunk)
+        window = tail + decoder.decode(chunk)
+        match = pattern.search(window)
+        if match:
+            return ScanVerdict(True, match.group(0), bytes_read, True)
+        tail = window[-REGEX_OVERLAP:]
+        if bytes_read >= max_bytes:
+            return ScanVerdict(False, None, bytes_read, False)
+    match = pattern.search(tail + decoder.decode(b'', final=True))
+    return ScanVerdict(bool(match), match.group(0) if match else None, bytes_read, True)
+
+
+def body_encoding(response: requests.Response) -> str:
+    # requests assumes ISO-8859-1 for text/* without a charset; pages here are UTF-8
+    charset_given = 'charset' in response.headers.get('Content-Type', '').lower()
+    encoding = (response.encoding if charset_given else None) or 'utf-8'
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = 'utf-8'
+    return encoding
+
+
+def probe_page(session: requests.Session, url: str, must_contain: Optional[str] = None,
+               must_not_contain: Optional[str] = None, success_codes: Iterable[int] = (200,),
+               headers: Optional[dict] = None, timeout: float = 10,
+               max_bytes: int = BODY_SCAN_MAX_BYTES,
+               response_headers: Optional[dict] = None) -> Tuple[int, Optional[ScanVerdict]]:
+    """
+    GET a page and scan its body for markers. The body is only read for
+    success statuses; returns (status_code, verdict or None).
+    Pass a dict as response_headers to receive the response headers (e.g. Retry-After).
+    """
+    with session.get(url, headers=headers or {'User-Agent': 'Mozilla/5.0'},
+                     timeout=timeout, stream=True) as response:
+        if response_headers is not None:
+            response_headers.update(response.headers)
+        if response.status_code not in success_codes:
+            return response.status_code, None
+        verdict = scan_markers(
+            response.iter_content(CHUNK_SIZE), body_encoding(response), must_contain, must_not_contain, max_bytes
+        )
+        return response.status_code, verdict
+
+
+def probe_regex(session: requests.Session, url: str, pattern: 're.Pattern',
+                success_codes: Iterable[int] = (200,), headers: Optional[dict] = None,
+                timeout: float = 10, max_bytes: int = BODY_SCAN_MAX_BYTES,
+                response_headers: Optional[dict] = None) -> Tuple[int, Optional[ScanVerdict]]:
+    """Like probe_page, but the page must match a compiled regex"""
+    with session.get(url, headers=headers or {'User-Agent': 'Mozilla/5.0'},
+                     timeout=timeout, stream=True) as response:
+        if response_headers is not None:
+            response_headers.update(response.headers)
+        if response.status_code not in success_codes:
+            return response.status_code, None
+        verdict = scan_regex(response.iter_content(CHUNK_SIZE), pattern, body_encoding(response), max_bytes)
+        return response.status_code, verdict
@@ -0,0 +1,213 @@
+"""
+Local HaveIBeenPwned breach catalog
+Keeps breach metadata (date, data classes, pwn count) in an indexed SQLite
+file, refreshed in bulk from HIBP's public /breaches endpoint, and serves
+lookups from memory. Account lookups then only need breach names.
+
+Usage:
+    from breach_catalog import BREACH_CATALOG
+
+    BREACH_CATALOG.ensure_loaded()
+    info = BREACH_CATALOG.get('Adobe')
+    # {'name': 'Adobe', 'breach_date': '2013-10-04', 'pwn_count': 152445165, ...}
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Any, Optional, Iterable
+
+import requests
+
+from timestamps import parse_timestamp
+
+BREACH_CATALOG_PATH = os.environ.get(
+    'BREACH_CATALOG_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'breach_catalog.db')
+)
+BREACH_CATALOG_TTL = float(os.environ.get('BREACH_CATALOG_TTL_HOURS', '24')) * 3600
+HIBP_API_URL = os.environ.get('HIBP_API_URL', 'https://haveibeenpwned.com/api/v3').rstrip('/')
+HIBP_BREACHES_URL = f'{HIBP_API_URL}/breaches'
+
+
+class BreachCatalog:
+    """In-memory breach metadata index backed by an SQLite file"""
+
+    def __init__(self, path: str = BREACH_CATALOG_PATH, ttl: float = BREACH_CATALOG_TTL,
+                 source_url: str = HIBP_BREACHES_URL):
+        self.path = path
+        self.ttl = ttl
+        self.source_url = source_url
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._breaches: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self.refreshed_at = 0.0
+        # Bumped on every load; anything derived from catalog entries keys on it
+        self.version = 0
+        self._last_attempt = 0.0
+        self.last_error: Optional[str] = None
+
+    # ---------- STORAGE ----------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS breaches (
+                name TEXT PRIMARY KEY,
+                title TEXT,
+                domain TEXT,
+                breach_date TEXT,
+                breach_epoch REAL,
+                added_date TEXT,
+                pwn_count INTEGER,
+                data_classes TEXT,
+                is_verified INTEGER,
+                is_sensitive INTEGER
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_breaches_domain ON breaches(domain)')
+        conn.execute('CREATE TABLE IF NOT EXISTS catalog_meta (key TEXT PRIMARY KEY, value TEXT)')
+        return conn
+
+    def _load_from_disk(self) -> None:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                'SELECT name, title, domain, breach_date, breach_epoch, added_date, pwn_count, '
+                'data_classes, is_verified, is_sensitive FROM breaches'
+            ).fetchall()
+            meta = conn.execute("SELECT value FROM catalog_meta WHERE key = 'refreshed_at'").fetchone()
+        finally:
+            conn.close()
+
+        self._breaches = {
+            row[0]: {
+                'name': row[0],
+                'title': row[1],
+                'domain': row[2],
+                'breach_date': row[3],
+                'breach_epoch': row[4],
+                'added_date': row[5],
+                'pwn_count': row[6],
+                'data_classes': json.loads(row[7]) if row[7] else [],
+                'is_verified': bool(row[8]),
+                'is_sensitive': bool(row[9])
+            }
+            for row in rows
+        }
+        self.refreshed_at = float(meta[0]) if meta else 0.0
+        self.version += 1
+        self._loaded = True
+
+    # ---------- REFRESH ----------
+
+    def refresh(self, breaches: Optional[Iterable[Dict[str, Any]]] = None) -> int:
+        """
+        Replace the catalog with HIBP's full breach list (or the given records).
+        Long HTML descriptions are dropped; returns the number of breaches stored.
+        """
+        if breaches is None:
+            response = requests.get(self.source_url, headers={'user-agent': 'OSINT-Dashboard'}, timeout=30)
+            response.raise_for_status()
+            breaches = response.json()
+
+        rows = [
+            (
+                b.get('Name'),
+                b.get('Title'),
+                b.get('Domain'),
+                b.get('BreachDate'),
+                parse_timestamp(b.get('BreachDate')),
+                b.get('AddedDate'),
+                b.get('PwnCount'),
+                json.dumps(b.get('DataClasses') or []),
+                int(bool(b.get('IsVerified'))),
+                int(bool(b.get('IsSensitive')))
+            )
+            for b in breaches
+            if b.get('Name')
+        ]
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute('DELETE FROM breaches')
+                    conn.executemany('INSERT OR REPLACE INTO breaches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('refreshed_at', ?)",
+                        (str(time.time()),)
+                    )
+            finally:
+                conn.close()
+            self._load_from_disk()
+            self.last_error = None
+
+        print(f"✅ Breach catalog refreshed: {len(rows)} breaches")
+        return len(rows)
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing or time.time() - self._last_attempt < 300:
+                return
+            self._refreshing = True
+            self._last_attempt = time.time()
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"⚠️ Breach catalog refresh failed: {e}")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def ensure_loaded(self) -> None:
+        """
+        Load the catalog from disk once. An empty or stale catalog is fetched
+        in the background and never on the caller's request path: until it
+        arrives, lookups get bare records (see join).
+        """
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load_from_disk()
+
+        if not self._breaches or time.time() - self.refreshed_at > self.ttl:
+            self._refresh_in_background()
+
+    # ---------- LOOKUPS ----------
+
+    @property
+    def available(self) -> bool:
+        return bool(self._breaches)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._breaches.get(name)
+
+    def join(self, names: List[str]) -> List[Dict[str, Any]]:
+        """Breach metadata for each name; names missing from the catalog get a bare record"""
+        self.ensure_loaded()
+        if any(name not in self._breaches for name in names) and time.time() - self.refreshed_at > 3600:
+            # A breach newer than our snapshot; pick it up for next time
+            self._refresh_in_background()
+        return [
+            self._breaches.get(name) or {'name': name, 'title': name, 'data_classes': []}
+            for name in names
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'breaches': len(self._breaches),
+            'refreshed_at': self.refreshed_at,
+            'version': self.version,
+            'last_error': self.last_error
+        }
+
+
+BREACH_CATALOG = BreachCatalog()
@@ -0,0 +1,388 @@
+"""
+HaveIBeenPwned account and password lookups
+Account lookups go through one rate gate per API key (HIBP allows a fixed
+number of requests per minute per key) and land in a long-TTL SQLite cache,
+so re-auditing a domain only spends quota on addresses not seen recently.
+Bulk audits run as background jobs: cached addresses are answered at once,
+the rest are fetched at the rate the key allows.
+
+Password exposure uses the Pwned Passwords k-anonymity range API: only the
+first 5 hex characters of the SHA-1 leave the machine, and each range body
+is cached on disk, so a repeated prefix never hits the network.
+
+Point HIBP_API_URL / PWNED_PASSWORDS_URL at hibp_mock.py to test offline.
+
+Usage:
+    from breach_lookup import BREACH_LOOKUP, BREACH_JOBS, BreachJob, start_breach_job
+
+    BREACH_LOOKUP.account('alice@corp.com', api_key)
+    # {'account': 'alice@corp.com', 'breaches': ['Adobe'], 'cached': False}
+    BREACH_LOOKUP.password_exposure(hashlib.sha1(b'hunter2').hexdigest())   # 17043
+
+    job = BREACH_JOBS.add(BreachJob(emails))
+    start_breach_job(job, api_key)
+    BREACH_JOBS.get(job.job_id).to_dict()
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, List, Any, Optional, Iterable
+from urllib.parse import quote
+
+import requests
+
+from breach_catalog import HIBP_API_URL
+from sweep import SiteGate, SweepRegistry, retry_after_seconds, RATE_LIMIT_STATUSES
+
+PWNED_PASSWORDS_URL = os.environ.get('PWNED_PASSWORDS_URL', 'https://api.pwnedpasswords.com/range').rstrip('/')
+BREACH_CACHE_PATH = os.environ.get(
+    'BREACH_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'breach_cache.db')
+)
+ACCOUNT_CACHE_TTL = float(os.environ.get('HIBP_ACCOUNT_CACHE_TTL_HOURS', '168')) * 3600
+RANGE_CACHE_TTL = float(os.environ.get('PWNED_RANGE_CACHE_TTL_HOURS', '720')) * 3600
+# Pwned 1 keys allow 10 requests per minute; raise for higher subscriptions
+HIBP_REQUESTS_PER_MINUTE = float(os.environ.get('HIBP_REQUESTS_PER_MINUTE', '10'))
+# A single bulk job waits at most this long for one rate-limit slot before giving up
+BULK_MAX_WAIT = 300.0
+BULK_MAX_ACCOUNTS = 20000
+
+_SHA1_RE = re.compile(r'[0-9A-F]{40}')
+_PREFIX_RE = re.compile(r'[0-9A-F]{5}')
+
+
+def normalize_account(email: str) -> str:
+    return (email or '').strip().lower()
+
+
+class BreachLookup:
+    """Cached, rate-limited HIBP account lookups and Pwned Passwords range checks"""
+
+    def __init__(self, path: str = BREACH_CACHE_PATH, api_url: str = HIBP_API_URL,
+                 ranges_url: str = PWNED_PASSWORDS_URL, account_ttl: float = ACCOUNT_CACHE_TTL,
+                 range_ttl: float = RANGE_CACHE_TTL, requests_per_minute: float = HIBP_REQUESTS_PER_MINUTE,
+                 session: Optional[requests.Session] = None):
+        self.path = path
+        self.api_url = api_url
+        self.ranges_url = ranges_url
+        self.account_ttl = account_ttl
+        self.range_ttl = range_ttl
+        self.interval = 60.0 / max(requests_per_minute, 0.1)
+        self.session = session or requests.Session()
+        self._gates: Dict[str, SiteGate] = {}
+        self._lock = threading.Lock()
+        self._ready = False
+        self.counters = {'account_hits': 0, 'account_fetches': 0, 'range_hits': 0, 'range_fetches': 0}
+
+    # ---------- STORAGE ----------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._ready:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS account_breaches (
+                    account TEXT PRIMARY KEY,
+                    names TEXT,
+                    checked_at REAL
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS password_ranges (
+                    prefix TEXT PRIMARY KEY,
+                    body TEXT,
+                    fetched_at REAL
+                )
+            ''')
+            conn.commit()
+            self._ready = True
+        return conn
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self.counters[counter] += 1
+
+    def cached_accounts(self, accounts: List[str]) -> Dict[str, List[str]]:
+        """Fresh cache entries for the given normalized accounts"""
+        found = {}
+        cutoff = time.time() - self.account_ttl
+        conn = self._connect()
+        try:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(accounts), 500):
+                batch = accounts[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT account, names FROM account_breaches "
+                    f"WHERE checked_at >= ? AND account IN ({','.join('?' * len(batch))})",
+                    [cutoff] + batch
+                ).fetchall()
+                found.update((account, json.loads(names)) for account, names in rows)
+        finally:
+            conn.close()
+        return found
+
+    def _store_account(self, account: str, names: List[str]) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO account_breaches (account, names, checked_at) VALUES (?, ?, ?)',
+                    (account, json.dumps(names), time.time())
+                )
+        finally:
+            conn.close()
+
+    # ---------- ACCOUNTS ----------
+
+    def _gate(self, api_key: str) -> SiteGate:
+        # The quota belongs to the key, so every caller using it shares one gate
+        key_id = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        with self._lock:
+            gate = self._gates.get(key_id)
+            if gate is None:
+                gate = self._gates[key_id] = SiteGate(self.interval)
+            return gate
+
+    def account(self, email: str, api_key: str, timeout: float = 10,
+                max_wait: float = 0.0, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Breach names for one address. Waits at most `max_wait` seconds for a
+        rate-limit slot; returns {'error': ..., 'rate_limited': True} instead
+        of waiting longer. A rejected key returns {'error': ..., 'auth_failed': True}.
+        """
+        account = normalize_account(email)
+        if use_cache:
+            cached = self.cached_accounts([account])
+            if account in cached:
+                self._count('account_hits')
+                return {'account': account, 'breaches': cached[account], 'cached': True}
+
+        gate = self._gate(api_key)
+        while True:
+            wait = gate.reserve(limit=max_wait)
+            if wait is None:
+                return {'account': account, 'error': 'Rate limited; no request slot within the time allowed',
+                        'rate_limited': True}
+            if wait:
+                time.sleep(wait)
+                max_wait -= wait
+
+            self._count('account_fetches')
+            response = self.session.get(
+                f'{self.api_url}/breachedaccount/{quote(account)}',
+                headers={'hibp-api-key': api_key, 'user-agent': 'OSINT-Dashboard'},
+                params={'truncateResponse': 'true'},
+                timeout=timeout
+            )
+            if response.status_code in RATE_LIMIT_STATUSES:
+                gate.backoff(retry_after_seconds(response.headers))
+                continue
+            break
+
+        if response.status_code == 404:
+            names = []
+        elif response.status_code == 200:
+            names = [breach.get('Name') for breach in response.json() if breach.get('Name')]
+        elif response.status_code == 401:
+            # Every further lookup with this key fails the same way; callers stop on auth_failed
+            return {'account': account, 'error': 'HaveIBeenPwned rejected the API key', 'auth_failed': True}
+        else:
+            return {'account': account, 'error': f'API returned status code {response.status_code}'}
+
+        self._store_account(account, names)
+        return {'account': account, 'breaches': names, 'cached': False}
+
+    # ---------- PASSWORDS ----------
+
+    def password_range(self, prefix: str, timeout: float = 10) -> Dict[str, int]:
+        """SHA-1 suffix -> breach count for a 5-hex-character prefix, from disk when cached"""
+        prefix = prefix.upper()
+        if not _PREFIX_RE.fullmatch(prefix):
+            raise ValueError('prefix must be 5 hex characters')
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                'SELECT body FROM password_ranges WHERE prefix = ? AND fetched_at >= ?',
+                (prefix, time.time() - self.range_ttl)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if row:
+            self._count('range_hits')
+            body = row[0]
+        else:
+            self._count('range_fetches')
+            # Padding hides the real range size from anyone watching the wire
+            response = self.session.get(
+                f'{self.ranges_url}/{prefix}',
+                headers={'Add-Padding': 'true', 'user-agent': 'OSINT-Dashboard'},
+                timeout=timeout
+            )
+            response.raise_for_status()
+            body = response.text
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        'INSERT OR REPLACE INTO password_ranges (prefix, body, fetched_at) VALUES (?, ?, ?)',
+                        (prefix, body, time.time())
+                    )
+            finally:
+                conn.close()
+
+        counts = {}
+        for line in body.splitlines():
+            suffix, _, count = line.strip().partition(':')
+            if count.isdigit() and int(count) > 0:  # padding rows have count 0
+                counts[suffix.upper()] = int(count)
+        return counts
+
+    def password_exposure(self, sha1_hex: str, timeout: float = 10) -> int:
+        """How many times a password (given as its SHA-1 hex digest) appears in breaches; 0 if never"""
+        digest = (sha1_hex or '').strip().upper()
+        if not _SHA1_RE.fullmatch(digest):
+            raise ValueError('sha1 must be a 40-character hex digest')
+        return self.password_range(digest[:5], timeout).get(digest[5:], 0)
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        try:
+            accounts = conn.execute('SELECT COUNT(*) FROM account_breaches').fetchone()[0]
+            ranges = conn.execute('SELECT COUNT(*) FROM password_ranges').fetchone()[0]
+        finally:
+            conn.close()
+        with self._lock:
+            counters = dict(self.counters)
+        return {'cached_accounts': accounts, 'cached_ranges': ranges, **counters}
+
+
+BREACH_LOOKUP = BreachLookup()
+
+
+# ==================== BULK JOBS ====================
+
+class BreachJob:
+    """Progress and findings of one bulk account audit"""
+
+    def __init__(self, emails: Iterable[str]):
+        self.job_id = uuid.uuid4().hex[:12]
+        seen = {}
+        for email in emails:
+            account = normalize_account(email)
+            if '@' in account:
+                seen.setdefault(account, None)
+        self.accounts = list(seen)
+        self.status = 'queued'
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.results: Dict[str, List[str]] = {}
+        self.errors: Dict[str, str] = {}
+        self.cached = 0
+        self.fetched = 0
+        self.stop_reason: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stop.is_set()
+
+    def stop(self, reason: str) -> None:
+        with self._lock:
+            if self.stop_reason is None:
+                self.stop_reason = reason
+        self._stop.set()
+
+    def record(self, account: str, lookup: Dict[str, Any]) -> None:
+        with self._lock:
+            if 'error' in lookup:
+                self.errors[account] = lookup['error']
+                return
+            self.results[account] = lookup['breaches']
+            if lookup.get('cached'):
+                self.cached += 1
+            else:
+                self.fetched += 1
+
+    def to_dict(self, include_accounts: bool = True) -> Dict[str, Any]:
+        with self._lock:
+            end = self.finished or time.time()
+            by_breach: Dict[str, int] = {}
+            for names in self.results.values():
+                for name in names:
+                    by_breach[name] = by_breach.get(name, 0) + 1
+            summary = {
+                'job_id': self.job_id,
+                'status': self.status,
+                'accounts_total': len(self.accounts),
+                'accounts_checked': len(self.results),
+                'accounts_breached': sum(1 for names in self.results.values() if names),
+                'from_cache': self.cached,
+                'fetched': self.fetched,
+                'errors': len(self.errors),
+                'breaches_by_name': dict(sorted(by_breach.items(), key=lambda item: -item[1])),
+                'stop_reason': self.stop_reason,
+                'elapsed_seconds': round(end - self.started, 2) if self.started else 0.0
+            }
+            if include_accounts:
+                summary['accounts'] = {account: names for account, names in self.results.items()}
+                summary['account_errors'] = dict(self.errors)
+            return summary
+
+
+BREACH_JOBS = SweepRegistry()
+
+
+def run_breach_job(job: BreachJob, api_key: str, lookup: BreachLookup = BREACH_LOOKUP) -> BreachJob:
+    """Answer cached accounts in one query, then fetch the rest at the key's rate"""
+    job.status = 'running'
+    job.started = time.time()
+    try:
+        cached = lookup.cached_accounts(job.accounts)
+        with lookup._lock:
+            lookup.counters['account_hits'] += len(cached)
+        for account, names in cached.items():
+            job.record(account, {'account': account, 'breaches': names, 'cached': True})
+
+        for account in job.accounts:
+            if job.stopping:
+                break
+            if account in cached:
+                continue
+            try:
+                result = lookup.account(account, api_key, max_wait=BULK_MAX_WAIT, use_cache=False)
+            except requests.RequestException as e:
+                result = {'account': account, 'error': str(e)}
+            job.record(account, result)
+            if result.get('rate_limited'):
+                job.stop('rate limit outlasted the job')
+            elif result.get('auth_failed'):
+                job.stop(result['error'])
+
+        if job.stop_reason == 'cancelled':
+            job.status = 'cancelled'
+        else:
+            job.status = 'stopped' if job.stop_reason else 'done'
+    except Exception as e:
+        print(f"❌ Breach job {job.job_id} failed: {e}")
+        job.stop_reason = job.stop_reason or str(e)
+        job.status = 'failed'
+    finally:
+        job.finished = time.time()
+    print(f"✅ Breach job {job.job_id} {job.status}: {len(job.results)}/{len(job.accounts)} accounts "
+          f"({job.cached} cached, {job.fetched} fetched)")
+    return job
+
+
+def start_breach_job(job: BreachJob, api_key: str, lookup: BreachLookup = BREACH_LOOKUP) -> threading.Thread:
+    thread = threading.Thread(target=run_breach_job, args=(job, api_key, lookup),
+                              name=f'breach-{job.job_id}', daemon=True)
+    thread.start()
+    return thread
@@ -7,11 +7,75 @@ Usage:
     
     handler = RealWorldOSINTHandler()
     clean_data = handler.process_results(results, target)
+
+    # `results` is left untouched; derived attributes live in the overlay
+    annotated = clean_data['processed_results']
+    annotated.annotation('github', 'freshness')        # 'STALE'
+    annotated['github']['profile']                     # raw profile, no defaults
+
+    # Or incrementally, as collectors finish (records aren't retained)
+    stream = handler.open_stream(target)
+    stream.feed('github', github_record)
+    stream.feed('github', {'repositories': next_page})   # continuation
+    summary = stream.close()
 """
 
-import hashlib
-from datetime import datetime
-from typing import Dict, List, Any
+import time
+from collections import ChainMap, Counter
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator
+
+from dedup import DedupEngine
+from patterns import FeatureStore, detect_patterns, PROFESSIONAL_PLATFORMS, PERSONAL_PLATFORMS
+from timestamps import normalize_timestamps, activity_bounds, latest_activity, days_since
+
+
+class AnnotatedResults(Mapping):
+    """
+    Read-only overlay of derived attributes on raw collector results.
+    Raw records are referenced, never copied or modified; annotations
+    (freshness, platform_restrictions, data_completeness, timestamps, ...)
+    live in a separate per-platform dict that shadows raw keys on lookup.
+    """
+    
+    def __init__(self, raw: Dict[str, Dict[str, Any]]):
+        self.raw = raw
+        self.annotations: Dict[str, Dict[str, Any]] = {}
+    
+    def annotate(self, platform: str, **attrs: Any) -> Dict[str, Any]:
+        overlay = self.annotations.setdefault(platform, {})
+        overlay.update(attrs)
+        return overlay
+    
+    def annotation(self, platform: str, key: str, default: Any = None) -> Any:
+        """Derived attribute for a platform, falling back to its raw record"""
+        overlay = self.annotations.get(platform)
+        if overlay is not None and key in overlay:
+            return overlay[key]
+        return self.raw.get(platform, {}).get(key, default)
+    
+    def timestamps(self, platform: str) -> Dict[str, float]:
+        """Parsed dates of a platform record, computed once and kept in the overlay"""
+        overlay = self.annotations.setdefault(platform, {})
+        stamps = overlay.get('timestamps')
+        if stamps is None:
+            stamps = overlay['timestamps'] = normalize_timestamps(self.raw.get(platform, {}))
+        return stamps
+    
+    def __getitem__(self, platform: str) -> ChainMap:
+        # Read-only view; nested raw dicts are shared, not copied
+        return ChainMap(
+            MappingProxyType(self.annotations.get(platform, {})),
+            MappingProxyType(self.raw[platform])
+        )
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+    
+    def __len__(self) -> int:
+        return len(self.raw)
+
 
 class RealWorldOSINTHandler:
     """
@@ -23,7 +87,27 @@ class RealWorldOSINTHandler:
     - Unknown exposure patterns
     """
     
-    def __init__(self):
+    # Defaults for missing profile fields. Only the legacy handle_incomplete_data
+    # writes them; process_results records missing_fields in the overlay instead
+    INCOMPLETE_DEFAULTS = {
+        'username': 'Unknown',
+        'name': 'Not Available',
+        'bio': 'No bio provided',
+        'location': 'Location not disclosed',
+        'email': 'Not public',
+        'created_at': 'Unknown',
+        'followers': 0,
+        'following': 0
+    }
+    BLANK_VALUES = [None, '', 'None', 'null']
+    # Placeholders (ours or a collector's); never counted as real findings
+    PLACEHOLDER_VALUES = ['Unknown', 'Not Available', 'No bio provided', 'Location not disclosed', 'Not public']
+    
+    PROFESSIONAL_PLATFORMS = PROFESSIONAL_PLATFORMS
+    PERSONAL_PLATFORMS = PERSONAL_PLATFORMS
+    
+    def __init__(self, deduplicator: Optional[DedupEngine] = None):
+        self.deduplicator = deduplicator or DedupEngine()
         self.platform_restrictions = {
             'instagram': {'rate_limit': True, 'requires_login': True, 'data_quality': 'LOW'},
             'facebook': {'rate_limit': True, 'requires_login': True, 'data_quality': 'LOW'},
@@ -34,13 +118,15 @@ class RealWorldOSINTHandler:
             'reddit': {'rate_limit': False, 'requires_login': False, 'data_quality': 'HIGH'}
         }
     
-    def process_results(self, results: Dict, target: str) -> Dict:
+    def process_results(self, results: Dict, target: str, deadline: Optional[Any] = None) -> Dict:
         """
         Main entry point - processes all OSINT results
         
         Args:
-            results: Dict of platform results
+            results: Dict of platform results (read, never modified)
             target: Target identifier
+            deadline: optional deadline.RequestDeadline; platforms not reached
+                      before it expires are left out and listed in 'skipped_platforms'
             
         Returns:
             Dict with enhanced data including:
@@ -48,113 +134,100 @@ class RealWorldOSINTHandler:
             - behavioral_patterns
             - data_quality
             - duplicates_removed count
+            - processed_results: AnnotatedResults overlay on `results`
         """
-        # Step 1: Apply platform-specific handling
+        # Single traversal through the streaming accumulator; derived
+        # attributes go to the overlay instead of into `results`
+        annotated = AnnotatedResults(results)
+        stream = self.open_stream(target, annotations=annotated)
+        skipped = []
         for platform_name, data in results.items():
-            if data.get('found'):
-                # Add platform restrictions info
-                results[platform_name] = self.handle_platform_restrictions(platform_name, data)
-                
-                # Detect outdated data
-                results[platform_name] = self.detect_outdated_data(results[platform_name], platform_name)
-                
-                # Handle incomplete profiles
-                if results[platform_name].get('profile'):
-                    results[platform_name]['profile'] = self.handle_incomplete_data(
-                        results[platform_name]['profile']
-                    )
-        
-        # Step 2: Extract and deduplicate findings
-        all_findings = self._extract_all_findings(results)
-        deduplicated_findings = self.deduplicate_data(all_findings)
-        
-        # Step 3: Consolidate scattered data
-        consolidated_intel = self.consolidate_scattered_data(results)
-        
-        # Step 4: Detect behavioral patterns
-        behavioral_patterns = self.detect_unknown_patterns(results)
-        
-        # Step 5: Calculate data quality
-        quality_metrics = self.calculate_data_quality_score(results)
-        
-        return {
-            'consolidated_intelligence': consolidated_intel,
-            'behavioral_patterns': behavioral_patterns,
-            'data_quality': quality_metrics,
-            'duplicates_removed': len(all_findings) - len(deduplicated_findings),
-            'processed_results': results
-        }
+            if deadline is not None and deadline.expired:
+                skipped.append(platform_name)
+                continue
+            stream.feed(platform_name, data)
+        
+        summary = stream.close()
+        summary['processed_results'] = annotated
+        if skipped:
+            summary['partial'] = True
+            summary['skipped_platforms'] = skipped
+            deadline.truncate('robustness', f'{len(skipped)} platform(s) not processed')
+        return summary
     
-    def deduplicate_data(self, data_list: List[Dict]) -> List[Dict]:
-        """Remove duplicate entries using content hashing"""
-        seen = set()
-        deduplicated = []
-        
-        for item in data_list:
-            # Create hash from key fields
-            content = f"{item.get('type', '')}-{item.get('value', '')}-{item.get('platforms', '')}"
-            content_hash = hashlib.md5(content.encode()).hexdigest()
-            
-            if content_hash not in seen:
-                seen.add(content_hash)
-                deduplicated.append(item)
-        
-        return deduplicated
+    def open_stream(self, target: str, seen: Optional[Any] = None,
+                    annotations: Optional[AnnotatedResults] = None) -> 'ResultStream':
+        """
+        Start incremental processing: feed (platform, record) events as
+        collectors produce them, then close() for the final metrics.
+        Pass a shared set or dedup.BloomFilter as `seen` for bulk jobs.
+        """
+        return ResultStream(self, target, seen, annotations)
+    
+    def process_events(self, events: Iterable[Tuple[str, Dict]], target: str,
+                       seen: Optional[Any] = None) -> Dict:
+        """process_results over a (platform, record) iterator, without holding the records"""
+        stream = self.open_stream(target, seen)
+        for platform_name, record in events:
+            stream.feed(platform_name, record)
+        return stream.close()
+    
+    def deduplicate_data(self, data_list: List[Dict], seen: Optional[Any] = None) -> List[Dict]:
+        """
+        Remove duplicate entries on (type, value, platforms).
+        Pass a shared set or dedup.BloomFilter as `seen` to dedupe across batches.
+        """
+        return self.deduplicator.dedupe(data_list, seen)
+    
+    def profile_completeness(self, profile: Dict) -> Tuple[float, int, List[str]]:
+        """
+        Completeness of a raw profile as if missing fields held their defaults.
+        Returns (percent, field count, missing default fields) without touching the profile.
+        """
+        defaults = self.INCOMPLETE_DEFAULTS
+        default_values = list(defaults.values())
+        missing = [
+            key for key in defaults
+            if key not in profile or profile[key] in self.BLANK_VALUES
+        ]
+        filled_fields = sum(
+            1 for key, value in profile.items()
+            if not (key in defaults and value in self.BLANK_VALUES) and value not in default_values
+        )
+        total_fields = len(profile) + sum(1 for key in defaults if key not in profile)
+        return round((filled_fields / total_fields) * 100, 1), total_fields, missing
     
     def handle_incomplete_data(self, profile: Dict) -> Dict:
-        """Fill missing fields with smart defaults"""
-        defaults = {
-            'username': 'Unknown',
-            'name': 'Not Available',
-            'bio': 'No bio provided',
-            'location': 'Location not disclosed',
-            'email': 'Not public',
-            'created_at': 'Unknown',
-            'followers': 0,
-            'following': 0
-        }
+        """Fill missing fields with smart defaults (modifies the profile; process_results doesn't use this)"""
+        completeness, _, missing = self.profile_completeness(profile)
         
-        # Only fill if truly missing
-        for key, default_value in defaults.items():
-            if key not in profile or profile[key] in [None, '', 'None', 'null']:
-                profile[key] = default_value
-        
-        # Calculate data quality
-        filled_fields = sum(1 for v in profile.values() if v not in defaults.values())
-        total_fields = len(profile)
-        profile['data_completeness'] = round((filled_fields / total_fields) * 100, 1)
+        for key in missing:
+            profile[key] = self.INCOMPLETE_DEFAULTS[key]
+        profile['data_completeness'] = completeness
         
         return profile
     
+    @staticmethod
+    def _freshness(last_seen: Optional[float], now: float) -> Tuple[str, Optional[int]]:
+        """
+        (freshness label, days old) from a record's latest activity: top-level
+        and profile updates, newest repository/project/commit, else account creation.
+        """
+        age = days_since(last_seen, now) if last_seen is not None else None
+        if age is None:
+            return 'FRESH', None
+        if age > 365:
+            return 'STALE', age
+        if age > 180:
+            return 'AGING', age
+        return 'FRESH', None
+    
     def detect_outdated_data(self, data: Dict, platform: str) -> Dict:
-        """Mark data as potentially outdated"""
-        data['freshness'] = 'FRESH'
-        
-        timestamp_fields = ['created_at', 'updated_at', 'last_activity', 'breach_date']
-        
-        for field in timestamp_fields:
-            if field in data:
-                try:
-                    date_str = str(data[field])
-                    
-                    # Parse various date formats
-                    for fmt in ['%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ']:
-                        try:
-                            date_obj = datetime.strptime(date_str.split('.')[0].replace('Z', ''), fmt)
-                            days_old = (datetime.now() - date_obj).days
-                            
-                            if days_old > 365:
-                                data['freshness'] = 'STALE'
-                                data['days_old'] = days_old
-                            elif days_old > 180:
-                                data['freshness'] = 'AGING'
-                                data['days_old'] = days_old
-                            
-                            break
-                        except:
-                            continue
-                except:
-                    pass
+        """Mark data as potentially outdated (modifies the record; process_results doesn't use this)"""
+        freshness, days_old = self._freshness(latest_activity(normalize_timestamps(data)), time.time())
+        data['freshness'] = freshness
+        if days_old is not None:
+            data['days_old'] = days_old
         
         return data
     
@@ -173,97 +246,78 @@ class RealWorldOSINTHandler:
     
     def consolidate_scattered_data(self, all_results: Dict) -> Dict:
         """Merge scattered information across platforms"""
-        consolidated = {
-            'emails': set(),
-            'usernames': set(),
-            'names': set(),
-            'locations': set(),
-            'companies': set(),
-            'skills': set(),
-            'links': set()
-        }
+        consolidated = self._empty_consolidation()
         
         for platform, data in all_results.items():
             if not data.get('found'):
                 continue
             
-            profile = data.get('profile', {})
-            
-            if profile.get('email') and profile['email'] != 'Not public':
-                consolidated['emails'].add(profile['email'])
-            
-            if profile.get('username') and profile['username'] != 'Unknown':
-                consolidated['usernames'].add(profile['username'])
-            
-            if profile.get('name') and profile['name'] != 'Not Available':
-                consolidated['names'].add(profile['name'])
-            
-            if profile.get('location') and profile['location'] != 'Location not disclosed':
-                consolidated['locations'].add(profile['location'])
-            
-            if profile.get('company'):
-                consolidated['companies'].add(profile['company'])
-            
-            if profile.get('blog'):
-                consolidated['links'].add(profile['blog'])
+            self._consolidate_profile(consolidated, data.get('profile', {}))
         
         # Convert sets to lists
         return {k: list(v) for k, v in consolidated.items()}
     
+    @staticmethod
+    def _empty_consolidation() -> Dict[str, set]:
+        return {
+            'emails': set(),
+            'usernames': set(),
+            'names': set(),
+            'locations': set(),
+            'companies': set(),
+            'skills': set(),
+            'links': set()
+        }
+    
+    @classmethod
+    def _field(cls, profile: Dict, key: str) -> Any:
+        """Profile value, or None when it's blank or a placeholder"""
+        value = profile.get(key)
+        if value in cls.BLANK_VALUES or value in cls.PLACEHOLDER_VALUES:
+            return None
+        return value
+    
+    @classmethod
+    def _consolidate_profile(cls, consolidated: Dict[str, set], profile: Dict) -> None:
+        for key, bucket in (('email', 'emails'), ('username', 'usernames'), ('name', 'names'),
+                            ('location', 'locations'), ('company', 'companies'), ('blog', 'links')):
+            value = cls._field(profile, key)
+            if value:
+                consolidated[bucket].add(value)
+    
     def detect_unknown_patterns(self, results: Dict) -> List[str]:
-        """Identify unusual patterns in collected data"""
-        patterns = []
-        
-        # Pattern 1: Privacy-conscious behavior
-        platforms_found = sum(1 for v in results.values() if v.get('found'))
-        has_email = any(
-            v.get('profile', {}).get('email') not in [None, '', 'Not public'] 
-            for v in results.values() if v.get('found')
-        )
-        
-        if platforms_found >= 3 and not has_email:
-            patterns.append("🔍 Privacy-conscious: Active on multiple platforms but email not exposed")
-        
-        # Pattern 2: Dormant accounts
-        old_accounts = []
-        for platform, data in results.items():
-            if data.get('found') and data.get('freshness') == 'STALE':
-                old_accounts.append(platform)
-        
-        if old_accounts:
-            patterns.append(f"⏰ Dormant accounts detected on: {', '.join(old_accounts)}")
-        
-        # Pattern 3: Professional vs Personal split
-        professional = ['github', 'gitlab', 'linkedin']
-        personal = ['instagram', 'facebook', 'twitter', 'reddit']
-        
-        prof_count = sum(1 for p in professional if results.get(p, {}).get('found'))
-        pers_count = sum(1 for p in personal if results.get(p, {}).get('found'))
-        
-        if prof_count > 0 and pers_count == 0:
-            patterns.append("💼 Professional-only presence - minimal personal exposure")
-        elif pers_count > 0 and prof_count == 0:
-            patterns.append("🎮 Personal-only presence - no professional footprint")
-        
-        # Pattern 4: Username consistency
-        usernames = [
-            v.get('profile', {}).get('username') 
-            for v in results.values() if v.get('found')
-        ]
-        usernames = [u for u in usernames if u and u not in ['Unknown', None]]
-        
-        if len(set(usernames)) == 1 and len(usernames) >= 3:
-            patterns.append(f"🎯 Consistent username '{usernames[0]}' across all platforms")
-        elif len(set(usernames)) == len(usernames) and len(usernames) >= 3:
-            patterns.append("🔀 Different username on each platform - compartmentalization strategy")
-        
-        return patterns
+        """Identify unusual patterns in collected data via the patterns.py detector registry"""
+        return detect_patterns(FeatureStore(results))
     
     def calculate_data_quality_score(self, results: Dict) -> Dict:
         """Calculate overall data quality and completeness"""
-        total_platforms = len(results)
         found_platforms = sum(1 for v in results.values() if v.get('found'))
         
+        # Data completeness per platform (summed left to right, as quality_batch does)
+        completeness_sum = 0.0
+        completeness_count = 0
+        for platform, data in results.items():
+            if data.get('found'):
+                profile = data.get('profile', {})
+                filled = sum(
+                    1 for v in profile.values() 
+                    if v and v not in self.PLACEHOLDER_VALUES
+                )
+                total = len(profile)
+                if total > 0:
+                    completeness_sum += (filled / total) * 100
+                    completeness_count += 1
+        
+        stale_count = sum(1 for v in results.values() if v.get('freshness') == 'STALE')
+        verified_count = sum(1 for v in results.values() if v.get('verification') == 'api_verified')
+        
+        return self._quality_from_counts(
+            len(results), found_platforms, completeness_sum, completeness_count,
+            stale_count, verified_count
+        )
+    
+    def _quality_from_counts(self, total_platforms: int, found_platforms: int, completeness_sum: float,
+                             completeness_count: int, stale_count: int, verified_count: int) -> Dict:
         if found_platforms == 0:
             return {
                 'overall_score': 0,
@@ -274,20 +328,7 @@ class RealWorldOSINTHandler:
                 'grade': 'F'
             }
         
-        # Data completeness per platform
-        completeness_scores = []
-        for platform, data in results.items():
-            if data.get('found'):
-                profile = data.get('profile', {})
-                filled = sum(
-                    1 for v in profile.values() 
-                    if v and v not in ['Unknown', 'Not Available', 'No bio provided', 'Location not disclosed', 'Not public']
-                )
-                total = len(profile)
-                if total > 0:
-                    completeness_scores.append((filled / total) * 100)
-        
-        avg_completeness = sum(completeness_scores) / len(completeness_scores) if completeness_scores else 0
+        avg_completeness = completeness_sum / completeness_count if completeness_count else 0
         
         # Calculate quality factors
         quality_factors = {
@@ -298,16 +339,16 @@ class RealWorldOSINTHandler:
         }
         
         # Adjust for stale data
-        stale_count = sum(1 for v in results.values() if v.get('freshness') == 'STALE')
         if stale_count > 0:
             quality_factors['freshness'] -= (stale_count / found_platforms) * 15
         
         # Adjust for verification
-        verified_count = sum(1 for v in results.values() if v.get('verification') == 'api_verified')
         if verified_count > 0:
             quality_factors['verification'] = (verified_count / found_platforms) * 10
         
-        total_score = sum(quality_factors.values())
+        # Fixed left-to-right order so quality_batch's vectorized sums match exactly
+        total_score = (quality_factors['platform_coverage'] + quality_factors['data_completeness']
+                       + quality_factors['freshness'] + quality_factors['verification'])
         
         return {
             'overall_score': round(min(total_score, 100), 1),
@@ -326,7 +367,7 @@ class RealWorldOSINTHandler:
             if pf_data.get('found'):
                 profile = pf_data.get('profile', {})
                 for key, value in profile.items():
-                    if value and value not in ['Unknown', 'Not Available', 'No bio provided', 'Location not disclosed', 'Not public']:
+                    if value and value not in self.PLACEHOLDER_VALUES:
                         all_findings.append({
                             'type': key,
                             'value': str(value)[:100],
@@ -334,4 +375,156 @@ class RealWorldOSINTHandler:
                             'risk': 'MEDIUM'
                         })
         
-        return all_findings
\ No newline at end of file
+        return all_findings
+
+class ResultStream:
+    """
+    Running robustness aggregates over (platform, record) events.
+    Records are folded in as they arrive and not kept: state is a few values
+    per platform plus the consolidated entity sets, however many repositories
+    a record carries. A platform may arrive over several events; the first
+    carries found/profile, later ones (e.g. more repository pages) only
+    extend its activity history.
+    """
+    
+    def __init__(self, handler: RealWorldOSINTHandler, target: str, seen: Optional[Any] = None,
+                 annotations: Optional[AnnotatedResults] = None):
+        self.handler = handler
+        self.target = target
+        self.annotations = annotations
+        self.seen_findings = seen if seen is not None else set()
+        self.total_findings = 0
+        self.unique_findings = 0
+        self.consolidated = handler._empty_consolidation()
+        self.has_email = False
+        self.usernames: Counter = Counter()
+        # platform -> [found, completeness or None, stale, verified]; see quality_rows
+        self._quality: Dict[str, List[Any]] = {}
+        # platform -> [latest activity, creation fallback]; None when not found
+        self._activity: Dict[str, Optional[List[Optional[float]]]] = {}
+        self.closed = False
+    
+    def feed(self, platform: str, record: Dict) -> None:
+        if self.closed:
+            raise RuntimeError('ResultStream is closed')
+        
+        if platform in self._activity:
+            bounds = self._activity[platform]
+            if bounds is not None:
+                self._merge_activity(bounds, activity_bounds(normalize_timestamps(record)))
+            return
+        
+        if not record.get('found'):
+            self._activity[platform] = None
+            self._quality[platform] = [
+                False, None, record.get('freshness') == 'STALE', record.get('verification') == 'api_verified'
+            ]
+            return
+        
+        handler = self.handler
+        if self.annotations is not None:
+            stamps = self.annotations.timestamps(platform)
+        else:
+            stamps = normalize_timestamps(record)
+        self._activity[platform] = list(activity_bounds(stamps))
+        
+        platform_info = handler.platform_restrictions.get(platform.lower(), {'data_quality': 'MEDIUM'})
+        overlay = self._annotate(
+            platform,
+            platform_restrictions=platform_info,
+            reliability_note=f"Data quality: {platform_info['data_quality']}"
+        )
+        
+        profile = record.get('profile') or {}
+        completeness = 0.0
+        if profile:
+            completeness, total_fields, missing = handler.profile_completeness(profile)
+            overlay['data_completeness'] = completeness
+            overlay['missing_fields'] = missing
+        
+        quality = self._quality[platform] = [True, None, False, record.get('verification') == 'api_verified']
+        if handler._field(profile, 'email') is not None:
+            self.has_email = True
+        username = handler._field(profile, 'username')
+        if username:
+            self.usernames[username] += 1
+        handler._consolidate_profile(self.consolidated, profile)
+        
+        filled = 0
+        seen = self.seen_findings
+        for key, value in profile.items():
+            if value and value not in handler.BLANK_VALUES and value not in handler.PLACEHOLDER_VALUES:
+                filled += 1
+                self.total_findings += 1
+                finding_key = handler.deduplicator.key_from(key, str(value)[:100], platform)
+                if finding_key not in seen:
+                    seen.add(finding_key)
+                    self.unique_findings += 1
+        if profile:
+            # The completeness figure itself has always counted as one profile field
+            quality[1] = ((filled + bool(completeness)) / (total_fields + 1)) * 100
+    
+    def close(self) -> Dict:
+        """Judge freshness now that every platform's activity is in, and emit the final metrics"""
+        self.closed = True
+        handler = self.handler
+        now = time.time()
+        found_platforms = []
+        freshness_map = {}
+        
+        for platform, bounds in self._activity.items():
+            if bounds is None:
+                continue
+            found_platforms.append(platform)
+            latest, fallback = bounds
+            freshness, days_old = handler._freshness(latest if latest is not None else fallback, now)
+            overlay = self._annotate(platform, freshness=freshness)
+            if days_old is not None:
+                overlay['days_old'] = days_old
+            freshness_map[platform] = freshness
+            self._quality[platform][2] = freshness == 'STALE'
+        
+        completeness_sum = 0.0
+        completeness_count = 0
+        stale_count = 0
+        verified_count = 0
+        for found, completeness, stale, verified in self._quality.values():
+            if completeness is not None:
+                completeness_sum += completeness
+                completeness_count += 1
+            stale_count += stale
+            verified_count += verified
+        
+        # Detectors share the aggregates gathered while streaming
+        features = FeatureStore(
+            found_platforms=found_platforms,
+            freshness=freshness_map,
+            usernames=self.usernames,
+            has_email=self.has_email
+        )
+        
+        return {
+            'consolidated_intelligence': {k: list(v) for k, v in self.consolidated.items()},
+            'behavioral_patterns': detect_patterns(features),
+            'data_quality': handler._quality_from_counts(
+                len(self._activity), len(found_platforms), completeness_sum,
+                completeness_count, stale_count, verified_count
+            ),
+            'duplicates_removed': self.total_findings - self.unique_findings
+        }
+    
+    @property
+    def quality_rows(self) -> List[Tuple[bool, Optional[float], bool, bool]]:
+        """Per-platform (found, completeness, stale, verified) rows for quality_batch, after close()"""
+        return [tuple(row) for row in self._quality.values()]
+    
+    def _annotate(self, platform: str, **attrs: Any) -> Dict[str, Any]:
+        if self.annotations is not None:
+            return self.annotations.annotate(platform, **attrs)
+        return attrs
+    
+    @staticmethod
+    def _merge_activity(bounds: List[Optional[float]], update: Tuple[Optional[float], Optional[float]]) -> None:
+        for i, epoch in enumerate(update):
+            if epoch is not None and (bounds[i] is None or epoch > bounds[i]):
+                bounds[i] = epoch
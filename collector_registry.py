@@ -0,0 +1,221 @@
+"""
+Collector registry and scheduler
+Each collector class declares its platform key and capabilities:
+  cost               'expensive' | 'moderate' | 'cheap' (sub-requests per run)
+  rate_limit_group   collectors sharing one upstream quota never run at once
+  credentials        settings that must be present, else the run is skipped
+  shares_enumerator_fetch  the enumerator already fetched the same page, so its
+                     verdict can stand in for a second fetch (cls.from_presence)
+  precheck           skip the full collector when the enumerator settled that
+                     the account doesn't exist (default True)
+  target_kind        'username' (runs when selected) or 'email' (runs for email targets)
+
+Collection is two-stage: the enumerator's probe of each catalog site is
+stage one, and only platforms it didn't rule out reach their collector.
+The scheduler turns those collectors into one lane per rate-limit group,
+starts the costliest lanes first on a pool owned by the request, and
+collects whatever finished when the request deadline hits. At the
+deadline, lanes not yet started are cancelled and running lanes start no
+further collectors, so one slow request never holds workers another
+request is waiting for.
+
+Usage:
+    from collector_registry import register_collector, select_collectors, run_collectors, CollectionContext
+
+    @register_collector('gitlab', cost='expensive', rate_limit_group='gitlab',
+                        build=lambda ctx: GitLabCollector(projects=ctx.depth['projects'], deadline=ctx.deadline))
+    class GitLabCollector: ...
+
+    context = CollectionContext(target, deadline, depth, {'GITHUB_TOKEN': token}, platform_presence)
+    results = run_collectors(select_collectors(target, selected_platforms), context)
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple
+
+from deadline import RequestDeadline
+
+# At most this many lanes run at once within one request
+COLLECTOR_CONCURRENCY = int(os.environ.get('COLLECTOR_CONCURRENCY', '8'))
+COST_CLASSES = {'expensive': 3, 'moderate': 2, 'cheap': 1}
+TARGET_KINDS = ('username', 'email')
+
+
+@dataclass
+class CollectionContext:
+    """Everything a collector factory may need for one request"""
+    target: str
+    deadline: RequestDeadline
+    depth: Dict[str, int] = field(default_factory=dict)
+    credentials: Dict[str, Optional[str]] = field(default_factory=dict)
+    # Probe entries whose verdict is trusted; leave out sites where the collector decides existence
+    presence: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    deep: bool = False   # page through full inventories (collection_mode 'deep')
+
+
+@dataclass(frozen=True)
+class CollectorSpec:
+    platform: str
+    cls: type
+    cost: str
+    rate_limit_group: str
+    credentials: Tuple[str, ...] = ()
+    shares_enumerator_fetch: bool = False
+    target_kind: str = 'username'
+    build: Optional[Callable[[CollectionContext], Any]] = None
+    precheck: bool = True
+
+    @property
+    def weight(self) -> int:
+        return COST_CLASSES[self.cost]
+
+    def instantiate(self, context: CollectionContext) -> Any:
+        if self.build is not None:
+            return self.build(context)
+        return self.cls(deadline=context.deadline)
+
+
+# platform key -> spec; registration order is result order
+COLLECTORS: Dict[str, CollectorSpec] = {}
+
+
+def register_collector(platform: str, cost: str, rate_limit_group: str, credentials: Iterable[str] = (),
+                       shares_enumerator_fetch: bool = False, target_kind: str = 'username',
+                       build: Optional[Callable[[CollectionContext], Any]] = None, precheck: bool = True):
+    """Class decorator adding a collector to COLLECTORS"""
+    if cost not in COST_CLASSES:
+        raise ValueError(f"{platform}: cost must be one of {', '.join(COST_CLASSES)}")
+    if target_kind not in TARGET_KINDS:
+        raise ValueError(f"{platform}: target_kind must be one of {', '.join(TARGET_KINDS)}")
+
+    def register(cls):
+        if shares_enumerator_fetch and not hasattr(cls, 'from_presence'):
+            raise ValueError(f"{platform}: shares_enumerator_fetch needs a from_presence() method")
+        COLLECTORS[platform] = CollectorSpec(
+            platform, cls, cost, rate_limit_group, tuple(credentials),
+            shares_enumerator_fetch, target_kind, build, precheck
+        )
+        return cls
+    return register
+
+
+def select_collectors(target: str, platforms: Iterable[str]) -> List[CollectorSpec]:
+    """Username collectors for the selected platforms, plus email collectors for email targets"""
+    selected = set(platforms)
+    is_email = '@' in target
+    return [
+        spec for spec in COLLECTORS.values()
+        if (spec.target_kind == 'username' and spec.platform in selected)
+        or (spec.target_kind == 'email' and is_email)
+    ]
+
+
+def plan_lanes(specs: List[CollectorSpec]) -> List[List[CollectorSpec]]:
+    """
+    One lane per rate-limit group, costliest collector first within a lane,
+    lanes ordered by total cost (longest-processing-time first). Ties keep
+    registration order.
+    """
+    lanes: Dict[str, List[CollectorSpec]] = {}
+    for spec in specs:
+        lanes.setdefault(spec.rate_limit_group, []).append(spec)
+    ordered = [sorted(lane, key=lambda spec: -spec.weight) for lane in lanes.values()]
+    return sorted(ordered, key=lambda lane: -sum(spec.weight for spec in lane))
+
+
+def presence_verdict(presence: Optional[Dict[str, Any]]) -> Optional[bool]:
+    """
+    What stage one settled for a platform: True (exists), False (doesn't),
+    or None when it wasn't probed or the probe couldn't tell (timeout, error,
+    throttled or otherwise inconclusive status).
+    """
+    if presence is None or any(presence.get(flag) for flag in ('timed_out', 'error', 'inconclusive')):
+        return None
+    return presence.get('exists') is True
+
+
+def _skipped(reason: str) -> Dict[str, Any]:
+    return {'found': False, 'partial': True, 'error': f'Skipped: {reason}'}
+
+
+def collect_one(spec: CollectorSpec, context: CollectionContext) -> Dict[str, Any]:
+    """Run one collector under the request deadline, recording skips and partial results"""
+    deadline = context.deadline
+    stage = f'collector:{spec.platform}'
+
+    missing = [name for name in spec.credentials if not context.credentials.get(name)]
+    if missing:
+        return {'found': False, 'error': f"Missing credentials: {', '.join(missing)}"}
+
+    presence = context.presence.get(spec.platform)
+    verdict = presence_verdict(presence) if spec.target_kind == 'username' else None
+    if spec.shares_enumerator_fetch and verdict is not None:
+        record = spec.cls.from_presence(context.target, presence)
+        if verdict is False:
+            record['precheck'] = 'not_found'
+        return record
+    if spec.precheck and verdict is False:
+        return {'found': False, 'precheck': 'not_found'}
+
+    if deadline.expired:
+        deadline.truncate(stage, 'skipped')
+        return _skipped('request deadline reached')
+
+    record = spec.instantiate(context).collect(context.target)
+    if record.get('partial'):
+        deadline.truncate(stage, 'partial')
+    elif record.get('error') and deadline.expired:
+        deadline.truncate(stage, 'timeout')
+    return record
+
+
+def run_collectors(specs: List[CollectorSpec], context: CollectionContext) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the lanes concurrently until they finish or the deadline passes.
+    Returns records in registration order; a collector still running at the
+    deadline is reported as a skipped, partial record.
+    """
+    done: Dict[str, Dict[str, Any]] = {}
+    lock = threading.Lock()
+    abandoned = threading.Event()
+
+    def run_lane(lane: List[CollectorSpec]) -> None:
+        for spec in lane:
+            if abandoned.is_set():
+                return
+            try:
+                record = collect_one(spec, context)
+            except Exception as e:
+                record = {'found': False, 'error': str(e)}
+            with lock:
+                done[spec.platform] = record
+
+    started = time.monotonic()
+    lanes = plan_lanes(specs)
+    # Whole collectors run on this request's own pool; their sub-requests go to http_client's
+    pool = ThreadPoolExecutor(max_workers=max(1, min(COLLECTOR_CONCURRENCY, len(lanes))),
+                              thread_name_prefix='osint-collector')
+    try:
+        futures = [pool.submit(run_lane, lane) for lane in lanes]
+        wait(futures, timeout=context.deadline.remaining())
+    finally:
+        # Collectors still running are bounded by their deadline-derived call timeouts
+        abandoned.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    results = {}
+    with lock:
+        for spec in specs:
+            if spec.platform in done:
+                results[spec.platform] = done[spec.platform]
+            else:
+                context.deadline.truncate(f'collector:{spec.platform}', 'timeout')
+                results[spec.platform] = _skipped('still running at the request deadline')
+    ruled_out = sum(1 for record in results.values() if record.get('precheck') == 'not_found')
+    print(f"📡 {len(done)}/{len(specs)} collector(s) finished in {time.monotonic() - started:.2f}s"
+          f"{f' ({ruled_out} ruled out by pre-check)' if ruled_out else ''}")
+    return results
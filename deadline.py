@@ -0,0 +1,117 @@
+"""
+Request-scoped deadline
+One monotonic end time per /api/analyze request, handed to every stage.
+Stages derive their per-call timeouts from it, skip work that can no
+longer finish, and record what they cut short so the response can report
+truncated stages instead of silently returning less.
+
+Usage:
+    from deadline import RequestDeadline, call_timeout, parse_deadline_seconds
+
+    deadline = RequestDeadline(parse_deadline_seconds(data.get('deadline_seconds')))
+    collection = deadline.reserve(8)           # ends 8s early, leaving room for AI
+    requests.get(url, timeout=call_timeout(collection, 10))
+    if collection.expired:
+        collection.truncate('collector:github', 'skipped')
+    deadline.report()    # {'budget_seconds': 25.0, 'elapsed_seconds': ..., 'truncated_stages': [...]}
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+ANALYZE_DEADLINE = float(os.environ.get('ANALYZE_DEADLINE_SECONDS', '25'))
+MIN_DEADLINE = 2.0
+MAX_DEADLINE = float(os.environ.get('ANALYZE_DEADLINE_MAX_SECONDS', '120'))
+# Never hand out a timeout shorter than this; a request that can't make it is skipped instead
+MIN_CALL_TIMEOUT = 0.05
+
+
+def parse_deadline_seconds(raw: Any, default: float = ANALYZE_DEADLINE) -> float:
+    """Clamp a client-supplied deadline to [MIN_DEADLINE, MAX_DEADLINE], falling back to the default"""
+    try:
+        seconds = float(raw) if raw is not None else default
+    except (TypeError, ValueError):
+        seconds = default
+    if seconds != seconds:  # NaN
+        seconds = default
+    return max(MIN_DEADLINE, min(MAX_DEADLINE, seconds))
+
+
+class _TruncationLog:
+    """Shared by a deadline and every deadline derived from it"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages: Dict[str, str] = {}
+
+    def add(self, stage: str, reason: str) -> None:
+        with self._lock:
+            self.stages.setdefault(stage, reason)
+
+
+class RequestDeadline:
+    """A point on the time.monotonic() clock plus the log of stages cut short"""
+
+    def __init__(self, seconds: float, _at: Optional[float] = None,
+                 _log: Optional[_TruncationLog] = None, _started: Optional[float] = None):
+        now = time.monotonic()
+        self.started = _started if _started is not None else now
+        self.budget = seconds
+        self.at = _at if _at is not None else now + seconds
+        self._log = _log or _TruncationLog()
+
+    # ---- time ----
+
+    def remaining(self) -> float:
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.at
+
+    def timeout(self, cap: float) -> float:
+        """Per-call timeout: the remaining time, at most `cap`"""
+        return max(MIN_CALL_TIMEOUT, min(cap, self.at - time.monotonic()))
+
+    def within(self, seconds: float) -> float:
+        """Absolute monotonic deadline for a sub-budget of `seconds`, never past this deadline"""
+        return min(self.at, time.monotonic() + seconds)
+
+    # ---- derived deadlines (same truncation log) ----
+
+    def reserve(self, seconds: float) -> 'RequestDeadline':
+        """A deadline ending `seconds` before this one, keeping that time for later stages"""
+        return RequestDeadline(self.budget, max(time.monotonic(), self.at - seconds), self._log, self.started)
+
+    def share(self, fraction: float) -> 'RequestDeadline':
+        """A deadline covering `fraction` of the time left, for one of several sequential stages"""
+        now = time.monotonic()
+        return RequestDeadline(self.budget, now + max(0.0, self.at - now) * fraction, self._log, self.started)
+
+    # ---- reporting ----
+
+    def truncate(self, stage: str, reason: str = 'deadline') -> None:
+        """Record that a stage returned partial results (or was skipped)"""
+        self._log.add(stage, reason)
+
+    def truncated(self, stage: Optional[str] = None) -> bool:
+        if stage is None:
+            return bool(self._log.stages)
+        return stage in self._log.stages
+
+    def report(self) -> Dict[str, Any]:
+        with self._log._lock:
+            stages = dict(self._log.stages)
+        return {
+            'budget_seconds': round(self.budget, 2),
+            'elapsed_seconds': round(time.monotonic() - self.started, 2),
+            'partial': bool(stages),
+            'truncated_stages': [{'stage': stage, 'reason': reason} for stage, reason in stages.items()]
+        }
+
+
+def call_timeout(deadline: Optional[RequestDeadline], cap: float) -> float:
+    """Timeout for one outbound call; `cap` alone when there is no request deadline"""
+    return deadline.timeout(cap) if deadline is not None else cap
@@ -0,0 +1,161 @@
+"""
+Finding deduplication engine
+Tuple keys instead of hashed f-strings, optional value normalization,
+streaming dedup over iterators, and a bounded-memory Bloom filter for
+seen-sets shared across batches in multi-target jobs. Bloom filter bit
+positions come from blake2b, so a filter's bits mean the same thing in
+every process and can be persisted or shared between workers.
+
+Usage:
+    from dedup import DedupEngine, BloomFilter
+
+    engine = DedupEngine(normalize_case=True, canonicalize_urls=True)
+    unique = engine.dedupe(findings)
+
+    # Multi-target job: one bounded seen-set across every batch
+    seen = BloomFilter(capacity=1_000_000, error_rate=0.001)
+    for batch in batches:
+        for finding in engine.stream(batch, seen):
+            ...
+"""
+
+import hashlib
+import math
+import re
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def hashable(value: Any) -> Any:
+    """
+    Hashable stand-in for a field value from an API payload: lists become
+    tuples, dicts and sets become sorted tuples; anything else unhashable
+    falls back to its repr. Equal payloads give equal keys.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(hashable(v) for v in value)
+    if isinstance(value, dict):
+        return ('dict',) + tuple(sorted(((str(k), hashable(v)) for k, v in value.items()), key=repr))
+    if isinstance(value, (set, frozenset)):
+        return ('set',) + tuple(sorted((hashable(v) for v in value), key=repr))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def canonicalize_url(value: str) -> str:
+    """Fold http/https and www., drop default ports, fragments and trailing slashes; lowercase host"""
+    try:
+        parts = urlsplit(value.strip())
+    except ValueError:
+        return value
+    if parts.scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return value
+
+    host = parts.hostname
+    if host.startswith('www.'):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        return value
+    netloc = host if port in (None, _DEFAULT_PORTS[parts.scheme]) else f'{host}:{port}'
+    path = parts.path.rstrip('/')
+    return urlunsplit(('https', netloc, path, parts.query, ''))
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter with set-like `in` / `add`.
+    Memory is fixed by capacity and error_rate; past capacity the false
+    positive rate rises, so some unique items may be reported as seen.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError('capacity must be positive and error_rate in (0, 1)')
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: Any) -> Iterator[int]:
+        # Double hashing (Kirsch-Mitzenmacher) from one blake2b digest; the
+        # built-in hash() is salted per process (PYTHONHASHSEED)
+        data = key.encode('utf-8') if isinstance(key, str) else repr(key).encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def __contains__(self, key: Any) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: Any) -> None:
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+
+class DedupEngine:
+    """Deduplicate finding dicts on (type, value, platforms)"""
+
+    def __init__(self, normalize_case: bool = False, normalize_whitespace: bool = False,
+                 canonicalize_urls: bool = False):
+        self.normalize_case = normalize_case
+        self.normalize_whitespace = normalize_whitespace
+        self.canonicalize_urls = canonicalize_urls
+        self._normalizes = normalize_case or normalize_whitespace or canonicalize_urls
+
+    def normalize(self, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        if self.normalize_whitespace:
+            value = _WHITESPACE_RE.sub(' ', value).strip()
+        if self.canonicalize_urls and value.startswith(('http://', 'https://')):
+            value = canonicalize_url(value)
+        if self.normalize_case:
+            value = value.lower()
+        return value
+
+    def key_from(self, data_type: Any, value: Any, platforms: Any) -> Tuple:
+        if self._normalizes:
+            value = self.normalize(value)
+        return (hashable(data_type), hashable(value), hashable(platforms))
+
+    def key(self, item: Dict[str, Any]) -> Tuple:
+        return self.key_from(item.get('type', ''), item.get('value', ''), item.get('platforms', ''))
+
+    def stream(self, items: Iterable[Dict[str, Any]], seen: Optional[Any] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield items whose key hasn't been seen. `seen` may be a set or a
+        BloomFilter shared across calls for cross-batch dedup.
+        """
+        if seen is None:
+            seen = set()
+        key = self.key
+        for item in items:
+            item_key = key(item)
+            if item_key not in seen:
+                seen.add(item_key)
+                yield item
+
+    def dedupe(self, items: Iterable[Dict[str, Any]], seen: Optional[Any] = None) -> List[Dict[str, Any]]:
+        return list(self.stream(items, seen))
@@ -0,0 +1,185 @@
+"""
+Cross-target entity resolution index
+Persistent inverted index from normalized entity values (email, username,
+name, location, company, link) to the scans and targets they appeared in.
+Updated incrementally after each scan; lookups are single B-tree range
+scans on a clustered (kind, value) key.
+
+Usage:
+    from entity_index import ENTITY_INDEX
+
+    scan_id = ENTITY_INDEX.record_scan('torvalds', consolidated_intelligence)
+    ENTITY_INDEX.lookup('company', 'Linux Foundation')
+    # [{'target': 'torvalds', 'scan_id': 1, 'seen_at': 1760000000.0}, ...]
+    ENTITY_INDEX.shared_with('torvalds')
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+from dedup import canonicalize_url
+
+ENTITY_INDEX_PATH = os.environ.get(
+    'ENTITY_INDEX_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'entity_index.db')
+)
+
+# consolidate_scattered_data key -> entity kind
+CONSOLIDATED_KINDS = {
+    'emails': 'email',
+    'usernames': 'username',
+    'names': 'name',
+    'locations': 'location',
+    'companies': 'company',
+    'links': 'link',
+}
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_entity(kind: str, value: Any) -> Optional[str]:
+    """Canonical form used as the index key; None for values not worth indexing"""
+    if not isinstance(value, str):
+        return None
+    value = _WHITESPACE_RE.sub(' ', value).strip()
+    if not value:
+        return None
+    if kind == 'link':
+        return canonicalize_url(value if '://' in value else f'https://{value}').lower()
+    if kind == 'company':
+        return value.lstrip('@').casefold()
+    if kind in ('email', 'username'):
+        return value.lower()
+    return value.casefold()
+
+
+class EntityIndex:
+    """SQLite-backed inverted index; one connection per thread"""
+
+    def __init__(self, path: str = ENTITY_INDEX_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            with self._init_lock:
+                if not self._initialized:
+                    self._create_schema(conn)
+                    self._initialized = True
+        return conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS scans (
+                    scan_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    target TEXT NOT NULL,
+                    seen_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_scans_target ON scans(target)')
+            # Clustered on (kind, value): a lookup reads one contiguous key range
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS entity_postings (
+                    kind TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    scan_id INTEGER NOT NULL,
+                    seen_at REAL NOT NULL,
+                    PRIMARY KEY (kind, value, target, scan_id)
+                ) WITHOUT ROWID
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_postings_target ON entity_postings(target)')
+
+    # ---------- UPDATES ----------
+
+    def record_entities(self, target: str, entities: Iterable[Tuple[str, Any]]) -> int:
+        """Add one scan's (kind, value) pairs; returns the new scan_id"""
+        conn = self._conn()
+        now = time.time()
+        target_key = normalize_entity('username', target) or target
+        postings = {
+            (kind, normalized)
+            for kind, value in entities
+            for normalized in (normalize_entity(kind, value),)
+            if normalized
+        }
+        with conn:
+            scan_id = conn.execute(
+                'INSERT INTO scans (target, seen_at) VALUES (?, ?)', (target_key, now)
+            ).lastrowid
+            conn.executemany(
+                'INSERT OR IGNORE INTO entity_postings (kind, value, target, scan_id, seen_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(kind, value, target_key, scan_id, now) for kind, value in postings]
+            )
+        return scan_id
+
+    def record_scan(self, target: str, consolidated: Dict[str, List[Any]]) -> int:
+        """Index the output of RealWorldOSINTHandler.consolidate_scattered_data"""
+        return self.record_entities(target, (
+            (CONSOLIDATED_KINDS[key], value)
+            for key, values in consolidated.items()
+            if key in CONSOLIDATED_KINDS
+            for value in values
+        ))
+
+    # ---------- LOOKUPS ----------
+
+    def lookup(self, kind: str, value: str, exclude_target: Optional[str] = None,
+               limit: int = 100) -> List[Dict[str, Any]]:
+        """Targets (latest scan each) where this entity appeared"""
+        normalized = normalize_entity(kind, value)
+        if not normalized:
+            return []
+        excluded = normalize_entity('username', exclude_target) if exclude_target else None
+        rows = self._conn().execute(
+            'SELECT target, MAX(scan_id), MAX(seen_at) FROM entity_postings '
+            'WHERE kind = ? AND value = ? AND target IS NOT ? '
+            'GROUP BY target ORDER BY MAX(seen_at) DESC LIMIT ?',
+            (kind, normalized, excluded, limit)
+        ).fetchall()
+        return [{'target': t, 'scan_id': s, 'seen_at': seen} for t, s, seen in rows]
+
+    def shared_with(self, target: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """Other targets sharing any entity with this target's scans"""
+        target_key = normalize_entity('username', target) or target
+        # Rank and cut the other targets in SQL, then list what each shares
+        rows = self._conn().execute(
+            'WITH mine AS (SELECT DISTINCT kind, value FROM entity_postings WHERE target = ?), '
+            'shared AS (SELECT DISTINCT other.target, mine.kind, mine.value FROM mine '
+            '  JOIN entity_postings AS other ON other.kind = mine.kind AND other.value = mine.value '
+            '  WHERE other.target != ?), '
+            'top AS (SELECT target, COUNT(*) AS n FROM shared GROUP BY target ORDER BY n DESC, target LIMIT ?) '
+            'SELECT shared.target, shared.kind, shared.value FROM shared JOIN top ON top.target = shared.target '
+            'ORDER BY top.n DESC, shared.target',
+            (target_key, target_key, limit)
+        ).fetchall()
+
+        shared: Dict[str, Dict[str, Any]] = {}
+        for other, kind, value in rows:
+            entry = shared.setdefault(other, {'target': other, 'shared': []})
+            entry['shared'].append({'kind': kind, 'value': value})
+        return list(shared.values())
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._conn()
+        return {
+            'scans': conn.execute('SELECT COUNT(*) FROM scans').fetchone()[0],
+            'postings': conn.execute('SELECT COUNT(*) FROM entity_postings').fetchone()[0]
+        }
+
+
+ENTITY_INDEX = EntityIndex()
@@ -0,0 +1,147 @@
+"""
+Local HaveIBeenPwned mock
+Serves the three HIBP endpoints the backend uses, with deterministic data,
+so breach lookups, bulk audits and password checks can be exercised offline:
+  GET /api/v3/breaches                    breach metadata
+  GET /api/v3/breachedaccount/<account>   needs hibp-api-key; 429 + Retry-After past HIBP_MOCK_RPM
+  GET /range/<prefix>                     Pwned Passwords range (honours Add-Padding)
+  GET /__stats                            requests served per endpoint
+
+An address is breached when its SHA-1 starts with 0-7 (about half of all
+addresses); fixed test addresses and common passwords always match.
+
+Usage:
+    python hibp_mock.py 5055
+    HIBP_API_URL=http://127.0.0.1:5055/api/v3 PWNED_PASSWORDS_URL=http://127.0.0.1:5055/range \\
+        HIBP_API_KEY=test python app.py
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+from typing import Dict, List
+
+from flask import Flask, jsonify, request, Response
+
+MOCK_RPM = float(os.environ.get('HIBP_MOCK_RPM', '600'))
+
+BREACHES = [
+    {'Name': 'Adobe', 'Title': 'Adobe', 'Domain': 'adobe.com', 'BreachDate': '2013-10-04',
+     'AddedDate': '2013-12-04T00:00:00Z', 'PwnCount': 152445165, 'IsVerified': True, 'IsSensitive': False,
+     'DataClasses': ['Email addresses', 'Password hints', 'Passwords', 'Usernames']},
+    {'Name': 'LinkedIn', 'Title': 'LinkedIn', 'Domain': 'linkedin.com', 'BreachDate': '2012-05-05',
+     'AddedDate': '2016-05-21T21:35:40Z', 'PwnCount': 164611595, 'IsVerified': True, 'IsSensitive': False,
+     'DataClasses': ['Email addresses', 'Passwords']},
+    {'Name': 'Dropbox', 'Title': 'Dropbox', 'Domain': 'dropbox.com', 'BreachDate': '2012-07-01',
+     'AddedDate': '2016-08-31T00:19:19Z', 'PwnCount': 68648009, 'IsVerified': True, 'IsSensitive': False,
+     'DataClasses': ['Email addresses', 'Passwords']},
+    {'Name': 'Canva', 'Title': 'Canva', 'Domain': 'canva.com', 'BreachDate': '2019-05-24',
+     'AddedDate': '2019-08-09T14:24:01Z', 'PwnCount': 137272116, 'IsVerified': True, 'IsSensitive': False,
+     'DataClasses': ['Email addresses', 'Geographic locations', 'Names', 'Passwords', 'Usernames']},
+    {'Name': 'Collection1', 'Title': 'Collection #1', 'Domain': '', 'BreachDate': '2019-01-07',
+     'AddedDate': '2019-01-16T21:46:07Z', 'PwnCount': 772904991, 'IsVerified': False, 'IsSensitive': False,
+     'DataClasses': ['Email addresses', 'Passwords']},
+]
+
+FIXED_ACCOUNTS = {
+    'account-exists@hibp-integration-tests.com': ['Adobe'],
+    'multiple-breaches@hibp-integration-tests.com': ['Adobe', 'LinkedIn', 'Collection1'],
+    'not-pwned@hibp-integration-tests.com': [],
+}
+
+PWNED_PASSWORDS = {
+    'password': 10434004,
+    '123456': 37359195,
+    'qwerty': 10556095,
+    'letmein': 652280,
+    'hunter2': 17043,
+}
+_PWNED_HASHES = {hashlib.sha1(p.encode()).hexdigest().upper(): count for p, count in PWNED_PASSWORDS.items()}
+
+app = Flask(__name__)
+_lock = threading.Lock()
+_next_slot: Dict[str, float] = {}
+served: Dict[str, int] = {'breaches': 0, 'breachedaccount': 0, 'range': 0, 'rate_limited': 0}
+
+
+def _count(endpoint: str) -> None:
+    with _lock:
+        served[endpoint] += 1
+
+
+def account_breaches(account: str) -> List[str]:
+    account = account.strip().lower()
+    if account in FIXED_ACCOUNTS:
+        return FIXED_ACCOUNTS[account]
+    digest = hashlib.sha1(account.encode()).digest()
+    if digest[0] >= 128:
+        return []
+    return [b['Name'] for i, b in enumerate(BREACHES) if digest[1 + i] % 3 == 0] or [BREACHES[digest[1] % len(BREACHES)]['Name']]
+
+
+def range_body(prefix: str, padding: bool) -> str:
+    rows = {full[5:]: count for full, count in _PWNED_HASHES.items() if full.startswith(prefix)}
+    # Filler rows so every range looks like a real one
+    for i in range(24):
+        filler = hashlib.sha1(f'{prefix}:{i}'.encode()).hexdigest().upper()[:35]
+        rows.setdefault(filler, 1 + int(filler[:4], 16) % 500)
+    if padding:
+        for i in range(8):
+            rows.setdefault(hashlib.sha1(f'{prefix}:pad:{i}'.encode()).hexdigest().upper()[:35], 0)
+    return '\r\n'.join(f'{suffix}:{count}' for suffix, count in sorted(rows.items()))
+
+
+@app.route('/api/v3/breaches')
+def breaches():
+    _count('breaches')
+    return jsonify(BREACHES)
+
+
+@app.route('/api/v3/breachedaccount/<path:account>')
+def breached_account(account):
+    key = request.headers.get('hibp-api-key')
+    if not key:
+        return jsonify({'statusCode': 401, 'message': 'Access denied due to missing hibp-api-key.'}), 401
+
+    with _lock:
+        now = time.monotonic()
+        slot = _next_slot.get(key, 0.0)
+        # Tolerate client clock jitter, as the real API does
+        if slot - now > 0.1 * 60.0 / MOCK_RPM:
+            served['rate_limited'] += 1
+            retry = max(1, int(slot - now + 0.999))
+            return Response('{"statusCode": 429}', status=429, mimetype='application/json',
+                            headers={'Retry-After': str(retry)})
+        _next_slot[key] = max(now, slot) + 60.0 / MOCK_RPM
+    _count('breachedaccount')
+
+    names = account_breaches(account)
+    if not names:
+        return Response(status=404)
+    if request.args.get('truncateResponse', 'true').lower() == 'false':
+        return jsonify([b for b in BREACHES if b['Name'] in names])
+    return jsonify([{'Name': name} for name in names])
+
+
+@app.route('/range/<prefix>')
+def password_range(prefix):
+    prefix = prefix.upper()
+    if len(prefix) != 5 or any(ch not in '0123456789ABCDEF' for ch in prefix):
+        return Response('The hash prefix was not in a valid format', status=400)
+    _count('range')
+    padding = request.headers.get('Add-Padding', '').lower() == 'true'
+    return Response(range_body(prefix, padding), mimetype='text/plain')
+
+
+@app.route('/__stats')
+def stats():
+    with _lock:
+        return jsonify(dict(served))
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 5055
+    print(f"🧪 HIBP mock on http://127.0.0.1:{port} ({MOCK_RPM:g} requests/min per key)")
+    app.run(host='127.0.0.1', port=port, threaded=True)
@@ -0,0 +1,165 @@
+"""
+Streaming <article> text extraction
+Feeds HTML to the stdlib parser chunk by chunk and keeps only what post
+extraction needs: a flat list of stripped text pieces plus (start, end)
+indices for every <div>. Each div's text is a slice join over that list,
+built once and only up to the character cap, instead of re-walking the
+subtree per div. Script/style contents and comments are skipped, and the
+caller can stop reading as soon as `done` is set.
+
+Output matches the old BeautifulSoup loop: for each of the first `limit`
+articles, " ".join(div.get_text(strip=True) for every non-empty div)[:max_chars].
+
+Usage:
+    from html_articles import ArticleExtractor
+
+    extractor = ArticleExtractor(limit=5, max_chars=280)
+    for chunk in response.iter_content(16384, decode_unicode=True):
+        extractor.feed(chunk)
+        if extractor.done:
+            break
+    posts = extractor.close()
+"""
+
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+SKIP_TAGS = ('script', 'style', 'template', 'noscript')
+
+
+class _ArticleFrame:
+    __slots__ = ('slot', 'div_lo')
+
+    def __init__(self, slot: int, div_lo: int):
+        self.slot = slot
+        self.div_lo = div_lo
+
+
+class ArticleExtractor(HTMLParser):
+    """Collects the text of the first `limit` <article> elements (nested ones count separately)"""
+
+    def __init__(self, limit: int = 5, max_chars: int = 280):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.max_chars = max_chars
+        self.done = False
+        self._texts: List[Optional[str]] = []   # per article slot, in start-tag order
+        self._articles: List[_ArticleFrame] = []
+        self._strings: List[str] = []           # stripped text pieces inside open articles
+        self._divs: List[List[int]] = []        # [start, end] into _strings, in start-tag order
+        self._open_divs: List[int] = []         # indices into _divs
+        self._skip_depth = 0
+        self._pending: List[str] = []           # adjacent data events form one string
+
+    # ---- parser events ----
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == 'article':
+            if len(self._texts) < self.limit:
+                self._articles.append(_ArticleFrame(len(self._texts), len(self._divs)))
+                self._texts.append(None)
+            elif self._articles:
+                # Past the limit: only nesting inside a tracked article matters
+                self._articles.append(_ArticleFrame(-1, len(self._divs)))
+        elif tag == 'div' and self._articles:
+            self._open_divs.append(len(self._divs))
+            self._divs.append([len(self._strings), -1])
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+        if tag == 'div' and self._articles:
+            self._divs.append([len(self._strings), len(self._strings)])
+        elif tag == 'article' and len(self._texts) < self.limit:
+            self._texts.append('')
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == 'div' and self._open_divs:
+            self._divs[self._open_divs.pop()][1] = len(self._strings)
+        elif tag == 'article' and self._articles:
+            self._close_article(self._articles.pop())
+
+    def handle_comment(self, data):
+        # Skipped, but it still separates the text around it into two strings
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def handle_data(self, data):
+        if self._articles and not self._skip_depth:
+            self._pending.append(data)
+
+    # ---- text assembly ----
+
+    def _flush(self):
+        if self._pending:
+            text = ''.join(self._pending).strip()
+            self._pending = []
+            if text:
+                self._strings.append(text)
+
+    def _div_text(self, start: int, end: int, budget: int) -> str:
+        """Join strings[start:end], stopping once `budget` characters are gathered"""
+        parts = []
+        size = 0
+        for i in range(start, end):
+            parts.append(self._strings[i])
+            size += len(self._strings[i])
+            if size >= budget:
+                break
+        return ''.join(parts)
+
+    def _close_article(self, frame: _ArticleFrame):
+        end = len(self._strings)
+        # Divs left open inside the article end with it, as a tree builder would close them
+        while self._open_divs and self._open_divs[-1] >= frame.div_lo:
+            self._divs[self._open_divs.pop()][1] = end
+
+        if frame.slot >= 0:
+            pieces = []
+            size = -1
+            for start, div_end in self._divs[frame.div_lo:]:
+                if size >= self.max_chars:
+                    break
+                text = self._div_text(start, div_end, self.max_chars - max(size, 0))
+                if text:
+                    pieces.append(text)
+                    size += 1 + len(text)
+            self._texts[frame.slot] = ' '.join(pieces)[:self.max_chars]
+
+        if not self._articles:
+            # Outermost article closed: nothing can refer to these indices again
+            self._strings = []
+            self._divs = []
+            if len(self._texts) >= self.limit:
+                self.done = True
+
+    def close(self) -> List[str]:
+        """Finish parsing; returns the non-empty article texts in document order"""
+        if not self.done:
+            super().close()
+            self._flush()
+            while self._articles:
+                self._close_article(self._articles.pop())
+        return [text for text in self._texts if text]
+
+
+def extract_articles(chunks, limit: int = 5, max_chars: int = 280) -> Tuple[List[str], bool]:
+    """Convenience wrapper over decoded text chunks; returns (posts, stopped_early)"""
+    extractor = ArticleExtractor(limit, max_chars)
+    stopped = False
+    for chunk in chunks:
+        extractor.feed(chunk)
+        if extractor.done:
+            stopped = True
+            break
+    return extractor.close(), stopped
@@ -0,0 +1,229 @@
+"""
+Shared HTTP layer for collectors
+One pooled requests.Session for every collector, plus conditional GETs:
+JSON responses are stored with their ETag in a local SQLite file and
+revalidated with If-None-Match, so an unchanged resource costs a 304
+(free against GitHub's rate limit) and no body transfer. Stored bodies
+expire after ETAG_MAX_AGE_HOURS and the file keeps at most
+ETAG_MAX_ENTRIES of the newest ones.
+
+Usage:
+    from http_client import HTTP
+
+    result = HTTP.get_json('https://api.github.com/users/torvalds', headers=headers)
+    result.status_code    # 200 (also for a revalidated 304)
+    result.data           # parsed JSON body
+    result.not_modified   # True when served from the ETag store
+
+    # Independent sub-requests under one deadline; late ones are dropped
+    deadline = time.monotonic() + 10
+    done = run_parallel({
+        'user': lambda: HTTP.get_json(user_url, timeout=time_left(deadline)),
+        'repos': lambda: HTTP.get_json(repos_url, timeout=time_left(deadline)),
+    }, deadline)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple, Callable, Hashable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+ETAG_STORE_PATH = os.environ.get(
+    'ETAG_STORE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'http_etags.db')
+)
+ETAG_MAX_AGE = float(os.environ.get('ETAG_MAX_AGE_HOURS', '168')) * 3600
+ETAG_MAX_ENTRIES = int(os.environ.get('ETAG_MAX_ENTRIES', '20000'))
+# Prune on every Nth write, not every one
+ETAG_PRUNE_EVERY = 200
+HTTP_POOL_SIZE = int(os.environ.get('HTTP_POOL_SIZE', '32'))
+DEFAULT_TIMEOUT = 10.0
+
+# Only leaf HTTP calls run here, so callers waiting on it can't starve it
+SUBREQUEST_POOL = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix='osint-subrequest')
+
+
+@dataclass
+class HttpResult:
+    status_code: int
+    data: Any
+    not_modified: bool = False
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class ETagStore:
+    """ETag + JSON body per request key, in SQLite; one connection per thread"""
+
+    def __init__(self, path: str = ETAG_STORE_PATH, max_age: float = ETAG_MAX_AGE,
+                 max_entries: int = ETAG_MAX_ENTRIES):
+        self.path = path
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.pruned = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS etags (
+                    key TEXT PRIMARY KEY,
+                    etag TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_etags_stored_at ON etags(stored_at)')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        return self._conn().execute(
+            'SELECT etag, body FROM etags WHERE key = ? AND stored_at >= ?',
+            (key, time.time() - self.max_age)
+        ).fetchone()
+
+    def put(self, key: str, etag: str, body: str) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO etags (key, etag, body, stored_at) VALUES (?, ?, ?, ?)',
+                (key, etag, body, time.time())
+            )
+        with self._lock:
+            self._writes += 1
+            due = self._writes % ETAG_PRUNE_EVERY == 1
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """Drop expired rows, then the oldest past max_entries; returns rows removed"""
+        conn = self._conn()
+        with conn:
+            removed = conn.execute('DELETE FROM etags WHERE stored_at < ?', (time.time() - self.max_age,)).rowcount
+            removed += conn.execute(
+                'DELETE FROM etags WHERE key IN '
+                '(SELECT key FROM etags ORDER BY stored_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            ).rowcount
+        with self._lock:
+            self.pruned += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'entries': self._conn().execute('SELECT COUNT(*) FROM etags').fetchone()[0],
+            'max_entries': self.max_entries,
+            'pruned': self.pruned
+        }
+
+
+class HttpClient:
+    """Pooled session shared by all collectors"""
+
+    def __init__(self, etag_store: Optional[ETagStore] = None, pool_size: int = HTTP_POOL_SIZE):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.etags = etag_store
+        self.revalidated = 0
+        self.stored = 0
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.post(url, **kwargs)
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]], headers: Dict[str, str]) -> str:
+        # Responses vary by credentials and media type; never store the token itself
+        auth = hashlib.sha1(headers.get('Authorization', '').encode()).hexdigest()[:16]
+        query = json.dumps(params or {}, sort_keys=True)
+        return f"{url}|{query}|{headers.get('Accept', '')}|{auth}"
+
+    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None,
+                 params: Optional[Dict[str, Any]] = None, timeout: float = 10) -> HttpResult:
+        """GET a JSON resource, revalidating a stored copy with If-None-Match"""
+        headers = dict(headers or {})
+        key = None
+        cached = None
+        if self.etags is not None:
+            key = self._cache_key(url, params, headers)
+            try:
+                cached = self.etags.get(key)
+            except sqlite3.Error as e:
+                print(f"⚠️ ETag store unavailable: {e}")
+            if cached:
+                headers['If-None-Match'] = cached[0]
+
+        response = self.session.get(url, headers=headers, params=params, timeout=timeout)
+
+        if response.status_code == 304 and cached:
+            self.revalidated += 1
+            return HttpResult(200, json.loads(cached[1]), True, dict(response.headers))
+
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+
+        etag = response.headers.get('ETag')
+        if key is not None and response.status_code == 200 and etag and data is not None:
+            self.stored += 1
+            try:
+                self.etags.put(key, etag, response.text)
+            except sqlite3.Error as e:
+                print(f"⚠️ ETag store write failed: {e}")
+
+        return HttpResult(response.status_code, data, False, dict(response.headers))
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {'revalidated': self.revalidated, 'stored': self.stored}
+        if self.etags is not None:
+            try:
+                stats.update(self.etags.stats())
+            except sqlite3.Error as e:
+                stats['error'] = str(e)
+        return stats
+
+
+HTTP = HttpClient(ETagStore())
+
+
+def time_left(deadline: float, cap: float = DEFAULT_TIMEOUT) -> float:
+    """Per-call timeout under a shared time.monotonic() deadline"""
+    return max(0.05, min(cap, deadline - time.monotonic()))
+
+
+def run_parallel(calls: Dict[Hashable, Callable[[], Any]], deadline: float) -> Dict[Hashable, Any]:
+    """
+    Run independent calls concurrently until the deadline. Returns results by
+    key; calls that failed or were still running at the deadline are missing.
+    """
+    futures = {SUBREQUEST_POOL.submit(call): key for key, call in calls.items()}
+    done, not_done = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+
+    results = {}
+    for future in done:
+        try:
+            results[futures[future]] = future.result()
+        except Exception as e:
+            print(f"⚠️ Sub-request {futures[future]} failed: {e}")
+    for future in not_done:
+        future.cancel()
+        print(f"⚠️ Sub-request {futures[future]} missed the deadline")
+    return results
@@ -0,0 +1,81 @@
+"""
+Hot-reloading JSON config store
+Holds the compiled form of one JSON file and swaps it when the file changes.
+A file that fails to load or compile, for any reason, is rejected and the
+previous compiled value stays live; a broken file is not retried until it
+changes again. Used by the risk rules and the platform catalog.
+
+Usage:
+    from json_store import HotReloadJsonStore
+
+    store = HotReloadJsonStore('risk_rules.json', CompiledRiskRules, RiskRulesError, 'Risk rules')
+    rules = store.current()        # re-checks the file mtime every check_interval seconds
+    store.reload(force=True)       # re-read now; store.last_error says why a file was rejected
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, Callable, Type
+
+
+class HotReloadJsonStore:
+    """
+    Active compiled value of a JSON object file. `compile` takes the parsed
+    object and the path and must expose a `version`; `error` is raised when
+    nothing valid has ever been loaded.
+    """
+
+    def __init__(self, path: str, compile: Callable[[Dict[str, Any], str], Any],
+                 error: Type[Exception], label: str,
+                 describe: Optional[Callable[[Any], str]] = None, check_interval: float = 5.0):
+        self.path = path
+        self.compile = compile
+        self.error = error
+        self.label = label
+        self.describe = describe or (lambda value: f"version {value.version}")
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._value: Any = None
+        self._mtime = None
+        self._next_check = 0.0
+        self.last_error: Optional[str] = None
+
+    def _load(self) -> Any:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+        if not isinstance(raw, dict):
+            raise self.error(f"{self.label} file must contain a JSON object")
+        return self.compile(raw, self.path)
+
+    def reload(self, force: bool = True) -> Any:
+        """Re-read the file; raises `error` if nothing valid is loaded"""
+        with self._lock:
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+                if force or mtime != self._mtime or self._value is None:
+                    value = self._load()
+                    print(f"✅ {self.label} loaded: {self.describe(value)}")
+                    self._value = value
+                    self._mtime = mtime
+                    self.last_error = None
+            except Exception as e:
+                # Any failure, not just validation errors, keeps the last good value
+                self.last_error = str(e)
+                if self._value is None:
+                    raise self.error(f"Could not load {self.label.lower()} from {self.path}: {e}") from e
+                print(f"⚠️ {self.label} reload rejected, keeping version {self._value.version}: {e}")
+                try:
+                    self._mtime = os.stat(self.path).st_mtime_ns
+                except OSError:
+                    pass
+            self._next_check = time.monotonic() + self.check_interval
+            return self._value
+
+    def current(self) -> Any:
+        """Active value; re-checks the file mtime at most every check_interval seconds"""
+        value = self._value
+        if value is None or time.monotonic() >= self._next_check:
+            return self.reload(force=False)
+        return value
@@ -0,0 +1,262 @@
+"""
+Paginated list collection (deep mode)
+Follows GitHub/GitLab pagination under per-platform item and byte caps.
+Page 1 tells how many pages exist (Link rel="last" or X-Total-Pages); the
+rest are then fetched concurrently, a few at a time, and handed to the
+caller in page order as they arrive, so raw pages can be slimmed and
+dropped one by one. Without a page count it follows rel="next" /
+X-Next-Page one page at a time. Bodies are streamed and abandoned as soon
+as they would exceed the remaining byte budget.
+
+Usage:
+    from pagination import PageStream, deep_caps
+
+    stream = PageStream(HTTP.session, f'https://api.github.com/users/{user}/repos',
+                        caps=deep_caps('github'), deadline=time.monotonic() + 60).start()
+    for page in stream:                     # list of items per page, in page order
+        repos.extend(summarize(repo) for repo in page)
+    stream.report()   # {'pages': 7, 'items': 640, 'bytes': 2104311, 'truncated': None, ...}
+"""
+
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+from urllib.parse import urlparse, parse_qs
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from http_client import SUBREQUEST_POOL, time_left
+
+PAGINATION_CONCURRENCY = int(os.environ.get('PAGINATION_CONCURRENCY', '4'))
+DEEP_PER_PAGE = 100
+DEEP_MAX_ITEMS = 1000
+DEEP_MAX_BYTES = 8 * 1024 * 1024
+PAGE_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class PageCaps:
+    max_items: int
+    max_bytes: int
+
+
+def deep_caps(platform: str) -> PageCaps:
+    """Caps for one platform: DEEP_<PLATFORM>_MAX_ITEMS / _MAX_BYTES, else the defaults"""
+    prefix = f'DEEP_{platform.upper()}'
+    return PageCaps(
+        max(1, int(os.environ.get(f'{prefix}_MAX_ITEMS', DEEP_MAX_ITEMS))),
+        max(1, int(os.environ.get(f'{prefix}_MAX_BYTES', DEEP_MAX_BYTES)))
+    )
+
+
+@dataclass
+class Page:
+    status: int
+    items: Optional[List[Any]]
+    headers: CaseInsensitiveDict
+    links: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    size: int = 0
+    over_limit: bool = False
+
+
+def fetch_page(session: requests.Session, url: str, params: Optional[Dict[str, Any]],
+               headers: Optional[Dict[str, str]], timeout: float, max_bytes: int) -> Page:
+    """GET one JSON page, giving up once the body passes `max_bytes`"""
+    with session.get(url, params=params, headers=headers, timeout=timeout, stream=True) as response:
+        page = Page(response.status_code, None, CaseInsensitiveDict(response.headers), response.links or {})
+        declared = response.headers.get('Content-Length', '')
+        if declared.isdigit() and int(declared) > max_bytes:
+            page.over_limit = True
+            return page
+
+        body = bytearray()
+        for chunk in response.iter_content(PAGE_CHUNK_SIZE):
+            body += chunk
+            if len(body) > max_bytes:
+                page.over_limit = True
+                page.size = len(body)
+                return page
+        page.size = len(body)
+
+    if page.status == 200:
+        try:
+            data = json.loads(body.decode(response.encoding or 'utf-8'))
+        except (ValueError, LookupError):
+            data = None
+        page.items = data if isinstance(data, list) else None
+    return page
+
+
+def page_count(page: Page) -> Optional[int]:
+    """Total pages from X-Total-Pages or the Link rel="last" URL; None when not advertised"""
+    total = page.headers.get('X-Total-Pages', '')
+    if total.isdigit():
+        return int(total)
+    last = page.links.get('last', {}).get('url')
+    if last:
+        number = parse_qs(urlparse(last).query).get('page', [''])[0]
+        if number.isdigit():
+            return int(number)
+    return None
+
+
+def next_request(page: Page, url: str, params: Dict[str, Any]) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+    """(url, params) of the page after this one, from Link rel="next" or X-Next-Page"""
+    link = page.links.get('next', {}).get('url')
+    if link:
+        return link, None
+    number = page.headers.get('X-Next-Page', '')
+    if number.isdigit():
+        return url, {**params, 'page': int(number)}
+    return None
+
+
+class PageStream:
+    """
+    Iterates the pages of one list endpoint. After iteration, `status` is
+    page 1's status code and `truncated` says why collection stopped early:
+    'items' / 'bytes' (a cap), 'deadline', 'error', or None (complete).
+    """
+
+    def __init__(self, session: requests.Session, url: str, params: Optional[Dict[str, Any]] = None,
+                 headers: Optional[Dict[str, str]] = None, caps: Optional[PageCaps] = None,
+                 deadline: Optional[float] = None, per_page: int = DEEP_PER_PAGE,
+                 concurrency: int = PAGINATION_CONCURRENCY):
+        self.session = session
+        self.url = url
+        self.params = {**(params or {}), 'per_page': per_page}
+        self.headers = headers
+        self.caps = caps or PageCaps(DEEP_MAX_ITEMS, DEEP_MAX_BYTES)
+        self.deadline = deadline if deadline is not None else time.monotonic() + 60
+        self.per_page = per_page
+        self.concurrency = max(1, concurrency)
+        self.status: Optional[int] = None
+        self.total_pages: Optional[int] = None
+        self.pages = 0
+        self.items = 0
+        self.bytes_read = 0
+        self.truncated: Optional[str] = None
+        self.error: Optional[str] = None
+        self._first: Optional[Future] = None
+
+    def start(self) -> 'PageStream':
+        """Send the first request now, so it overlaps whatever the caller does next"""
+        if self._first is None:
+            self._first = self._submit(self.url, self.params)
+        return self
+
+    def _submit(self, url: str, params: Optional[Dict[str, Any]]) -> Future:
+        return SUBREQUEST_POOL.submit(
+            fetch_page, self.session, url, params, self.headers,
+            time_left(self.deadline), max(0, self.caps.max_bytes - self.bytes_read)
+        )
+
+    def _stop(self, reason: str) -> None:
+        if self.truncated is None:
+            self.truncated = reason
+
+    def _result(self, future: Future) -> Optional[Page]:
+        try:
+            return future.result(timeout=max(0.0, self.deadline - time.monotonic()))
+        except FutureTimeout:
+            future.cancel()
+            self._stop('deadline')
+        except Exception as e:
+            self.error = str(e)
+            self._stop('deadline' if time.monotonic() >= self.deadline else 'error')
+        return None
+
+    def _take(self, page: Page) -> Optional[List[Any]]:
+        """Count a page against the caps; the items to hand out, or None to stop"""
+        if page.over_limit or self.bytes_read + page.size > self.caps.max_bytes:
+            self._stop('bytes')
+            return None
+        if page.status != 200 or page.items is None:
+            if self.pages:
+                self.error = f'page {self.pages + 1} returned status {page.status}'
+                self._stop('error')
+            return None
+
+        self.pages += 1
+        self.bytes_read += page.size
+        room = self.caps.max_items - self.items
+        items = page.items[:room]
+        self.items += len(items)
+        if len(page.items) > room:
+            self._stop('items')
+        return items
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        self.start()
+        pending: deque = deque()
+        try:
+            first = self._result(self._first)
+            if first is None:
+                return
+            self.status = first.status
+            items = self._take(first)
+            if items is None:
+                return
+            if items:
+                yield items
+            if self.truncated:
+                return
+
+            self.total_pages = page_count(first)
+            if self.total_pages is not None:
+                # Every page URL is known: keep a window of them in flight
+                last = min(self.total_pages, math.ceil(self.caps.max_items / self.per_page))
+                numbers = iter(range(2, last + 1))
+
+                def fill():
+                    while len(pending) < self.concurrency:
+                        number = next(numbers, None)
+                        if number is None:
+                            return
+                        pending.append(self._submit(self.url, {**self.params, 'page': number}))
+
+                fill()
+                while pending and not self.truncated:
+                    page = self._result(pending.popleft())
+                    items = self._take(page) if page is not None else None
+                    if items is None:
+                        return
+                    if items:
+                        yield items
+                    fill()
+                if self.total_pages > last:
+                    self._stop('items')
+            else:
+                request = next_request(first, self.url, self.params)
+                while request and not self.truncated:
+                    if self.items >= self.caps.max_items:
+                        self._stop('items')
+                        return
+                    page = self._result(self._submit(*request))
+                    items = self._take(page) if page is not None else None
+                    if not items:
+                        return
+                    yield items
+                    request = next_request(page, self.url, self.params)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def report(self) -> Dict[str, Any]:
+        report = {
+            'pages': self.pages,
+            'total_pages': self.total_pages,
+            'items': self.items,
+            'bytes': self.bytes_read,
+            'truncated': self.truncated,
+            'caps': {'max_items': self.caps.max_items, 'max_bytes': self.caps.max_bytes}
+        }
+        if self.error:
+            report['error'] = self.error
+        return report
@@ -0,0 +1,152 @@
+"""
+Behavioral pattern detectors
+Each detector declares the scan features it reads; a per-scan FeatureStore
+computes every feature at most once and shares it across all detectors, so
+adding detectors doesn't add passes over the results.
+
+Usage:
+    from patterns import FeatureStore, detect_patterns, pattern_detector
+
+    @pattern_detector('single_platform', needs=('found_platforms',))
+    def single_platform(found_platforms):
+        if len(found_platforms) == 1:
+            return f"📍 Only found on {found_platforms[0]}"
+
+    detect_patterns(FeatureStore(results))
+    # Streaming callers seed the store with aggregates they already hold
+    detect_patterns(FeatureStore(found_platforms=[...], has_email=False, ...))
+"""
+
+from collections import Counter
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+PROFESSIONAL_PLATFORMS = ['github', 'gitlab', 'linkedin']
+PERSONAL_PLATFORMS = ['instagram', 'facebook', 'twitter', 'reddit']
+
+# Values that don't count as a real email/username
+_ABSENT_VALUES = [None, '', 'None', 'null', 'Unknown', 'Not public']
+
+
+# ==================== FEATURES ====================
+
+# feature name -> function(store) computing it from store.results
+PATTERN_FEATURES: Dict[str, Callable[['FeatureStore'], Any]] = {}
+
+
+def pattern_feature(name: str):
+    """Register a feature computed from a scan's results"""
+    def register(fn):
+        PATTERN_FEATURES[name] = fn
+        return fn
+    return register
+
+
+class FeatureStore:
+    """
+    Per-scan feature cache. Features are computed lazily from `results`
+    (raw dicts or an AnnotatedResults overlay) unless passed in precomputed.
+    """
+
+    def __init__(self, results: Optional[Dict[str, Dict[str, Any]]] = None, **precomputed: Any):
+        self.results = results
+        self._values: Dict[str, Any] = dict(precomputed)
+
+    def get(self, name: str) -> Any:
+        if name not in self._values:
+            compute = PATTERN_FEATURES.get(name)
+            if compute is None:
+                raise KeyError(f"Unknown pattern feature: {name}")
+            if self.results is None:
+                raise ValueError(f"Feature '{name}' was not precomputed and there are no results to derive it from")
+            self._values[name] = compute(self)
+        return self._values[name]
+
+
+@pattern_feature('found_platforms')
+def _found_platforms(store: FeatureStore) -> List[str]:
+    return [platform for platform, data in store.results.items() if data.get('found')]
+
+
+@pattern_feature('freshness')
+def _freshness(store: FeatureStore) -> Dict[str, str]:
+    return {platform: store.results[platform].get('freshness', 'FRESH') for platform in store.get('found_platforms')}
+
+
+@pattern_feature('usernames')
+def _usernames(store: FeatureStore) -> Counter:
+    usernames = Counter()
+    for platform in store.get('found_platforms'):
+        username = (store.results[platform].get('profile') or {}).get('username')
+        if username and username not in _ABSENT_VALUES:
+            usernames[username] += 1
+    return usernames
+
+
+@pattern_feature('has_email')
+def _has_email(store: FeatureStore) -> bool:
+    return any(
+        (store.results[platform].get('profile') or {}).get('email') not in _ABSENT_VALUES
+        for platform in store.get('found_platforms')
+    )
+
+
+# ==================== DETECTORS ====================
+
+# name -> (needed features, detector); registration order is report order
+PATTERN_DETECTORS: Dict[str, Tuple[Tuple[str, ...], Callable[..., Optional[str]]]] = {}
+
+
+def pattern_detector(name: str, needs: Tuple[str, ...]):
+    """Register a detector called with the named features; it returns a pattern string or None"""
+    def register(fn):
+        PATTERN_DETECTORS[name] = (tuple(needs), fn)
+        return fn
+    return register
+
+
+def detect_patterns(store: FeatureStore, detectors: Optional[List[str]] = None) -> List[str]:
+    """Run the registered detectors (or the named subset) against one scan's features"""
+    patterns = []
+    for name, (needs, detector) in PATTERN_DETECTORS.items():
+        if detectors is not None and name not in detectors:
+            continue
+        pattern = detector(**{feature: store.get(feature) for feature in needs})
+        if pattern:
+            patterns.append(pattern)
+    return patterns
+
+
+@pattern_detector('privacy_conscious', needs=('found_platforms', 'has_email'))
+def privacy_conscious(found_platforms: List[str], has_email: bool) -> Optional[str]:
+    if len(found_platforms) >= 3 and not has_email:
+        return "🔍 Privacy-conscious: Active on multiple platforms but email not exposed"
+    return None
+
+
+@pattern_detector('dormant_accounts', needs=('freshness',))
+def dormant_accounts(freshness: Dict[str, str]) -> Optional[str]:
+    old_accounts = [platform for platform, label in freshness.items() if label == 'STALE']
+    if old_accounts:
+        return f"⏰ Dormant accounts detected on: {', '.join(old_accounts)}"
+    return None
+
+
+@pattern_detector('professional_split', needs=('found_platforms',))
+def professional_split(found_platforms: List[str]) -> Optional[str]:
+    prof_count = sum(1 for p in found_platforms if p in PROFESSIONAL_PLATFORMS)
+    pers_count = sum(1 for p in found_platforms if p in PERSONAL_PLATFORMS)
+    if prof_count > 0 and pers_count == 0:
+        return "💼 Professional-only presence - minimal personal exposure"
+    if pers_count > 0 and prof_count == 0:
+        return "🎮 Personal-only presence - no professional footprint"
+    return None
+
+
+@pattern_detector('username_consistency', needs=('usernames',))
+def username_consistency(usernames: Counter) -> Optional[str]:
+    total = sum(usernames.values())
+    if len(usernames) == 1 and total >= 3:
+        return f"🎯 Consistent username '{next(iter(usernames))}' across all platforms"
+    if len(usernames) == total and total >= 3:
+        return "🔀 Different username on each platform - compartmentalization strategy"
+    return None
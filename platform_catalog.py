@@ -0,0 +1,223 @@
+"""
+Platform Rule Catalog
+Loads the username-probe catalog (one JSON line per site) and compiles each
+entry into a SiteRule the enumerator can run generically. Four check kinds,
+picked from the keys an entry has:
+  json_key                       -> JSON body has the key (under json_path)
+  regex                          -> page matches the pattern
+  must_contain/must_not_contain  -> streamed marker scan
+  (none of the above)            -> the status code alone decides
+Status-only entries may set "method": "HEAD" where the platform answers HEAD
+requests, so no body is sent and the connection stays reusable.
+
+Usage:
+    from platform_catalog import PLATFORM_CATALOG
+
+    catalog = PLATFORM_CATALOG.current()   # hot-reloads when the file changed
+    site = catalog.site('github')
+    site.probe_url('torvalds'), site.profile_url_for('torvalds')
+    [s.name for s in catalog.select(['github', 'gitlab'])]
+"""
+
+import os
+import re
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+from urllib.parse import quote, urlsplit
+
+from json_store import HotReloadJsonStore
+
+PLATFORM_CATALOG_PATH = os.environ.get(
+    'PLATFORM_CATALOG_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'platform_catalog.json')
+)
+
+CONFIDENCE_LEVELS = ('HIGH', 'MEDIUM', 'LOW')
+EXISTENCE_SOURCES = ('probe', 'collector')
+PROBE_METHODS = ('GET', 'HEAD')
+DEFAULT_SITE_TIMEOUT = 8.0
+
+# Usernames that may be substituted into a catalog URL; anything else is never fetched
+USERNAME_RE = re.compile(r'[A-Za-z0-9._-]{1,64}')
+# A '{}' in the hostname takes exactly one DNS label
+DNS_LABEL_RE = re.compile(r'[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?')
+_SLOT = 'catalog-slot'
+
+
+class PlatformCatalogError(ValueError):
+    """Raised when a catalog file is missing fields or has invalid values"""
+
+
+def valid_username(username: Any) -> bool:
+    return isinstance(username, str) and USERNAME_RE.fullmatch(username) is not None
+
+
+def _slot_in_host(template: str, where: str) -> bool:
+    """
+    Whether the template's '{}' sits in the hostname. It may only be the
+    whole leftmost label of a fixed domain ('https://{}.tumblr.com/'), so
+    a username can never move the request to another host.
+    """
+    parts = urlsplit(template.replace('{}', _SLOT))
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise PlatformCatalogError(f"{where} must be an absolute http(s) URL")
+    if _SLOT not in parts.netloc:
+        return False
+    labels = parts.netloc.split('.')
+    if labels[0] != _SLOT or len(labels) < 3 or _SLOT in '.'.join(labels[1:]) or '@' in parts.netloc:
+        raise PlatformCatalogError(f"{where}: '{{}}' in the host must be the whole first label of a fixed domain")
+    return True
+
+
+class SiteRule:
+    """One compiled catalog entry"""
+
+    __slots__ = ('name', 'url', 'profile_url', 'check', 'success_codes', 'confidence', 'timeout',
+                 'json_key', 'json_path', 'regex', 'must_contain', 'must_not_contain', 'existence', 'method',
+                 'url_host_slot', 'profile_host_slot')
+
+    def __init__(self, entry: Dict[str, Any], defaults: Dict[str, Any], where: str):
+        name = entry.get('name')
+        if not isinstance(name, str) or not re.fullmatch(r'[a-z0-9_.-]+', name):
+            raise PlatformCatalogError(f"{where}.name must be a lowercase identifier")
+        self.name = name
+
+        for key in ('url', 'profile_url'):
+            value = entry.get(key, entry.get('url'))
+            if not isinstance(value, str) or value.count('{}') != 1:
+                raise PlatformCatalogError(f"{where}.{key} must be a string with exactly one '{{}}'")
+        self.url = entry['url']
+        # Where a person would look; defaults to the probe URL (APIs set both)
+        self.profile_url = entry.get('profile_url', entry['url'])
+        self.url_host_slot = _slot_in_host(self.url, f"{where}.url")
+        self.profile_host_slot = _slot_in_host(self.profile_url, f"{where}.profile_url")
+
+        codes = entry.get('success_codes', defaults.get('success_codes', [200]))
+        if not isinstance(codes, list) or not codes or not all(isinstance(c, int) for c in codes):
+            raise PlatformCatalogError(f"{where}.success_codes must be a non-empty list of ints")
+        self.success_codes: Tuple[int, ...] = tuple(codes)
+
+        self.confidence = entry.get('confidence', defaults.get('confidence', 'LOW'))
+        if self.confidence not in CONFIDENCE_LEVELS:
+            raise PlatformCatalogError(f"{where}.confidence must be one of {', '.join(CONFIDENCE_LEVELS)}")
+
+        timeout = entry.get('timeout', defaults.get('timeout', DEFAULT_SITE_TIMEOUT))
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0:
+            raise PlatformCatalogError(f"{where}.timeout must be a positive number")
+        self.timeout = float(timeout)
+
+        # 'collector': the full collector's found flag decides existence, not the probe
+        self.existence = entry.get('existence', 'probe')
+        if self.existence not in EXISTENCE_SOURCES:
+            raise PlatformCatalogError(f"{where}.existence must be one of {', '.join(EXISTENCE_SOURCES)}")
+
+        self.json_key = entry.get('json_key')
+        if not isinstance(entry.get('json_path', ''), str):
+            raise PlatformCatalogError(f"{where}.json_path must be a dotted string")
+        self.json_path: Tuple[str, ...] = tuple(p for p in entry.get('json_path', '').split('.') if p)
+        self.must_contain = entry.get('must_contain')
+        self.must_not_contain = entry.get('must_not_contain')
+        self.regex = None
+        if 'regex' in entry:
+            try:
+                self.regex = re.compile(entry['regex'])
+            except (re.error, TypeError) as e:
+                raise PlatformCatalogError(f"{where}.regex does not compile: {e}") from e
+
+        kinds = [kind for kind, present in (
+            ('json', self.json_key is not None),
+            ('regex', self.regex is not None),
+            ('marker', self.must_contain is not None or self.must_not_contain is not None),
+        ) if present]
+        if len(kinds) > 1:
+            raise PlatformCatalogError(f"{where}: combines {' and '.join(kinds)} checks; pick one")
+        self.check = kinds[0] if kinds else 'status'
+
+        self.method = entry.get('method', 'GET')
+        if self.method not in PROBE_METHODS:
+            raise PlatformCatalogError(f"{where}.method must be one of {', '.join(PROBE_METHODS)}")
+        if self.method == 'HEAD' and self.check != 'status':
+            raise PlatformCatalogError(f"{where}: HEAD only works for status-only checks, not {self.check}")
+
+    @staticmethod
+    def _fill(template: str, in_host: bool, username: str) -> str:
+        """Template with the username substituted; ValueError for a username it can't safely take"""
+        if not valid_username(username):
+            raise ValueError(f"username {username!r} is not allowed in a platform URL")
+        if in_host and not DNS_LABEL_RE.fullmatch(username):
+            raise ValueError(f"username {username!r} is not a valid host label")
+        return template.format(quote(username, safe=''))
+
+    def probe_url(self, username: str) -> str:
+        return self._fill(self.url, self.url_host_slot, username)
+
+    def profile_url_for(self, username: str) -> str:
+        return self._fill(self.profile_url, self.profile_host_slot, username)
+
+    def json_exists(self, data: Any) -> bool:
+        for part in self.json_path:
+            data = data.get(part, {}) if isinstance(data, dict) else {}
+        return isinstance(data, dict) and self.json_key in data
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'url': self.url,
+            'profile_url': self.profile_url,
+            'check': self.check,
+            'method': self.method,
+            'confidence': self.confidence,
+            'existence': self.existence,
+        }
+
+
+class CompiledPlatformCatalog:
+    """Immutable view of one catalog file; file order is report order"""
+
+    def __init__(self, raw: Dict[str, Any], source: str = ''):
+        self.source = source
+        self.version = raw.get('version')
+        if not isinstance(self.version, str) or not self.version.strip():
+            raise PlatformCatalogError("'version' must be a non-empty string")
+
+        defaults = raw.get('defaults') or {}
+        if not isinstance(defaults, dict):
+            raise PlatformCatalogError("'defaults' must be an object")
+
+        sites = raw.get('sites')
+        if not isinstance(sites, list) or not sites:
+            raise PlatformCatalogError("'sites' must be a non-empty list")
+        self.sites: Dict[str, SiteRule] = {}
+        for i, entry in enumerate(sites):
+            if not isinstance(entry, dict):
+                raise PlatformCatalogError(f"sites[{i}] must be an object")
+            site = SiteRule(entry, defaults, f"sites[{i}]")
+            if site.name in self.sites:
+                raise PlatformCatalogError(f"sites[{i}]: duplicate site '{site.name}'")
+            self.sites[site.name] = site
+
+    def site(self, name: str) -> Optional[SiteRule]:
+        return self.sites.get(name)
+
+    def select(self, names: Optional[Iterable[str]] = None) -> List[SiteRule]:
+        """Sites in catalog order, limited to `names` when given; unknown names are ignored"""
+        if names is None:
+            return list(self.sites.values())
+        wanted = set(names)
+        return [site for name, site in self.sites.items() if name in wanted]
+
+
+class PlatformCatalogStore(HotReloadJsonStore):
+    """
+    Holds the active catalog and swaps it when the file changes.
+    A file that fails validation is rejected and the previous catalog stays live.
+    """
+
+    def __init__(self, path: str = PLATFORM_CATALOG_PATH, check_interval: float = 5.0):
+        super().__init__(
+            path, CompiledPlatformCatalog, PlatformCatalogError, 'Platform catalog',
+            describe=lambda catalog: f"version {catalog.version}, {len(catalog.sites)} sites",
+            check_interval=check_interval
+        )
+
+
+PLATFORM_CATALOG = PlatformCatalogStore()
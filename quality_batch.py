@@ -0,0 +1,138 @@
+"""
+Fleet-wide data quality scoring
+Vectorized counterpart of RealWorldOSINTHandler.calculate_data_quality_score
+for batch jobs: per-platform rows from many scans go in as columns, per-scan
+scores and grades plus fleet percentiles come out of one numpy pass.
+Per-scan results equal the handler's exactly: the arithmetic runs in the
+same order, and final rounding uses Python's round() on each scalar.
+
+Usage:
+    from quality_batch import QualityBatch
+
+    batch = QualityBatch()
+    for target, events in jobs:
+        stream = handler.open_stream(target)
+        for platform, record in events:
+            stream.feed(platform, record)
+        stream.close()
+        batch.add_scan(stream.quality_rows)
+
+    report = batch.score()
+    report['scans'][0]              # same dict as process_results()['data_quality']
+    report['fleet']['percentiles']['overall_score']['p50']
+"""
+
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+import numpy as np
+
+FLEET_PERCENTILES = (10, 25, 50, 75, 90)
+PERCENTILE_FIELDS = ('overall_score', 'platform_coverage', 'data_completeness')
+
+
+def score_quality_columns(scan_ids: Any, found: Any, completeness: Any, stale: Any, verified: Any,
+                          num_scans: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Score many scans at once. One row per platform result:
+      scan_ids      scan index of the row (0..num_scans-1)
+      found         platform found
+      completeness  profile completeness percent, NaN when not scored
+      stale         freshness was STALE
+      verified      verification == 'api_verified'
+    """
+    scan_ids = np.asarray(scan_ids, dtype=np.intp)
+    found = np.asarray(found, dtype=bool)
+    completeness = np.asarray(completeness, dtype=np.float64)
+    stale = np.asarray(stale, dtype=bool)
+    verified = np.asarray(verified, dtype=bool)
+    if num_scans is None:
+        num_scans = int(scan_ids.max()) + 1 if scan_ids.size else 0
+
+    # bincount adds each bin's weights sequentially in row order, like the per-scan loop
+    total_platforms = np.bincount(scan_ids, minlength=num_scans).astype(np.float64)
+    found_platforms = np.bincount(scan_ids, weights=found, minlength=num_scans)
+    stale_count = np.bincount(scan_ids, weights=stale, minlength=num_scans)
+    verified_count = np.bincount(scan_ids, weights=verified, minlength=num_scans)
+    scored = found & ~np.isnan(completeness)
+    completeness_sum = np.bincount(scan_ids[scored], weights=completeness[scored], minlength=num_scans)
+    completeness_count = np.bincount(scan_ids[scored], minlength=num_scans).astype(np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg_completeness = np.where(completeness_count > 0, completeness_sum / completeness_count, 0.0)
+        coverage = found_platforms / total_platforms * 40
+        completeness_factor = avg_completeness / 100 * 30
+        freshness = np.where(stale_count > 0, 20 - stale_count / found_platforms * 15, 20.0)
+        verification = np.where(verified_count > 0, verified_count / found_platforms * 10, 10.0)
+        # NaN for scans with nothing found; those are reported as grade F below
+        total_score = coverage + completeness_factor + freshness + verification
+        grades = np.select([total_score >= 80, total_score >= 60, total_score >= 40], ['A', 'B', 'C'], 'D')
+
+    # Clamping and rounding per scalar, as the handler does (int defaults stay ints)
+    scans = []
+    for i in range(num_scans):
+        if found_platforms[i] == 0:
+            scans.append({
+                'overall_score': 0,
+                'platform_coverage': 0,
+                'data_completeness': 0,
+                'freshness_score': 0,
+                'verification_score': 0,
+                'grade': 'F'
+            })
+            continue
+        fresh = float(freshness[i]) if stale_count[i] > 0 else 20
+        verif = float(verification[i]) if verified_count[i] > 0 else 10
+        avg = float(avg_completeness[i]) if completeness_count[i] > 0 else 0
+        scans.append({
+            'overall_score': round(min(float(total_score[i]), 100), 1),
+            'platform_coverage': round(float(coverage[i]), 1),
+            'data_completeness': round(avg, 1),
+            'freshness_score': round(max(fresh, 0), 1),
+            'verification_score': round(verif, 1),
+            'grade': str(grades[i])
+        })
+
+    return {'scans': scans, 'fleet': _fleet_summary(scans)}
+
+
+def _fleet_summary(scans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    grades = {grade: 0 for grade in ('A', 'B', 'C', 'D', 'F')}
+    for scan in scans:
+        grades[scan['grade']] += 1
+
+    percentiles = {}
+    if scans:
+        for field in PERCENTILE_FIELDS:
+            values = np.percentile(np.array([scan[field] for scan in scans], dtype=np.float64), FLEET_PERCENTILES)
+            percentiles[field] = {f'p{p}': round(float(v), 1) for p, v in zip(FLEET_PERCENTILES, values)}
+
+    return {'scans': len(scans), 'grades': grades, 'percentiles': percentiles}
+
+
+class QualityBatch:
+    """Column builder for score_quality_columns; one add_scan per scan"""
+
+    def __init__(self):
+        self.num_scans = 0
+        self._scan_ids: List[int] = []
+        self._found: List[bool] = []
+        self._completeness: List[float] = []
+        self._stale: List[bool] = []
+        self._verified: List[bool] = []
+
+    def add_scan(self, rows: Iterable[Tuple[bool, Optional[float], bool, bool]]) -> int:
+        """Add a scan's (found, completeness, stale, verified) rows, e.g. ResultStream.quality_rows"""
+        scan_id = self.num_scans
+        for found, completeness, stale, verified in rows:
+            self._scan_ids.append(scan_id)
+            self._found.append(found)
+            self._completeness.append(np.nan if completeness is None else completeness)
+            self._stale.append(stale)
+            self._verified.append(verified)
+        self.num_scans += 1
+        return scan_id
+
+    def score(self) -> Dict[str, Any]:
+        return score_quality_columns(
+            self._scan_ids, self._found, self._completeness, self._stale, self._verified, self.num_scans
+        )
@@ -0,0 +1,179 @@
+"""
+Risk Rule Engine
+Loads the versioned risk rules file and compiles it into lookup tables
+
+Usage:
+    from risk_rules import RISK_RULES
+
+    rules = RISK_RULES.current()      # hot-reloads when the file changed
+    category, base_score = rules.classify('email', 'john@example.com')
+    level = rules.risk_level(7.2)     # -> 'HIGH'
+"""
+
+import os
+import re
+from typing import Dict, List, Any, Tuple
+
+from json_store import HotReloadJsonStore
+
+RISK_RULES_PATH = os.environ.get(
+    'RISK_RULES_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'risk_rules.json')
+)
+
+RISK_LEVEL_NAMES = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'MINIMAL')
+
+
+class RiskRulesError(ValueError):
+    """Raised when a rules file is missing fields or has invalid values"""
+
+
+def _check_score(value: Any, where: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RiskRulesError(f"{where}: score must be a number, got {value!r}")
+    if not 0.0 <= value <= 10.0:
+        raise RiskRulesError(f"{where}: score {value} outside 0-10")
+    return float(value)
+
+
+def _term_matcher(terms: List[str]) -> 're.Pattern':
+    """One alternation per term list; equivalent to any(term in text)"""
+    return re.compile('|'.join(re.escape(t) for t in terms))
+
+
+class CompiledRiskRules:
+    """
+    Immutable, pre-compiled view of one rules file.
+    Built once per load and shared by every assessment that uses it.
+    """
+
+    def __init__(self, raw: Dict[str, Any], source: str = ''):
+        self.source = source
+        self.version = raw.get('version')
+        if not isinstance(self.version, str) or not self.version.strip():
+            raise RiskRulesError("'version' must be a non-empty string")
+
+        default = raw.get('default_category') or {}
+        if not isinstance(default, dict):
+            raise RiskRulesError("'default_category' must be an object")
+        if not isinstance(default.get('category'), str):
+            raise RiskRulesError("default_category.category must be a string")
+        self.default_category = default['category']
+        self.default_base_score = _check_score(default.get('base_score'), 'default_category')
+
+        # Category chain: first matching entry wins, like the old if/elif chain
+        categories = raw.get('categories')
+        if not isinstance(categories, list) or not categories:
+            raise RiskRulesError("'categories' must be a non-empty list")
+        chain = []
+        for i, entry in enumerate(categories):
+            if not isinstance(entry, dict):
+                raise RiskRulesError(f"categories[{i}] must be an object")
+            terms = entry.get('terms')
+            if not isinstance(entry.get('category'), str):
+                raise RiskRulesError(f"categories[{i}].category must be a string")
+            if not isinstance(terms, list) or not terms or not all(isinstance(t, str) and t for t in terms):
+                raise RiskRulesError(f"categories[{i}].terms must be a non-empty list of strings")
+            chain.append((
+                _term_matcher([t.lower() for t in terms]),
+                entry['category'],
+                _check_score(entry.get('base_score'), f"categories[{i}]")
+            ))
+        self.category_chain: Tuple[Tuple['re.Pattern', str, float], ...] = tuple(chain)
+
+        # Sensitivity weights keep file order: the first key found wins
+        weights = raw.get('sensitivity_weights')
+        if not isinstance(weights, dict) or not weights:
+            raise RiskRulesError("'sensitivity_weights' must be a non-empty object")
+        self.weights: Tuple[Tuple[str, float], ...] = tuple(
+            (key.lower(), _check_score(value, f"sensitivity_weights.{key}"))
+            for key, value in weights.items()
+        )
+        self._any_weight = _term_matcher([key for key, _ in self.weights])
+
+        # Risk level thresholds, highest first; the last level is the floor
+        levels = raw.get('risk_levels')
+        if not isinstance(levels, list) or not levels:
+            raise RiskRulesError("'risk_levels' must be a non-empty list")
+        thresholds = []
+        previous = None
+        for i, entry in enumerate(levels):
+            if not isinstance(entry, dict):
+                raise RiskRulesError(f"risk_levels[{i}] must be an object")
+            level = entry.get('level')
+            if level not in RISK_LEVEL_NAMES:
+                raise RiskRulesError(f"risk_levels[{i}].level must be one of {', '.join(RISK_LEVEL_NAMES)}")
+            min_score = _check_score(entry.get('min_score'), f"risk_levels[{i}]")
+            if previous is not None and min_score >= previous:
+                raise RiskRulesError("risk_levels must be ordered by strictly decreasing min_score")
+            previous = min_score
+            thresholds.append((min_score, level))
+        self.thresholds: Tuple[Tuple[float, str], ...] = tuple(thresholds)
+        self.floor_level = thresholds[-1][1]
+
+        exploitability = raw.get('exploitability') or {}
+        if not isinstance(exploitability, dict):
+            raise RiskRulesError("'exploitability' must be an object")
+        missing = [level for _, level in thresholds if not isinstance(exploitability.get(level), str)]
+        if missing:
+            raise RiskRulesError(f"exploitability text missing for: {', '.join(missing)}")
+        self.exploitability: Dict[str, str] = {level: exploitability[level] for _, level in thresholds}
+
+        # Action matrix flattened to (category, level) -> text
+        actions = raw.get('actions') or {}
+        if not isinstance(actions, dict):
+            raise RiskRulesError("'actions' must be an object")
+        self.actions: Dict[Tuple[str, str], str] = {}
+        for category, by_level in actions.items():
+            by_level = by_level or {}
+            if not isinstance(by_level, dict):
+                raise RiskRulesError(f"actions.{category} must be an object")
+            for level, text in by_level.items():
+                if level not in RISK_LEVEL_NAMES or not isinstance(text, str):
+                    raise RiskRulesError(f"actions.{category}.{level} is invalid")
+                self.actions[(category, level)] = text
+        self.default_action = raw.get('default_action') or 'Review and assess security implications'
+
+    def classify(self, data_type: str, value: str) -> Tuple[str, float]:
+        """Return (category, base_score) for a field name and its value"""
+        data_lower = data_type.lower()
+        value_lower = str(value).lower()
+
+        category = self.default_category
+        base_score = self.default_base_score
+        for matcher, chain_category, chain_score in self.category_chain:
+            if matcher.search(data_lower):
+                category = chain_category
+                base_score = chain_score
+                break
+
+        # Cheap rejection first; most fields match no weight key at all
+        if self._any_weight.search(data_lower) or self._any_weight.search(value_lower):
+            for key, weight in self.weights:
+                if key in data_lower or key in value_lower:
+                    base_score = max(base_score, weight)
+                    break
+
+        return category, base_score
+
+    def risk_level(self, score: float) -> str:
+        for min_score, level in self.thresholds:
+            if score >= min_score:
+                return level
+        return self.floor_level
+
+    def action(self, category: str, level: str) -> str:
+        return self.actions.get((category, level), self.default_action)
+
+
+class RiskRuleStore(HotReloadJsonStore):
+    """
+    Holds the active rule set and swaps it when the file changes.
+    A file that fails validation is rejected and the previous rules stay live.
+    """
+
+    def __init__(self, path: str = RISK_RULES_PATH, check_interval: float = 5.0):
+        super().__init__(path, CompiledRiskRules, RiskRulesError, 'Risk rules', check_interval=check_interval)
+
+
+RISK_RULES = RiskRuleStore()
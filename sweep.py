@@ -0,0 +1,406 @@
+"""
+Username Permutation Sweep
+Generates ranked handle candidates from a known name and probes them across
+catalog sites in the background. Candidates come from a lazy generator, so a
+sweep over thousands of variants only holds the handles currently in flight.
+All sweeps share one worker pool (global concurrency) and one rate gate per
+site that spaces requests and backs off on 429 / Retry-After.
+
+Usage:
+    from sweep import SWEEP_JOBS, SweepJob, handle_permutations, start_sweep
+
+    list(itertools.islice(handle_permutations('John Smith'), 5))
+    # ['johnsmith', 'john.smith', 'john_smith', 'john-smith', 'smithjohn']
+
+    job = SWEEP_JOBS.add(SweepJob('John Smith', ['github', 'gitlab']))
+    start_sweep(job, sites, probe)          # probe(site, handle, timeout) -> (status, entry, headers)
+    SWEEP_JOBS.get(job.job_id).to_dict()    # progress, matches, throttled sites
+"""
+
+import itertools
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple
+
+SWEEP_CONCURRENCY = int(os.environ.get('SWEEP_CONCURRENCY', '8'))
+SWEEP_BUDGET = float(os.environ.get('SWEEP_BUDGET_SECONDS', '300'))
+SWEEP_SITE_INTERVAL = float(os.environ.get('SWEEP_SITE_INTERVAL_SECONDS', '0.5'))
+SWEEP_MAX_CANDIDATES = 5000
+SWEEP_DEFAULT_CANDIDATES = 200
+SWEEP_JOB_RETENTION = 100
+# New sweeps are refused while this many are queued or running
+SWEEP_MAX_ACTIVE = int(os.environ.get('SWEEP_MAX_ACTIVE', '4'))
+
+# Back off this long on a 429 without Retry-After; give up on a site past the cap
+RATE_LIMIT_BACKOFF = 30.0
+RATE_LIMIT_MAX_WAIT = 120.0
+RATE_LIMIT_STATUSES = (429,)
+
+# Shared by every sweep: its size is the global probe concurrency
+SWEEP_POOL = ThreadPoolExecutor(max_workers=SWEEP_CONCURRENCY, thread_name_prefix='osint-sweep')
+
+CONFIDENCE_RANK = {'LOW': 1, 'MEDIUM': 2, 'HIGH': 3}
+
+
+# ==================== CANDIDATES ====================
+
+SEPARATORS = ('', '.', '_', '-')
+DIGIT_SUFFIXES = ('1', '2', '3', '01', '7', '11', '12', '13', '21', '22', '69', '99', '123', '007')
+LEET = {'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5', 't': '7'}
+_HANDLE_RE = re.compile(r'[a-z0-9](?:[a-z0-9._-]*[a-z0-9])?')
+
+
+def _tokens(seed: str) -> List[str]:
+    seed = seed.strip().lower()
+    if '@' in seed:
+        seed = seed.split('@', 1)[0]
+    return re.findall(r'[a-z0-9]+', seed)
+
+
+def _name_forms(tokens: List[str]) -> List[str]:
+    """Whole-name forms, most likely first: natural order, then reversed"""
+    if len(tokens) == 1:
+        return tokens[:]
+    first, last = tokens[0], tokens[-1]
+    orders = [tokens]
+    if len(tokens) > 2:
+        orders.append([first, last])
+    orders.append([last, first])
+    return [sep.join(order) for order in orders for sep in SEPARATORS]
+
+
+def _initial_forms(tokens: List[str]) -> List[str]:
+    if len(tokens) == 1:
+        return []
+    first, last = tokens[0], tokens[-1]
+    forms = [first[0] + sep + last for sep in SEPARATORS]
+    forms += [first + sep + last[0] for sep in SEPARATORS]
+    forms += [last + first[0], last + '.' + first[0], ''.join(token[0] for token in tokens)]
+    return forms
+
+
+def _leet_forms(base: str) -> Iterator[str]:
+    """Leetspeak variants, fewest substitutions first"""
+    positions = [i for i, ch in enumerate(base) if ch in LEET]
+    for count in range(1, len(positions) + 1):
+        for chosen in itertools.combinations(positions, count):
+            chars = list(base)
+            for i in chosen:
+                chars[i] = LEET[chars[i]]
+            yield ''.join(chars)
+
+
+def handle_permutations(seed: str, max_length: int = 30) -> Iterator[str]:
+    """
+    Ranked, de-duplicated handle candidates for a name or handle seed.
+    Tiers: whole-name forms, initials, digit suffixes, leetspeak.
+    Lazy: later tiers are only built as far as the caller iterates.
+    """
+    tokens = _tokens(seed)
+    if not tokens:
+        return
+    names = _name_forms(tokens)
+    initials = _initial_forms(tokens)
+    # Digits and leetspeak hang off the separator-free forms only
+    cores = [form for form in names + initials if form.isalnum()]
+
+    def tiers() -> Iterator[str]:
+        yield from names
+        yield from initials
+        for suffix in DIGIT_SUFFIXES:
+            for core in cores:
+                yield core + suffix
+        for year in range(2005, 1969, -1):
+            for core in cores:
+                yield core + str(year)
+                yield core + str(year)[2:]
+        for core in cores:
+            yield from _leet_forms(core)
+
+    seen = set()
+    for handle in tiers():
+        if handle in seen or len(handle) > max_length or not _HANDLE_RE.fullmatch(handle):
+            continue
+        seen.add(handle)
+        yield handle
+
+
+# ==================== RATE GATES ====================
+
+class SiteGate:
+    """Per-site request spacing plus 429 backoff, shared by all sweeps"""
+
+    def __init__(self, interval: float = SWEEP_SITE_INTERVAL):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self.rate_limited = 0
+
+    def reserve(self, limit: Optional[float] = None) -> Optional[float]:
+        """
+        Claim the next request slot; returns how long to wait for it.
+        With `limit`, a slot further out than that is left unclaimed and None is returned.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            if limit is not None and slot - now > limit:
+                return None
+            self._next_slot = slot + self.interval
+            return slot - now
+
+    def backoff(self, seconds: float) -> None:
+        with self._lock:
+            self.rate_limited += 1
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+_GATES: Dict[str, SiteGate] = {}
+_GATES_LOCK = threading.Lock()
+
+
+def gate_for(site_name: str) -> SiteGate:
+    with _GATES_LOCK:
+        gate = _GATES.get(site_name)
+        if gate is None:
+            gate = _GATES[site_name] = SiteGate()
+        return gate
+
+
+def retry_after_seconds(headers: Dict[str, str]) -> float:
+    """Retry-After in seconds (delta form only); RATE_LIMIT_BACKOFF when absent or unparseable"""
+    try:
+        return max(0.0, float((headers or {}).get('Retry-After')))
+    except (TypeError, ValueError):
+        return RATE_LIMIT_BACKOFF
+
+
+# ==================== JOBS ====================
+
+class SweepJob:
+    """Progress and matches of one sweep; updated by worker threads under a lock"""
+
+    def __init__(self, seed: str, platforms: List[str], max_candidates: int = SWEEP_DEFAULT_CANDIDATES,
+                 stop_on: Optional[str] = 'HIGH', budget: float = SWEEP_BUDGET):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.seed = seed
+        self.platforms = list(platforms)
+        self.max_candidates = max(1, min(int(max_candidates), SWEEP_MAX_CANDIDATES))
+        self.stop_on = stop_on
+        self.budget = budget
+        self.status = 'queued'
+        self.created_at = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.candidates_tried = 0
+        self.probes_done = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.matches: List[Dict[str, Any]] = []
+        self.throttled_sites: List[str] = []
+        self.stop_reason: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stop.is_set()
+
+    def stop(self, reason: str) -> None:
+        with self._lock:
+            if self.stop_reason is None:
+                self.stop_reason = reason
+        self._stop.set()
+
+    def record(self, rank: int, handle: str, platform: str, status: Optional[int], entry: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.probes_done += 1
+            if status is None:
+                self.errors += 1
+            if entry and entry.get('exists'):
+                self.matches.append({
+                    'handle': handle,
+                    'rank': rank,
+                    'platform': platform,
+                    'profile_url': entry.get('profile_url'),
+                    'confidence': entry.get('confidence', 'LOW')
+                })
+                confident = self.stop_on and \
+                    CONFIDENCE_RANK.get(entry.get('confidence'), 0) >= CONFIDENCE_RANK.get(self.stop_on, 99)
+            else:
+                confident = False
+        if confident:
+            self.stop(f"{entry.get('confidence')} confidence match: {handle} on {platform}")
+
+    def rate_limit_hit(self) -> None:
+        with self._lock:
+            self.rate_limited += 1
+
+    def throttle(self, platform: str) -> None:
+        """Give up on a site whose rate limit outlasts the sweep"""
+        with self._lock:
+            if platform not in self.throttled_sites:
+                self.throttled_sites.append(platform)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            end = self.finished or time.time()
+            ranked = sorted(self.matches, key=lambda m: (-CONFIDENCE_RANK.get(m['confidence'], 0), m['rank']))
+            return {
+                'job_id': self.job_id,
+                'status': self.status,
+                'seed': self.seed,
+                'platforms': self.platforms,
+                'max_candidates': self.max_candidates,
+                'stop_on': self.stop_on,
+                'candidates_tried': self.candidates_tried,
+                'probes_done': self.probes_done,
+                'probes_max': self.max_candidates * len(self.platforms),
+                'rate_limited': self.rate_limited,
+                'throttled_sites': list(self.throttled_sites),
+                'errors': self.errors,
+                'matches': ranked,
+                'best_match': ranked[0] if ranked else None,
+                'stop_reason': self.stop_reason,
+                'elapsed_seconds': round(end - self.started, 2) if self.started else 0.0
+            }
+
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+class SweepRegistry:
+    """
+    In-memory job table; keeps the most recent SWEEP_JOB_RETENTION jobs.
+    Only finished jobs are evicted, so a running job stays reachable.
+    """
+
+    def __init__(self, retention: int = SWEEP_JOB_RETENTION):
+        self.retention = retention
+        self._jobs: 'OrderedDict[str, SweepJob]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, job: SweepJob) -> SweepJob:
+        with self._lock:
+            self._add(job)
+        return job
+
+    def admit(self, job: SweepJob, max_active: int) -> Optional[SweepJob]:
+        """Register the job unless max_active jobs are already queued or running; None when refused"""
+        with self._lock:
+            if self._active() >= max_active:
+                return None
+            self._add(job)
+        return job
+
+    def _add(self, job: SweepJob) -> None:
+        self._jobs[job.job_id] = job
+        if len(self._jobs) > self.retention:
+            finished = [job_id for job_id, held in self._jobs.items() if held.status not in ACTIVE_STATUSES]
+            for job_id in finished[:len(self._jobs) - self.retention]:
+                del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[SweepJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active(self) -> int:
+        with self._lock:
+            return self._active()
+
+    def _active(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status in ACTIVE_STATUSES)
+
+
+SWEEP_JOBS = SweepRegistry()
+
+
+# ==================== RUNNER ====================
+
+# probe(site, handle, timeout) -> (status or None on error, presence entry or None, response headers)
+Probe = Callable[[Any, str, float], Tuple[Optional[int], Optional[Dict[str, Any]], Dict[str, str]]]
+
+
+def _probe_once(job: SweepJob, site: Any, handle: str, rank: int, probe: Probe, deadline: float) -> None:
+    gate = gate_for(site.name)
+    while not job.stopping:
+        if site.name in job.throttled_sites:
+            return
+        wait = gate.reserve()
+        if wait > RATE_LIMIT_MAX_WAIT or time.monotonic() + wait >= deadline:
+            job.throttle(site.name)
+            return
+        if wait:
+            time.sleep(wait)
+        if job.stopping:
+            return
+        status, entry, headers = probe(site, handle, max(0.05, min(site.timeout, deadline - time.monotonic())))
+        if status in RATE_LIMIT_STATUSES:
+            gate.backoff(retry_after_seconds(headers))
+            job.rate_limit_hit()
+            continue
+        job.record(rank, handle, site.name, status, entry)
+        return
+
+
+def run_sweep(job: SweepJob, sites: List[Any], probe: Probe) -> SweepJob:
+    """
+    Probe candidates against sites until the candidate cap, the budget, an
+    early-cutoff match or a cancel. Only a bounded window of probes is in
+    flight per job, so the candidate generator is never drained ahead.
+    """
+    job.status = 'running'
+    job.started = time.time()
+    deadline = time.monotonic() + job.budget
+    window = threading.BoundedSemaphore(SWEEP_CONCURRENCY * 2)
+    inflight = []
+
+    def release(_future):
+        window.release()
+
+    try:
+        for rank, handle in enumerate(itertools.islice(handle_permutations(job.seed), job.max_candidates)):
+            if job.stopping:
+                break
+            if time.monotonic() >= deadline:
+                job.stop('budget exhausted')
+                break
+            live_sites = [site for site in sites if site.name not in job.throttled_sites]
+            if not live_sites:
+                job.stop('all sites rate limited')
+                break
+            job.candidates_tried += 1
+            for site in live_sites:
+                window.acquire()
+                future = SWEEP_POOL.submit(_probe_once, job, site, handle, rank, probe, deadline)
+                future.add_done_callback(release)
+                inflight.append(future)
+            inflight = [future for future in inflight if not future.done()]
+
+        for future in inflight:
+            future.result()
+        if job.stop_reason == 'cancelled':
+            job.status = 'cancelled'
+        else:
+            job.status = 'stopped' if job.stop_reason else 'done'
+    except Exception as e:
+        print(f"❌ Sweep {job.job_id} failed: {e}")
+        job.stop_reason = job.stop_reason or str(e)
+        job.status = 'failed'
+    finally:
+        job.finished = time.time()
+    print(f"✅ Sweep {job.job_id} {job.status}: {job.candidates_tried} candidates, {len(job.matches)} matches")
+    return job
+
+
+def start_sweep(job: SweepJob, sites: List[Any], probe: Probe) -> threading.Thread:
+    """Run a sweep on a background thread; progress is read through the job"""
+    thread = threading.Thread(target=run_sweep, args=(job, sites, probe),
+                              name=f'sweep-{job.job_id}', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,51 @@
+"""Catalog URL templates: which usernames get substituted and where a request can go"""
+
+import pytest
+
+from platform_catalog import SiteRule, PlatformCatalogError, valid_username
+
+
+def rule(url, **extra):
+    return SiteRule(dict({'name': 'site', 'url': url}, **extra), {}, 'sites[0]')
+
+
+@pytest.mark.parametrize('username', ['torvalds', 'a', 'j.doe', 'j_doe-99', 'x' * 64])
+def test_valid_usernames(username):
+    assert valid_username(username)
+
+
+@pytest.mark.parametrize('username', [
+    '', 'x' * 65, 'a/b', '../admin', 'a?b=1', 'a#b', 'a@evil.com', 'a b', 'a%2fb', 'évé', None, 42,
+])
+def test_invalid_usernames_are_never_substituted(username):
+    assert not valid_username(username)
+    with pytest.raises(ValueError):
+        rule('https://example.com/users/{}').probe_url(username)
+
+
+def test_path_slot_is_filled():
+    site = rule('https://example.com/api/users/{}', profile_url='https://example.com/{}')
+    assert site.probe_url('j.doe') == 'https://example.com/api/users/j.doe'
+    assert site.profile_url_for('j.doe') == 'https://example.com/j.doe'
+
+
+def test_host_slot_takes_one_dns_label():
+    site = rule('https://{}.tumblr.com/')
+    assert site.probe_url('alice-99') == 'https://alice-99.tumblr.com/'
+    for username in ('evil.com', 'a.b', '-alice', 'alice_', 'x' * 64):
+        with pytest.raises(ValueError):
+            site.probe_url(username)
+
+
+@pytest.mark.parametrize('url', [
+    'https://{}/',
+    'https://{}.com/',
+    'https://www.{}.com/',
+    'https://x{}.example.com/',
+    'https://{}@example.com/',
+    'ftp://{}.example.com/',
+    'example.com/{}',
+])
+def test_unsafe_templates_are_rejected(url):
+    with pytest.raises(PlatformCatalogError):
+        rule(url)
@@ -0,0 +1,90 @@
+"""Streaming robustness pipeline and batch quality scoring vs the per-record handler methods"""
+
+import copy
+import time
+
+import pytest
+
+from challenge7_backend import RealWorldOSINTHandler
+from quality_batch import QualityBatch
+
+NOW = time.time()
+
+
+def iso(days_ago: float) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(NOW - days_ago * 86400))
+
+
+def sample_results():
+    return {
+        'github': {
+            'found': True,
+            'verification': 'api_verified',
+            'profile': {'username': 'alice', 'name': 'Alice', 'bio': '', 'location': 'Not public',
+                        'email': None, 'created_at': iso(2000), 'updated_at': iso(400)},
+            'repositories': [{'name': 'a', 'updated': iso(10)}, {'name': 'b', 'updated': iso(700)}],
+        },
+        'gitlab': {'found': True, 'profile': {'username': 'alice', 'name': 'A', 'created_at': iso(900)}},
+        'reddit': {'found': True, 'profile': {'username': 'alice2', 'followers': 0, 'bio': 'No bio provided',
+                                              'created': iso(300)}},
+        'twitter': {'found': False},
+        'instagram': {'found': False, 'freshness': 'STALE'},
+    }
+
+
+def legacy_quality(handler, results):
+    """What the pipeline did before streaming: fill defaults and freshness in place, then score"""
+    results = copy.deepcopy(results)
+    for platform, data in results.items():
+        if data.get('found'):
+            if data.get('profile'):
+                handler.handle_incomplete_data(data['profile'])
+            handler.detect_outdated_data(data, platform)
+    return handler.calculate_data_quality_score(results)
+
+
+@pytest.fixture
+def handler():
+    return RealWorldOSINTHandler()
+
+
+def test_process_results_matches_legacy_quality(handler):
+    results = sample_results()
+    original = copy.deepcopy(results)
+    processed = handler.process_results(results, 'alice')
+    assert results == original
+    assert processed['data_quality'] == legacy_quality(handler, results)
+    assert processed['processed_results']['gitlab']['freshness'] == 'STALE'
+    assert processed['processed_results']['github']['freshness'] == 'FRESH'
+
+
+def test_stream_fed_in_pages_matches_process_results(handler):
+    results = sample_results()
+    expected = handler.process_results(results, 'alice')
+
+    github = results['github']
+    first_page = dict(github, repositories=github['repositories'][1:])
+    events = [('github', first_page)] + [(p, d) for p, d in results.items() if p != 'github']
+    events.append(('github', {'repositories': github['repositories'][:1]}))
+    streamed = handler.process_events(events, 'alice')
+
+    assert streamed['data_quality'] == expected['data_quality']
+    assert streamed['duplicates_removed'] == expected['duplicates_removed']
+    assert sorted(streamed['behavioral_patterns']) == sorted(expected['behavioral_patterns'])
+
+
+def test_quality_batch_matches_handler(handler):
+    scans = [sample_results(), {'github': {'found': False}}, {}]
+    batch = QualityBatch()
+    expected = []
+    for results in scans:
+        stream = handler.open_stream('alice')
+        for platform, record in results.items():
+            stream.feed(platform, record)
+        expected.append(stream.close()['data_quality'])
+        batch.add_scan(stream.quality_rows)
+
+    report = batch.score()
+    assert report['scans'] == expected
+    assert report['scans'][0] == legacy_quality(handler, scans[0])
+    assert report['scans'][2] == handler.calculate_data_quality_score({})
@@ -0,0 +1,81 @@
+"""Fast-path timestamp parser vs the datetime-based parsing it replaced"""
+
+import calendar
+from datetime import datetime
+
+import pytest
+
+from timestamps import parse_timestamp, latest_in_list, days_since
+
+
+def datetime_parse(value: str):
+    """What the old scorer did: strptime on the date or the trimmed datetime, read as UTC"""
+    text = value.split('.')[0].replace('Z', '')
+    for fmt in ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%d'):
+        try:
+            return float(calendar.timegm(datetime.strptime(text, fmt).timetuple()))
+        except ValueError:
+            continue
+    return None
+
+
+VALID = [
+    '2024-02-29',
+    '2023-12-31',
+    '2011-01-25T18:44:36Z',
+    '2024-03-05T12:34:56.789Z',
+    '2000-01-01T00:00:00',
+    '1999-06-30T23:59:59Z',
+]
+
+INVALID = [
+    '2024-02-30',
+    '2024-02-31',
+    '2023-02-29',
+    '2100-02-29',
+    '2024-04-31',
+    '2024-06-31T10:00:00Z',
+    '2024-13-01',
+    '2024-00-10',
+    '2024-01-00',
+    '0000-01-01',
+    '2024-01-01T24:00:00Z',
+    '2024-01-01T12:60:00Z',
+    'not a date',
+    '',
+]
+
+
+@pytest.mark.parametrize('value', VALID)
+def test_valid_dates_match_datetime(value):
+    assert parse_timestamp(value) == datetime_parse(value)
+
+
+@pytest.mark.parametrize('value', INVALID)
+def test_invalid_dates_rejected_like_datetime(value):
+    assert datetime_parse(value) is None
+    assert parse_timestamp(value) is None
+
+
+def test_offsets_are_applied():
+    assert parse_timestamp('2024-03-05T12:00:00+02:00') == parse_timestamp('2024-03-05T10:00:00Z')
+    assert parse_timestamp('2024-03-05T12:00:00-0130') == parse_timestamp('2024-03-05T13:30:00Z')
+
+
+def test_epoch_values():
+    assert parse_timestamp(1700000000) == 1700000000.0
+    assert parse_timestamp('1700000000') == 1700000000.0
+    assert parse_timestamp(0) is None
+    assert parse_timestamp(True) is None
+
+
+def test_latest_in_list_skips_impossible_newest():
+    items = [{'updated': '2024-02-31T00:00:00Z'}, {'updated': '2024-02-01T00:00:00Z'}]
+    assert latest_in_list(items, ('updated',)) == datetime_parse('2024-02-01T00:00:00Z')
+
+
+def test_days_since_clamps_skew_and_drops_future():
+    now = 1700000000.0
+    assert days_since(now - 3 * 86400, now) == 3
+    assert days_since(now + 3600, now) == 0
+    assert days_since(now + 30 * 86400, now) is None
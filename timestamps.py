@@ -0,0 +1,209 @@
+"""
+Timestamp normalization for collector records
+Parses the dates in a platform record once into epoch seconds with a
+precompiled ISO-8601/epoch parser (no exceptions on the hot path). Activity
+lists (repositories, projects, commits) collapse to their latest stamp in
+one pass: same-layout UTC strings sort chronologically, so hundreds of
+repos cost string comparisons and a single parse. The map
+is pure derived data: callers cache it alongside the record (see
+challenge7_backend.AnnotatedResults) so the risk scorer and the freshness
+detector share one parse without the raw record being modified.
+
+Usage:
+    from timestamps import normalize_timestamps, days_since
+
+    stamps = normalize_timestamps(results['github'])
+    # {'profile.created_at': 1295981076.0, 'repositories.latest': ..., 'breaches[0].breach_date': ...}
+    days_since(stamps['profile.updated_at'])
+"""
+
+import calendar
+import re
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+SECONDS_PER_DAY = 86400
+
+# Date fields per record section; lists are walked item by item
+TOP_LEVEL_FIELDS = ('created_at', 'updated_at', 'last_activity', 'breach_date')
+PROFILE_FIELDS = ('created_at', 'updated_at', 'created', 'last_activity')
+# Lists stored item by item, e.g. 'breaches[3].breach_date'
+LIST_FIELDS = {
+    'breaches': ('breach_date', 'BreachDate'),
+}
+# Activity lists stored as their newest stamp only, e.g. 'repositories.latest'
+ACTIVITY_LIST_FIELDS = {
+    'repositories': ('updated',),
+    'projects': ('last_activity',),
+    'recent_commits': ('date',),
+}
+
+# Fields that say the account was active, as opposed to when it was created
+ACTIVITY_FIELDS = ('profile.updated_at', 'profile.last_activity', 'updated_at', 'last_activity')
+
+_ISO_RE = re.compile(
+    r'^\s*(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,]\d+)?)?)?'
+    r'\s*(Z|[+-]\d{2}:?\d{2})?\s*$'
+)
+_EPOCH_RE = re.compile(r'^\s*\d{9,11}(?:\.\d+)?\s*$')
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """
+    Parse ISO-8601 dates/datetimes and epoch seconds into epoch seconds.
+    Naive datetimes are read as UTC. Returns None for anything unparseable.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if value > 0 else None
+    if not isinstance(value, str):
+        return None
+
+    match = _ISO_RE.match(value)
+    if match is None:
+        if _EPOCH_RE.match(value):
+            return float(value)
+        return None
+
+    year, month, day, hour, minute, second, offset = match.groups()
+    year_i, month_i, day_i = int(year), int(month), int(day)
+    hour_i, minute_i, second_i = int(hour or 0), int(minute or 0), int(second or 0)
+    if not (year_i >= 1 and 1 <= month_i <= 12 and hour_i < 24 and minute_i < 60 and second_i < 61):
+        return None
+    # Impossible dates ('2024-02-31') are rejected, as strptime did, not rolled over
+    if not 1 <= day_i <= calendar.monthrange(year_i, month_i)[1]:
+        return None
+
+    epoch = calendar.timegm((year_i, month_i, day_i, hour_i, minute_i, second_i, 0, 0, 0))
+    if offset and offset != 'Z':
+        sign = -1 if offset[0] == '-' else 1
+        digits = offset[1:].replace(':', '')
+        epoch -= sign * (int(digits[:2]) * 3600 + int(digits[2:]) * 60)
+    return float(epoch)
+
+
+def normalize_timestamps(record: Dict[str, Any]) -> Dict[str, float]:
+    """Parse all known date fields of a platform record; the record is not modified"""
+    stamps: Dict[str, float] = {}
+
+    for field in TOP_LEVEL_FIELDS:
+        if field in record:
+            parsed = parse_timestamp(record[field])
+            if parsed is not None:
+                stamps[field] = parsed
+
+    profile = record.get('profile')
+    if isinstance(profile, dict):
+        for field in PROFILE_FIELDS:
+            if field in profile:
+                parsed = parse_timestamp(profile[field])
+                if parsed is not None:
+                    stamps[f'profile.{field}'] = parsed
+
+    for list_name, fields in ACTIVITY_LIST_FIELDS.items():
+        items = record.get(list_name)
+        if isinstance(items, list):
+            latest = latest_in_list(items, fields)
+            if latest is not None:
+                stamps[f'{list_name}.latest'] = latest
+
+    for list_name, fields in LIST_FIELDS.items():
+        items = record.get(list_name)
+        if not isinstance(items, list):
+            continue
+        for i, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            for field in fields:
+                if field in item:
+                    parsed = parse_timestamp(item[field])
+                    if parsed is not None:
+                        stamps[f'{list_name}[{i}].{field}'] = parsed
+                        break
+
+    return stamps
+
+
+def _sortable_layout(value: str) -> Optional[Tuple[int, str]]:
+    """
+    Layout key for UTC ISO strings ('2024-03-05', '2024-03-05T12:34:56Z',
+    '...56.789Z'). Strings sharing a key compare chronologically as text.
+    """
+    n = len(value)
+    if n >= 10 and value[4] == '-' and value[7] == '-' and (n == 10 or value[-1] == 'Z'):
+        return n, value[10:11]
+    return None
+
+
+def latest_in_list(items: List[Any], fields: Tuple[str, ...]) -> Optional[float]:
+    """Newest parseable stamp across list items, taking each item's first present field"""
+    latest = None
+    candidates: Dict[Tuple[int, str], List[str]] = {}
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        for field in fields:
+            value = item.get(field)
+            if value is None:
+                continue
+            layout = _sortable_layout(value) if isinstance(value, str) else None
+            if layout is not None:
+                candidates.setdefault(layout, []).append(value)
+            else:
+                parsed = parse_timestamp(value)
+                if parsed is not None and (latest is None or parsed > latest):
+                    latest = parsed
+            break
+
+    # Only the newest string of each layout needs parsing; skip past any garbage
+    for values in candidates.values():
+        for value in sorted(values, reverse=True):
+            parsed = parse_timestamp(value)
+            if parsed is not None:
+                if latest is None or parsed > latest:
+                    latest = parsed
+                break
+
+    return latest
+
+
+def days_since(epoch: float, now: Optional[float] = None) -> Optional[int]:
+    """
+    Whole days elapsed since an epoch timestamp. Stamps up to a day ahead
+    (clock skew, timezone-less dates) count as today; anything further in
+    the future is bogus and comes back as None, i.e. unknown recency.
+    """
+    elapsed = (now if now is not None else time.time()) - epoch
+    if elapsed < -SECONDS_PER_DAY:
+        return None
+    return max(0, int(elapsed // SECONDS_PER_DAY))
+
+
+def activity_bounds(stamps: Dict[str, float]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    (latest activity, latest creation-type stamp) in a normalize_timestamps map.
+    Kept apart so partial records of one account can be merged.
+    """
+    latest = None
+    fallback = None
+    for key, epoch in stamps.items():
+        if key in ACTIVITY_FIELDS or key.split('.', 1)[0] in ACTIVITY_LIST_FIELDS:
+            if latest is None or epoch > latest:
+                latest = epoch
+        elif '[' not in key:
+            if fallback is None or epoch > fallback:
+                fallback = epoch
+    return latest, fallback
+
+
+def latest_activity(stamps: Dict[str, float]) -> Optional[float]:
+    """
+    Most recent activity timestamp in a normalize_timestamps map: last update,
+    repo/project activity or commit. Falls back to account creation when
+    that's all we have. Per-item list stamps (breaches) never count.
+    """
+    latest, fallback = activity_bounds(stamps)
+    return latest if latest is not None else fallback